@@ -28,7 +28,8 @@ setup(
     version=__version__,
     app=APP,
     data_files=DATA_FILES,
-    packages=find_packages(include=['umldiagrammer.*']),
+    package_dir={'': 'src'},
+    packages=find_packages(where='src'),
     include_package_data=True,
     zip_safe=False,
 
@@ -0,0 +1,242 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from concurrent.futures import ThreadPoolExecutor
+
+from json import dump as jsonDump
+
+from pathlib import Path
+
+from queue import Full
+from queue import Queue
+
+from threading import BoundedSemaphore
+from threading import Thread
+
+from time import perf_counter
+
+CHECKPOINT_MANIFEST_NAME:   str = 'checkpoints.json'
+CHECKPOINT_DIRECTORY_SUFFIX: str = '.checkpoints'
+
+#
+# When each image is taken relative to its step;  See the class documentation
+#
+CAPTURE_TIMING: str = 'afterInput'
+
+DEFAULT_QUEUE_SIZE:     int = 16
+DEFAULT_ENCODERS:       int = 2
+DEFAULT_PENDING_IMAGES: int = 4
+DEFAULT_HASH_DISTANCE:  int = 4
+DEFAULT_RECENT_HASHES:  int = 256
+
+HASH_WIDTH:  int = 9
+HASH_HEIGHT: int = 8
+
+#
+# Returns a Pillow image of the whole display
+#
+Capture = Callable[[], Any]
+#
+# command index, request time
+#
+CheckpointRequest = Tuple[int, float]
+
+
+class CheckpointRecorder:
+    """
+    Saves a screenshot at each step boundary so a failed replay can be compared with what
+    the screen looked like when the step was recorded.
+
+    `checkpoint` is called from the input listener threads and only queues the request;  When
+    the bounded queue is full the request is dropped rather than delaying the listener.  A capture
+    thread grabs the screen and computes a difference hash (dHash);  Frames within the hash distance
+    of one already saved link to that image instead of being stored again.  PNG encoding runs on a
+    small thread pool with a bounded number of images in flight, so memory stays bounded however
+    fast the steps arrive.
+
+    Capture happens after the input event, not before it:  The listener sees a click once the
+    system has delivered it, and the capture thread grabs the screen some time later.  A checkpoint
+    therefore shows the screen as the click left it, or partway through the application's response
+    to it.  The manifest says so in its `captureTiming` field and records when each request was
+    made and how long after it the capture started (`captureDelay`).
+
+    The manifest maps each command index in the transcript to its image.  PyAutoGUI and Pillow
+    are needed only for the default capture;  Without them construction raises ImportError
+    """
+    def __init__(self, directory: str,
+                 capture:       Capture = None,
+                 queueSize:     int = DEFAULT_QUEUE_SIZE,
+                 encoders:      int = DEFAULT_ENCODERS,
+                 pendingImages: int = DEFAULT_PENDING_IMAGES,
+                 hashDistance:  int = DEFAULT_HASH_DISTANCE,
+                 recentHashes:  int = DEFAULT_RECENT_HASHES):
+        """
+        Args:
+            directory:      Where the images and the manifest go
+            capture:        Grabs the display;  Defaults to PyAutoGUI's screenshot
+            queueSize:      Checkpoint requests waiting for capture;  More are dropped
+            encoders:       Threads encoding images
+            pendingImages:  Captured images waiting to be encoded;  Capture waits beyond this
+            hashDistance:   Frames whose hashes differ in at most this many bits are duplicates
+            recentHashes:   How many saved images are candidates for deduplication
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if capture is None:
+            import pyautogui
+
+            capture = pyautogui.screenshot
+
+        self._directory:    Path    = Path(directory)
+        self._capture:      Capture = capture
+        self._hashDistance: int     = hashDistance
+        self._recentHashes: int     = recentHashes
+
+        self._requests:      Queue                       = Queue(maxsize=queueSize)
+        self._pendingImages: BoundedSemaphore            = BoundedSemaphore(pendingImages)
+        self._encoders:      ThreadPoolExecutor          = ThreadPoolExecutor(max_workers=encoders, thread_name_prefix='CheckpointEncoder')
+        self._savedHashes:   List[Tuple[int, str]]       = []
+        self._manifest:      List[Dict[str, Any]]        = []
+        self._dropped:       int                         = 0
+        self._savedImages:   int                         = 0
+        self._startTime:     float                       = perf_counter()
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        self._captureThread: Thread = Thread(target=self._captureLoop, name='CheckpointCapture', daemon=True)
+        self._captureThread.start()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def dropped(self) -> int:
+        """
+        Returns:  Checkpoints skipped because capture could not keep up
+        """
+        return self._dropped
+
+    def checkpoint(self, commandIndex: int):
+        """
+        Safe to call from any thread;  Never blocks
+
+        Args:
+            commandIndex:  The index in the transcript of the command about to be recorded
+        """
+        try:
+            self._requests.put_nowait((commandIndex, perf_counter()))
+        except Full:
+            self._dropped += 1
+
+    def stop(self) -> Path:
+        """
+        Finishes the queued captures and encodes, then writes the manifest
+
+        Returns:  The manifest file
+        """
+        self._requests.put(None)
+        self._captureThread.join()
+        self._encoders.shutdown(wait=True)
+
+        manifestPath: Path = self._directory / CHECKPOINT_MANIFEST_NAME
+        with open(manifestPath, 'w') as manifestFile:
+            jsonDump({'captureTiming': CAPTURE_TIMING, 'dropped': self._dropped, 'checkpoints': self._manifest}, manifestFile, indent=2)
+
+        self.logger.info(f'{len(self._manifest)} checkpoints;  {self._savedImages} images;  {self._dropped} dropped')
+
+        return manifestPath
+
+    def _captureLoop(self):
+
+        while True:
+            request: Optional[CheckpointRequest] = self._requests.get()
+            if request is None:
+                break
+            try:
+                self._captureCheckpoint(request)
+            except Exception as e:
+                self.logger.error(f'Checkpoint for command {request[0]} failed: {e}')
+
+    def _captureCheckpoint(self, request: CheckpointRequest):
+
+        commandIndex, requestTime = request
+
+        captureStart: float = perf_counter()
+        image               = self._capture()
+        frameHash:    int   = self.differenceHash(image)
+
+        imageName: Optional[str] = self._findDuplicate(frameHash)
+        duplicate: bool          = imageName is not None
+        if imageName is None:
+            imageName = f'{commandIndex:06d}.png'
+            self._rememberHash(frameHash=frameHash, imageName=imageName)
+            self._savedImages += 1
+            #
+            # Holding the image until it is encoded is what costs memory;  Wait here on the capture
+            # thread, which lets the request queue fill and drop, instead of holding more
+            #
+            self._pendingImages.acquire()
+            self._encoders.submit(self._encode, image, self._directory / imageName)
+
+        self._manifest.append({
+            'command':      commandIndex,
+            'image':        imageName,
+            'duplicate':    duplicate,
+            'hash':         f'{frameHash:016x}',
+            'timeStamp':    round(requestTime - self._startTime, 3),
+            'captureDelay': round(captureStart - requestTime, 3),
+            'latency':      round(perf_counter() - requestTime, 3),
+        })
+
+    def _encode(self, image, imagePath: Path):
+
+        try:
+            image.save(imagePath, format='PNG', optimize=True)
+        except Exception as e:
+            self.logger.error(f'Could not save {imagePath}: {e}')
+        finally:
+            self._pendingImages.release()
+
+    def differenceHash(self, image) -> int:
+        """
+        A 64 bit perceptual hash;  Each bit records whether a pixel of a 9x8 grayscale
+        thumbnail is brighter than its right neighbor
+
+        Args:
+            image:  A Pillow image
+
+        Returns:  The hash
+        """
+        thumbnail:  bytes = image.convert('L').resize((HASH_WIDTH, HASH_HEIGHT)).tobytes()
+        frameHash:  int   = 0
+        for row in range(HASH_HEIGHT):
+            rowStart: int = row * HASH_WIDTH
+            for column in range(HASH_WIDTH - 1):
+                frameHash = (frameHash << 1) | (thumbnail[rowStart + column] > thumbnail[rowStart + column + 1])
+
+        return frameHash
+
+    def _findDuplicate(self, frameHash: int) -> Optional[str]:
+        """
+        Most recent first;  Consecutive steps are the likeliest duplicates
+        """
+        for savedHash, imageName in reversed(self._savedHashes):
+            if bin(savedHash ^ frameHash).count('1') <= self._hashDistance:
+                return imageName
+
+        return None
+
+    def _rememberHash(self, frameHash: int, imageName: str):
+
+        self._savedHashes.append((frameHash, imageName))
+        if len(self._savedHashes) > self._recentHashes:
+            del self._savedHashes[0]
@@ -0,0 +1,27 @@
+
+from typing import Callable
+
+from uitranscriber.ScriptDefinitions import PASTE_MODIFIER
+
+Hotkey = Callable[..., None]
+
+
+class ClipboardPaste:
+    """
+    Replays a paste command.  Puts the text on the clipboard and sends the platform's
+    paste hotkey through the replay backend
+    """
+    def __init__(self, hotkey: Hotkey):
+        """
+        Args:
+            hotkey:  The backend's hotkey function
+        """
+        from pyperclip import copy
+
+        self._copy:   Callable[[str], None] = copy
+        self._hotkey: Hotkey                = hotkey
+
+    def __call__(self, text: str):
+
+        self._copy(text)
+        self._hotkey(PASTE_MODIFIER, 'v')
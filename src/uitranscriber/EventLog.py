@@ -0,0 +1,35 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import linesep as osLineSep
+
+from uitranscriber.RawEvent import RawEvent
+
+EVENT_LOG_SUFFIX: str = '.events.jsonl'
+
+
+class EventLog:
+    """
+    Reads and writes raw event recordings;  One JSON object per line.  Time stamps are
+    saved relative to the first event
+    """
+    @classmethod
+    def save(cls, fileName: str, events: List[RawEvent]):
+
+        startTime: float = events[0].timeStamp if len(events) > 0 else 0.0
+        with open(fileName, 'w') as logFile:
+            for event in events:
+                values: Dict[str, Any] = event.toDict()
+                values['timeStamp'] = round(event.timeStamp - startTime, 6)
+                logFile.write(f'{jsonDumps(values)}{osLineSep}')
+
+    @classmethod
+    def load(cls, fileName: str) -> List[RawEvent]:
+
+        with open(fileName, 'r') as logFile:
+            return [RawEvent.fromDict(jsonLoads(line)) for line in logFile if line.strip() != '']
@@ -0,0 +1,57 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from time import sleep
+
+from uitranscriber.EventLog import EventLog
+from uitranscriber.InputBackend import InputBackend
+from uitranscriber.RawEvent import EventCallback
+from uitranscriber.RawEvent import RawEvent
+
+
+class EventLogBackend(InputBackend):
+    """
+    Plays back a raw event recording through the same path the live listeners use.
+
+    Starting only connects the monitor;  `play` delivers the events on the calling
+    thread, as fast as possible or with the recorded timing
+    """
+    def __init__(self, events: List[RawEvent], realTiming: bool = False):
+        """
+        Args:
+            events:      The recording
+            realTiming:  Sleep between events as long as the recording did
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._events:     List[RawEvent] = events
+        self._realTiming: bool           = realTiming
+        self._eventCB:    EventCallback  = cast(EventCallback, None)
+        self._stopped:    bool           = False
+
+    @classmethod
+    def fromFile(cls, fileName: str, realTiming: bool = False) -> 'EventLogBackend':
+        return cls(events=EventLog.load(fileName), realTiming=realTiming)
+
+    def start(self, eventCB: EventCallback):
+        self._eventCB = eventCB
+
+    def stop(self):
+        self._stopped = True
+
+    def play(self):
+
+        self._stopped = False
+        previousTime: float = self._events[0].timeStamp if len(self._events) > 0 else 0.0
+        for event in self._events:
+            if self._stopped is True:
+                self.logger.info('Playback stopped')
+                break
+            if self._realTiming is True and event.timeStamp > previousTime:
+                sleep(event.timeStamp - previousTime)
+            previousTime = event.timeStamp
+            self._eventCB(event)
@@ -0,0 +1,33 @@
+
+from typing import Tuple
+
+from abc import ABC
+from abc import abstractmethod
+
+#
+# left, top, width, height in screen pixels
+#
+Region = Tuple[int, int, int, int]
+
+
+class FrameSource(ABC):
+    """
+    Supplies downsampled grayscale captures of the display so that replay can tell
+    when the screen has stopped changing
+    """
+    @abstractmethod
+    def screenSize(self) -> Tuple[int, int]:
+        """
+        Returns:  The display width and height
+        """
+        pass
+
+    @abstractmethod
+    def grab(self, region: Region) -> bytes:
+        """
+        Args:
+            region:  The part of the screen to capture
+
+        Returns:  One byte per downsampled pixel;  Captures of the same region are always the same length
+        """
+        pass
@@ -0,0 +1,25 @@
+
+from abc import ABC
+from abc import abstractmethod
+
+from uitranscriber.RawEvent import EventCallback
+
+
+class InputBackend(ABC):
+    """
+    A source of input events for the InputMonitor.  Backends report every event;  The
+    monitor decides what to do with it
+    """
+    @abstractmethod
+    def start(self, eventCB: EventCallback):
+        """
+        Begin delivering events
+
+        Args:
+            eventCB:  Receives each event;  May be called from a thread other than the UI thread
+        """
+        pass
+
+    @abstractmethod
+    def stop(self):
+        pass
@@ -1,97 +1,104 @@
 
 from typing import Dict
 from typing import List
-from typing import cast
 from typing import Callable
+from typing import Optional
+from typing import cast
+
+from dataclasses import dataclass
 
 from logging import Logger
 from logging import getLogger
 
 from os import linesep as osLineSep
 
-from pynput.mouse import Button
-from pynput.mouse import Listener as MouseListener
-
-from pynput.keyboard import Key
-from pynput.keyboard import KeyCode
-from pynput.keyboard import Listener as KeyboardListener
-
-
-CLICK: str = 'click'
-WRITE: str = 'write'
-PRESS: str = 'press'
-
-PRESSES_ARGUMENT: str = 'presses'
-
-"""
-From the command line and if you have `uv` installed  
-you can execute this script as follow:
-
-uv run transcribed.py
-"""
-
-SCRIPT_PREAMBLE: List[str] = [
-    f'#!/usr/bin/env python{osLineSep}',
-    f'# /// script{osLineSep}'
-    f'# dependencies = ["pyautogui"]{osLineSep}'
-    f'# ///{osLineSep}'
-    f'"""{osLineSep}'
-    f'From the command line and if you have `uv` installed{osLineSep}'
-    f'you can execute this script as follow:{osLineSep}'
-    f'{osLineSep}'
-    f'uv run transcribed.py{osLineSep}'
-    f'"""{osLineSep}'
-    f'{osLineSep}'
-    f'import pyautogui{osLineSep}'
-    f'from pyautogui import write{osLineSep}'
-    f'from pyautogui import press{osLineSep}',
-    f'from pyautogui import click{osLineSep}',
-    f'{osLineSep}'
-    f'{osLineSep}'
-    f'pyautogui.PAUSE = 0.5{osLineSep}'
-    f'{osLineSep}'
-]
+from uitranscriber.InputBackend import InputBackend
+from uitranscriber.RawEvent import EVENT_CHARACTER
+from uitranscriber.RawEvent import EVENT_CLICK
+from uitranscriber.RawEvent import RawEvent
+
+from uitranscriber.ScriptDefinitions import CLICK
+from uitranscriber.ScriptDefinitions import CLICKS_ARGUMENT
+from uitranscriber.ScriptDefinitions import WRITE
+from uitranscriber.ScriptDefinitions import PASTE
+from uitranscriber.ScriptDefinitions import PRESS
+from uitranscriber.ScriptDefinitions import PRESSES_ARGUMENT
+from uitranscriber.ScriptDefinitions import SLEEP
+from uitranscriber.ScriptDefinitions import scriptPreamble
+
+from uitranscriber.TranscriptionSettings import PAUSE_POLICY_RECORDED
+from uitranscriber.TranscriptionSettings import TranscriptionSettings
+
 
 #
-# Maps pynput keys to PyAutoGUI keys
-# noinspection PyTypeChecker
+# Maps pynput key names to PyAutoGUI keys
 # noinspection SpellCheckingInspection
-SPECIAL_KEY_MAP: Dict[KeyCode, str] = {
-    Key.backspace: 'backspace',
-    Key.delete:    'delete',
-    Key.down:   'down',
-    Key.end:    'end',
-    Key.enter:  'enter',
-    Key.esc: '   esc',
-    Key.f1:  'f1',  Key.f2:  'f2',  Key.f3:  'f3',  Key.f4:  'f4',  Key.f5:  'f5',
-    Key.f6:  'f6',  Key.f7:  'f7',  Key.f8:  'f8',  Key.f9:  'f9',  Key.f10: 'f10',
-    Key.f11: 'f11', Key.f12: 'f12', Key.f13: 'f13', Key.f14: 'f14', Key.f15: 'f15',
-
-    Key.home: 'home', Key.left: 'left',
-    Key.page_down: 'pagedown', Key.page_up: 'pageup',
-    Key.right: 'right',
-    Key.space: 'space',
-    Key.tab:   'tab',
-    Key.up:    'up',
+SPECIAL_KEY_MAP: Dict[str, str] = {
+    'backspace': 'backspace',
+    'delete':    'delete',
+    'down':   'down',
+    'end':    'end',
+    'enter':  'enter',
+    'esc': '   esc',
+    'f1':  'f1',  'f2':  'f2',  'f3':  'f3',  'f4':  'f4',  'f5':  'f5',
+    'f6':  'f6',  'f7':  'f7',  'f8':  'f8',  'f9':  'f9',  'f10': 'f10',
+    'f11': 'f11', 'f12': 'f12', 'f13': 'f13', 'f14': 'f14', 'f15': 'f15',
+
+    'home': 'home', 'left': 'left',
+    'page_down': 'pagedown', 'page_up': 'pageup',
+    'right': 'right',
+    'space': 'space',
+    'tab':   'tab',
+    'up':    'up',
 }
+#
+# The special keys that are counted and emitted as a single press command
+#
+HANDLED_KEY_CODE: List[str] = [
+    'backspace', 'enter', 'up', 'down', 'left', 'right'
+]
 
 ReportCallback = Callable[[str], None]
+#
+# Receives the transcript index of the command a step starts with
+#
+StepCallback = Callable[[int], None]
+
+
+@dataclass
+class PendingClick:
+    """
+    A click held back while it may still become part of a double click
+    """
+    x:          int
+    y:          int
+    buttonName: str
+    clicks:     int
+    timeStamp:  float
+
 
 class InputMonitor:
     """
     Isolate the monitor code
     """
-    def __init__(self, reportCB: ReportCallback):
-
+    def __init__(self, reportCB: ReportCallback, backend: InputBackend = None, settings: TranscriptionSettings = None):
+        """
+        Args:
+            reportCB:  Receives each line of the generated script
+            backend:   Where the input events come from;  Defaults to listening to the live session with pynput
+            settings:  How events are coalesced into commands
+        """
         self.logger: Logger = getLogger(__name__)
 
-        self._reportCB: ReportCallback = reportCB
+        self._reportCB: ReportCallback        = reportCB
+        self._settings: TranscriptionSettings = TranscriptionSettings() if settings is None else settings
 
-        self._mouseListener:    MouseListener    = MouseListener(on_click=self._onClickListener)
-        self._keyboardListener: KeyboardListener = KeyboardListener(on_press=self._onKeyPressListener)
+        if backend is None:
+            from uitranscriber.PynputInputBackend import PynputInputBackend
 
-        self._mouseListener.start()
-        self._keyboardListener.start()
+            backend = PynputInputBackend()
+
+        self._backend: InputBackend = backend
 
         self._keyCodeMode:        bool = False
         self._repeatKeyCodeCount: int = 0
@@ -106,8 +113,19 @@ class InputMonitor:
         """
         self._recording:             bool = False
         self._lastInsertionPosition: int  = 0
+        self._keepRawEvents:         bool = False
+        self._rawEvents:             List[RawEvent] = []
+        """
+        What the backend reported while recording, when asked to keep it;  Saved as the raw event log
+        """
+        self._lastTimeStamp: Optional[float] = None
+        self._pendingClick: Optional[PendingClick] = None
+        self._commandCount: int                    = 0
+        self._stepCB:       Optional[StepCallback] = None
         self.loadPreamble()
 
+        self._backend.start(eventCB=self._onEvent)
+
     @property
     def recording(self) -> bool:
         return self._recording
@@ -116,44 +134,164 @@ class InputMonitor:
     def recording(self, recording: bool):
         self._recording = recording
 
-    def loadPreamble(self):
+    @property
+    def keepRawEvents(self) -> bool:
+        return self._keepRawEvents
+
+    @keepRawEvents.setter
+    def keepRawEvents(self, keepRawEvents: bool):
+        """
+        Off by default;  A long recording would otherwise hold every event it saw for nothing
+        """
+        self._keepRawEvents = keepRawEvents
+
+    @property
+    def rawEvents(self) -> List[RawEvent]:
+        return self._rawEvents
+
+    @property
+    def commandCount(self) -> int:
+        """
+        Returns:  The commands reported since the preamble
+        """
+        return self._commandCount
 
-        for line in SCRIPT_PREAMBLE:
+    @property
+    def stepCB(self) -> Optional[StepCallback]:
+        return self._stepCB
+
+    @stepCB.setter
+    def stepCB(self, stepCB: Optional[StepCallback]):
+        """
+        Called on the listener thread at each click, before the click is reported;  It must return quickly
+        """
+        self._stepCB = stepCB
+
+    def loadPreamble(self):
+        """
+        The preamble starts a new transcript, so the command count restarts
+        """
+        self._commandCount = 0
+        for line in scriptPreamble(pause=self._settings.pause):
             self._reportCB(line)
 
-    def _onClickListener(self, floatX: float, floatY: float, button: Button, pressed: bool):
+    def clearRawEvents(self):
         """
-        Check the keyboard buffer.  If it is non-empty generate the press command
+        Also forgets when the last event happened, so no idle gap spans the clear
+        """
+        self._rawEvents     = []
+        self._lastTimeStamp = None
 
+    def flush(self):
+        """
+        Emit whatever input is still buffered.  The live recorder leaves it buffered
+        until the next click;  Playback calls this at the end of a recording
+        """
+        self._flushPendingClick()
+        self._flushKeys()
+
+    def _onEvent(self, event: RawEvent):
+        """
         Calls to this method come from a thread running outside the UI event loop.  Use the
         wxPython CallAfter method to ensure updates to the UI occur within the UI event loop
 
+        Args:
+            event:  What the backend saw
+        """
+        if self._recording is True:
+            if self._settings.pausePolicy == PAUSE_POLICY_RECORDED and self._lastTimeStamp is not None:
+                self._recordGap(gap=event.timeStamp - self._lastTimeStamp)
+
+            self._lastTimeStamp = event.timeStamp
+            if self._keepRawEvents is True:
+                self._rawEvents.append(event)
+            if event.eventType == EVENT_CLICK:
+                self._onClickListener(floatX=event.x, floatY=event.y, buttonName=event.button, pressed=event.pressed, timeStamp=event.timeStamp)
+            else:
+                self._flushPendingClick()
+                self._onKeyPressListener(keyName=event.key, isCharacter=event.eventType == EVENT_CHARACTER)
+
+    def _onClickListener(self, floatX: float, floatY: float, buttonName: str, pressed: bool, timeStamp: float = 0.0):
+        """
+        Check the keyboard buffer.  If it is non-empty generate the press command
+
+        With a double click window the click is held back until it is clear whether
+        the next click merges with it
+
         Args:
             floatX:
             floatY:
-            button:
+            buttonName:
             pressed:
+            timeStamp:
         """
-        if self._recording is True:
-            if len(self._keyboardBuffer) > 0:
-                writeCmd: str = f"{WRITE}('{self._keyboardBuffer}')"
-                self._reportCB(f'{writeCmd}{osLineSep}')
-                self._keyboardBuffer = ''
-            if self._keyCodeMode is True:
-                self._unBufferKeyCode()
+        self._flushKeys()
+
+        x: int = round(floatX)
+        y: int = round(floatY)
+        if pressed is True:
+            if self._settings.doubleClickWindow <= 0.0:
+                self._reachStep()
+                self._emitClick(x=x, y=y, buttonName=buttonName, clicks=1)
+            elif self._mergesWithPendingClick(x=x, y=y, buttonName=buttonName, timeStamp=timeStamp) is True:
+                pendingClick: PendingClick = cast(PendingClick, self._pendingClick)
+                pendingClick.clicks   += 1
+                pendingClick.timeStamp = timeStamp
+            else:
+                self._flushPendingClick()
+                self._reachStep()
+                self._pendingClick = PendingClick(x=x, y=y, buttonName=buttonName, clicks=1, timeStamp=timeStamp)
+
+    def _reachStep(self):
+        """
+        Nothing else is reported before the click, so it will be the next command
+        """
+        if self._stepCB is not None:
+            self._stepCB(self._commandCount)
+
+    def _mergesWithPendingClick(self, x: int, y: int, buttonName: str, timeStamp: float) -> bool:
+
+        pendingClick: Optional[PendingClick] = self._pendingClick
+        if pendingClick is None:
+            return False
+
+        distance: int = self._settings.doubleClickDistance
+
+        return (
+            pendingClick.buttonName == buttonName
+            and abs(pendingClick.x - x) <= distance
+            and abs(pendingClick.y - y) <= distance
+            and timeStamp - pendingClick.timeStamp <= self._settings.doubleClickWindow
+        )
+
+    def _flushPendingClick(self):
+
+        if self._pendingClick is not None:
+            pendingClick: PendingClick = self._pendingClick
+            self._pendingClick = None
+            self._emitClick(x=pendingClick.x, y=pendingClick.y, buttonName=pendingClick.buttonName, clicks=pendingClick.clicks)
 
-            x: int = round(floatX)
-            y: int = round(floatY)
-            if pressed is True:
-                if button.name == "left":
-                    clickCmd: str = f"{CLICK}(x={x}, y={y})"
-                else:
-                    clickCmd = f'{CLICK}(x={x}, y={y}, button="right")'
+    def _emitClick(self, x: int, y: int, buttonName: str, clicks: int):
 
-                self.logger.debug(clickCmd)
-                self._reportCB(f'{clickCmd}{osLineSep}')
+        clicksArgument: str = '' if clicks == 1 else f', {CLICKS_ARGUMENT}={clicks}'
+        if buttonName == "left":
+            clickCmd: str = f"{CLICK}(x={x}, y={y}{clicksArgument})"
+        else:
+            clickCmd = f'{CLICK}(x={x}, y={y}{clicksArgument}, button="right")'
 
-    def _onKeyPressListener(self, pressedKey: KeyCode):
+        self.logger.debug(clickCmd)
+        self._reportCommand(clickCmd)
+
+    def _recordGap(self, gap: float):
+        """
+        Under the recorded pause policy an idle gap becomes a sleep;  Anything buffered
+        happened before the gap so it goes first
+        """
+        if gap >= self._settings.minimumGap:
+            self.flush()
+            self._reportCommand(f'{SLEEP}({round(gap, 2)})')
+
+    def _onKeyPressListener(self, keyName: str, isCharacter: bool):
         """
         We will buffer normal characters so as not to generate a bunch of single character
         press commands
@@ -163,45 +301,40 @@ class InputMonitor:
         Whenever, the click listener activates it checks the keyboard buffer.  If non-empty,
         it generates the press command
 
-        Calls to this method come from a thread running outside the UI event loop.  Use the
-        wxPython CallAfter method to ensure updates to the UI occur within the UI event loop
-
         Args:
-            pressedKey:
+            keyName:      The typed character or the special key name
+            isCharacter:  True for a typed character
         """
-        if self._recording is True:
-
-            if isinstance(pressedKey, KeyCode):
-
-                keyCode: KeyCode = cast(KeyCode, pressedKey)
-                keyStr:  str     = f'{keyCode.char}'
-                self._keyboardBuffer = f'{self._keyboardBuffer}{keyStr}'
-                self.logger.debug(f'keyboard buffer: {self._keyboardBuffer}')
-            else:
-                try:
-                    self._handleKeyCode(pressedKey=pressedKey)
-                except KeyError as ke:
-                    self.logger.warning(f'unhandled KeyCode: {ke=}')
-
-                    keyStr   = 'unhandled'
-                    pressCmd = f"{WRITE}('{keyStr}')"
-                    self.logger.debug(f'{pressCmd}')
-                    self._reportCB(f'{pressCmd}{osLineSep}')
-
-    def _handleKeyCode(self, pressedKey: KeyCode):
+        if isCharacter is True:
+            self._keyboardBuffer = f'{self._keyboardBuffer}{keyName}'
+            self.logger.debug(f'keyboard buffer: {self._keyboardBuffer}')
+            if 0 < self._settings.flushThreshold <= len(self._keyboardBuffer):
+                self._flushKeyboardBuffer()
+        else:
+            try:
+                self._handleKeyCode(keyName=keyName)
+            except KeyError as ke:
+                self.logger.warning(f'unhandled KeyCode: {ke=}')
+
+                keyStr   = 'unhandled'
+                pressCmd = f"{WRITE}('{keyStr}')"
+                self.logger.debug(f'{pressCmd}')
+                self._reportCommand(pressCmd)
+
+    def _handleKeyCode(self, keyName: str):
         """
         We will keep buffering aka counting the non-alphanumeric
         keys until it is different than the one we are buffering
 
 
         Args:
-            pressedKey:
+            keyName:
 
         Exception: KeyError - When the SPECIAL_KEY_MAP does not contain a translation for PyAutoGUI
         """
-        self.logger.debug(f'{pressedKey=}')
+        self.logger.debug(f'{keyName=}')
 
-        keyStr: str = SPECIAL_KEY_MAP[pressedKey]
+        keyStr: str = SPECIAL_KEY_MAP[keyName]
         msg: str = (
             f'Special Key {keyStr} '
             f'{self._keyCodeMode=} '
@@ -217,18 +350,40 @@ class InputMonitor:
                 self._unBufferKeyCode()
                 self._resetKeyCodeMode()
 
-        HANDLED_KEY_CODE: List[Key] = [
-            Key.backspace, Key.enter, Key.up, Key.down, Key.left, Key.right
-        ]
-        if pressedKey in HANDLED_KEY_CODE:
+        if keyName in HANDLED_KEY_CODE:
             self._keyCodeMode = True
             self._repeatedKeyCode = keyStr
             self._repeatKeyCodeCount += 1
 
+    def _flushKeys(self):
+
+        self._flushKeyboardBuffer()
+        if self._keyCodeMode is True:
+            self._unBufferKeyCode()
+
+    def _flushKeyboardBuffer(self):
+
+        if len(self._keyboardBuffer) > 0:
+            #
+            # Long runs are pasted;  Short ones stay typed so key level behavior is preserved
+            #
+            pasteThreshold: int = self._settings.pasteThreshold
+            if 0 < pasteThreshold < len(self._keyboardBuffer):
+                writeCmd: str = f'{PASTE}({self._keyboardBuffer!r})'
+            else:
+                writeCmd = f'{WRITE}({self._keyboardBuffer!r})'
+            self._reportCommand(writeCmd)
+            self._keyboardBuffer = ''
+
     def _unBufferKeyCode(self):
         pressCmd: str = f"{PRESS}('{self._repeatedKeyCode}', {PRESSES_ARGUMENT}={self._repeatKeyCodeCount})"
         self._resetKeyCodeMode()
-        self._reportCB(f'{pressCmd}{osLineSep}')
+        self._reportCommand(pressCmd)
+
+    def _reportCommand(self, command: str):
+
+        self._commandCount += 1
+        self._reportCB(f'{command}{osLineSep}')
 
     def _resetKeyCodeMode(self):
 
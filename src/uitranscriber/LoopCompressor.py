@@ -0,0 +1,273 @@
+
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import linesep as osLineSep
+
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptDefinitions import PASTE
+from uitranscriber.ScriptDefinitions import PRESS
+from uitranscriber.ScriptDefinitions import WRITE
+from uitranscriber.SuffixArray import SuffixArray
+
+INDENT: str = '    '
+
+DEFAULT_MINIMUM_REPETITIONS: int = 3
+DEFAULT_MAXIMUM_PERIOD:      int = 64
+
+#
+# Loop variable names for positional arguments;  keyword arguments use the keyword
+#
+POSITIONAL_NAMES: Dict[str, str] = {
+    WRITE: 'message',
+    PASTE: 'text',
+    PRESS: 'keys',
+}
+
+
+class Run(NamedTuple):
+    """
+    `repetitions` consecutive copies of the `period` commands starting at `start`
+    """
+    start:       int
+    period:      int
+    repetitions: int
+
+    @property
+    def end(self) -> int:
+        return self.start + self.period * self.repetitions
+
+    @property
+    def length(self) -> int:
+        return self.period * self.repetitions
+
+
+class LoopCompressor:
+    """
+    Rewrites runs of repeated commands as `for` loops.
+
+    Commands repeat when they have the same shape (name and argument layout);
+    arguments that differ between the repetitions are lifted into the loop's data
+    list.  With `liftArguments` False only exact repetitions become loops.
+    A run only becomes a loop when the loop takes fewer lines than the commands
+    it replaces;  Lifted arguments cost a data row per repetition.
+
+    Runs are found by sampling every `period`-th position and extending with
+    constant time LCP queries on a suffix array, so the search is O(n log n)
+    in the number of commands
+    """
+    def __init__(self, minimumRepetitions: int = DEFAULT_MINIMUM_REPETITIONS, maximumPeriod: int = DEFAULT_MAXIMUM_PERIOD, liftArguments: bool = True):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._minimumRepetitions: int  = max(2, minimumRepetitions)
+        self._maximumPeriod:      int  = maximumPeriod
+        self._liftArguments:      bool = liftArguments
+
+    def compress(self, commands: List[ScriptCommand]) -> List[str]:
+        """
+        Args:
+            commands:  The recorded command sequence
+
+        Returns:  Script lines, each terminated by the line separator
+        """
+        runs:  List[Run] = self.findRuns(commands)
+        lines: List[str] = []
+
+        position: int = 0
+        for run in runs:
+            for command in commands[position:run.start]:
+                lines.append(f'{command.toStatement()}{osLineSep}')
+            lines.extend(self._emitLoop(commands=commands, run=run))
+            position = run.end
+
+        for command in commands[position:]:
+            lines.append(f'{command.toStatement()}{osLineSep}')
+
+        self.logger.info(f'Compressed {len(commands)} commands into {len(lines)} lines using {len(runs)} loops')
+        return lines
+
+    def findRuns(self, commands: List[ScriptCommand]) -> List[Run]:
+        """
+        Returns:  Non-overlapping runs ordered by start position;  Runs saving the most
+        script lines win when candidates overlap
+        """
+        tokens:      List[int] = self._tokenize(commands=commands, byShape=self._liftArguments)
+        exactTokens: List[int] = self._tokenize(commands=commands, byShape=False)
+
+        #
+        # An exact repetition inside a run that varies by shape alone may be the only part that pays
+        #
+        candidateRuns: List[Tuple[Run, List[int]]] = [(run, tokens) for run in self._candidateRuns(tokens)]
+        if self._liftArguments is True:
+            candidateRuns.extend((run, exactTokens) for run in self._candidateRuns(exactTokens))
+
+        candidates: List[Tuple[int, Run]] = []
+        for candidate, candidateTokens in candidateRuns:
+            if self._isPrimitive(run=candidate, tokens=candidateTokens) is False:
+                continue
+            savings: int = self._lineSavings(run=candidate, exactTokens=exactTokens)
+            if savings > 0:
+                candidates.append((savings, candidate))
+
+        candidates.sort(key=lambda scored: (-scored[0], scored[1].period, scored[1].start))
+
+        occupied: bytearray = bytearray(len(tokens))
+        selected: List[Run] = []
+        for _, candidate in candidates:
+            run: Optional[Run] = self._longestFreeRun(candidate=candidate, occupied=occupied)
+            if run is None or self._lineSavings(run=run, exactTokens=exactTokens) <= 0:
+                continue
+            occupied[run.start:run.end] = b'\x01' * (run.end - run.start)
+            selected.append(run)
+
+        selected.sort(key=lambda run: run.start)
+        return selected
+
+    def _longestFreeRun(self, candidate: Run, occupied: bytearray) -> Optional[Run]:
+        """
+        Any sub-range of a run whose length is a multiple of the period is itself a run,
+        so a candidate that overlaps already selected runs keeps its longest free part
+
+        Returns:  The longest part of the candidate that does not overlap a selected run, or
+        None if that part has fewer than the minimum repetitions
+        """
+        best:  Optional[Run] = None
+        start: int           = candidate.start
+        while start < candidate.end:
+            collision:   int = occupied.find(1, start, candidate.end)
+            freeEnd:     int = candidate.end if collision == -1 else collision
+            repetitions: int = (freeEnd - start) // candidate.period
+            if repetitions >= self._minimumRepetitions and (best is None or repetitions > best.repetitions):
+                best = Run(start=start, period=candidate.period, repetitions=repetitions)
+            if collision == -1:
+                break
+            start = occupied.find(0, collision, candidate.end)
+            if start == -1:
+                break
+
+        return best
+
+    def _isPrimitive(self, run: Run, tokens: List[int]) -> bool:
+        """
+        A body that itself repeats with a shorter period is found again with that period;  Counted by
+        lines the longer loop may look better, since its wider data rows are still one line each
+        """
+        for period in range(1, run.period // 2 + 1):
+            if run.period % period == 0 and tokens[run.start:run.start + run.period - period] == tokens[run.start + period:run.start + run.period]:
+                return False
+
+        return True
+
+    def _lineSavings(self, run: Run, exactTokens: List[int]) -> int:
+        """
+        An exact repetition is emitted as a `range` loop header and the body;  Otherwise
+        the header, one data row per repetition and the closing bracket come on top
+
+        Returns:  The script lines saved by emitting the run as a loop;  Not positive when it does not pay
+        """
+        exact:   bool = exactTokens[run.start:run.end - run.period] == exactTokens[run.start + run.period:run.end]
+        emitted: int  = run.period + 1 if exact is True else run.period + run.repetitions + 2
+
+        return run.length - emitted
+
+    def _tokenize(self, commands: List[ScriptCommand], byShape: bool) -> List[int]:
+
+        tokenIds: Dict[Hashable, int] = {}
+        tokens:   List[int]           = []
+        for command in commands:
+            key: Hashable = command.shape if byShape is True else command
+            tokens.append(tokenIds.setdefault(key, len(tokenIds)))
+
+        return tokens
+
+    def _candidateRuns(self, tokens: List[int]) -> List[Run]:
+        """
+        A run of period p and length >= 2p must contain two sample positions that
+        are multiples of p.  From each sample the LCP with the suffix p positions
+        later gives the forward extent; the backward extent is less than p and is
+        found by direct comparison
+        """
+        size:        int         = len(tokens)
+        suffixArray: SuffixArray = SuffixArray(tokens)
+        runs:        List[Run]   = []
+
+        for period in range(1, min(self._maximumPeriod, size // 2) + 1):
+            covered: int = 0
+            for sample in range(0, size - period, period):
+                if sample < covered or tokens[sample] != tokens[sample + period]:
+                    continue
+                forward: int = suffixArray.longestCommonPrefix(sample, sample + period)
+                if forward == 0:
+                    continue
+                backward: int = 0
+                while backward < period - 1 and sample - backward > 0 and tokens[sample - backward - 1] == tokens[sample - backward - 1 + period]:
+                    backward += 1
+
+                start:       int = sample - backward
+                repetitions: int = (backward + forward + period) // period
+                if repetitions >= self._minimumRepetitions:
+                    runs.append(Run(start=start, period=period, repetitions=repetitions))
+                covered = sample + forward
+
+        return runs
+
+    def _emitLoop(self, commands: List[ScriptCommand], run: Run) -> List[str]:
+
+        block: List[ScriptCommand] = commands[run.start:run.start + run.period]
+
+        iterations: List[List[ScriptCommand]] = [
+            commands[run.start + repetition * run.period:run.start + (repetition + 1) * run.period]
+            for repetition in range(run.repetitions)
+        ]
+        #
+        # Find the argument slots that vary between iterations and name a loop variable for each
+        #
+        substitutions: List[Dict[int, str]] = []
+        variables:     List[str]            = []
+        slots:         List[tuple]          = []
+        for offset, command in enumerate(block):
+            commandSubstitutions: Dict[int, str] = {}
+            slotValues: List[List[Any]] = [iteration[offset].values for iteration in iterations]
+            for slot, value in enumerate(slotValues[0]):
+                if any(values[slot] != value for values in slotValues[1:]):
+                    variable: str = f'{self._slotName(command=command, slot=slot)}{offset}'
+                    if variable in variables:
+                        variable = f'{variable}_{slot}'
+                    commandSubstitutions[slot] = variable
+                    variables.append(variable)
+                    slots.append((offset, slot))
+            substitutions.append(commandSubstitutions)
+
+        lines: List[str] = []
+        if len(variables) == 0:
+            lines.append(f'for _ in range({run.repetitions}):{osLineSep}')
+        else:
+            lines.append(f'for {", ".join(variables)} in [{osLineSep}')
+            for iteration in iterations:
+                row: List[Any] = [iteration[offset].values[slot] for offset, slot in slots]
+                if len(row) == 1:
+                    lines.append(f'{INDENT}{row[0]!r},{osLineSep}')
+                else:
+                    lines.append(f'{INDENT}({", ".join(repr(value) for value in row)}),{osLineSep}')
+            lines.append(f']:{osLineSep}')
+
+        for command, commandSubstitutions in zip(block, substitutions):
+            lines.append(f'{INDENT}{command.toStatement(substitutions=commandSubstitutions)}{osLineSep}')
+
+        return lines
+
+    def _slotName(self, command: ScriptCommand, slot: int) -> str:
+
+        if slot < len(command.arguments):
+            return POSITIONAL_NAMES.get(command.name, 'argument')
+
+        return command.keywords[slot - len(command.arguments)][0]
@@ -0,0 +1,55 @@
+
+from typing import Union
+from typing import cast
+
+from time import perf_counter
+
+from pynput.mouse import Button
+from pynput.mouse import Listener as MouseListener
+
+from pynput.keyboard import Key
+from pynput.keyboard import KeyCode
+from pynput.keyboard import Listener as KeyboardListener
+
+from uitranscriber.InputBackend import InputBackend
+from uitranscriber.RawEvent import EVENT_CHARACTER
+from uitranscriber.RawEvent import EVENT_CLICK
+from uitranscriber.RawEvent import EVENT_SPECIAL_KEY
+from uitranscriber.RawEvent import EventCallback
+from uitranscriber.RawEvent import RawEvent
+
+
+class PynputInputBackend(InputBackend):
+    """
+    Listens to the live OS session through pynput.  Requires the Input Monitoring
+    permission on macOS and a display on Linux
+    """
+    def __init__(self):
+
+        self._eventCB: EventCallback = cast(EventCallback, None)
+
+        self._mouseListener:    MouseListener    = MouseListener(on_click=self._onClickListener)
+        self._keyboardListener: KeyboardListener = KeyboardListener(on_press=self._onKeyPressListener)
+
+    def start(self, eventCB: EventCallback):
+
+        self._eventCB = eventCB
+        self._mouseListener.start()
+        self._keyboardListener.start()
+
+    def stop(self):
+
+        self._mouseListener.stop()
+        self._keyboardListener.stop()
+
+    def _onClickListener(self, floatX: float, floatY: float, button: Button, pressed: bool):
+
+        self._eventCB(RawEvent(eventType=EVENT_CLICK, timeStamp=perf_counter(), x=floatX, y=floatY, button=button.name, pressed=pressed))
+
+    def _onKeyPressListener(self, pressedKey: Union[Key, KeyCode]):
+
+        if isinstance(pressedKey, KeyCode):
+            keyCode: KeyCode = cast(KeyCode, pressedKey)
+            self._eventCB(RawEvent(eventType=EVENT_CHARACTER, timeStamp=perf_counter(), key=f'{keyCode.char}'))
+        else:
+            self._eventCB(RawEvent(eventType=EVENT_SPECIAL_KEY, timeStamp=perf_counter(), key=pressedKey.name))
@@ -0,0 +1,66 @@
+
+from typing import Dict
+from typing import List
+from typing import Union
+
+from pynput.mouse import Button
+from pynput.mouse import Controller as MouseController
+
+from pynput.keyboard import Key
+from pynput.keyboard import KeyCode
+from pynput.keyboard import Controller as KeyboardController
+
+#
+# PyAutoGUI key names whose pynput name differs
+#
+PYNPUT_KEY_NAMES: Dict[str, str] = {
+    'command':  'cmd',
+    'pagedown': 'page_down',
+    'pageup':   'page_up',
+}
+
+
+class PynputReplayer:
+    """
+    A fast replay backend.  Posts the events directly through pynput's controllers;
+    The methods accept the same arguments as the PyAutoGUI functions they stand in for
+    """
+    def __init__(self):
+
+        self._mouse:    MouseController    = MouseController()
+        self._keyboard: KeyboardController = KeyboardController()
+
+    # noinspection PyUnusedLocal
+    def click(self, x: int = None, y: int = None, clicks: int = 1, interval: float = 0.0, button: str = 'left'):
+
+        if x is not None and y is not None:
+            self._mouse.position = (x, y)
+        self._mouse.click(Button[button], clicks)
+
+    # noinspection PyUnusedLocal
+    def write(self, message: str, interval: float = 0.0):
+        self._keyboard.type(message)
+
+    # noinspection PyUnusedLocal
+    def press(self, keys: str, presses: int = 1, interval: float = 0.0):
+
+        key: Union[Key, KeyCode] = self._toKey(keys)
+        for _ in range(presses):
+            self._keyboard.press(key)
+            self._keyboard.release(key)
+
+    def hotkey(self, *keys: str):
+
+        pressedKeys: List[Union[Key, KeyCode]] = [self._toKey(keyName) for keyName in keys]
+        for key in pressedKeys:
+            self._keyboard.press(key)
+        for key in reversed(pressedKeys):
+            self._keyboard.release(key)
+
+    def _toKey(self, keyName: str) -> Union[Key, KeyCode]:
+
+        name: str = PYNPUT_KEY_NAMES.get(keyName, keyName)
+        try:
+            return Key[name]
+        except KeyError:
+            return KeyCode.from_char(keyName)
@@ -0,0 +1,38 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from dataclasses import asdict
+from dataclasses import dataclass
+
+EVENT_CLICK:       str = 'click'
+EVENT_CHARACTER:   str = 'character'
+EVENT_SPECIAL_KEY: str = 'specialKey'
+
+
+@dataclass(frozen=True)
+class RawEvent:
+    """
+    A single input event as the listeners saw it, independent of the listener library.
+
+    Click events use the position, button and pressed fields;  Key events use the key
+    field, which holds the typed character or the special key's name
+    """
+    eventType: str
+    timeStamp: float = 0.0
+    x:         float = 0.0
+    y:         float = 0.0
+    button:    str   = ''
+    pressed:   bool  = False
+    key:       str   = ''
+
+    def toDict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def fromDict(cls, values: Dict[str, Any]) -> 'RawEvent':
+        return cls(**values)
+
+
+EventCallback = Callable[[RawEvent], None]
@@ -0,0 +1,151 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from collections import Counter
+
+from concurrent.futures import ProcessPoolExecutor
+
+from json import dump as jsonDump
+
+from os import cpu_count
+
+from pathlib import Path
+
+from time import perf_counter
+
+from uitranscriber.EventLog import EVENT_LOG_SUFFIX
+from uitranscriber.EventLogBackend import EventLogBackend
+from uitranscriber.InputMonitor import InputMonitor
+from uitranscriber.ScriptDefinitions import DEFAULT_PASTE_THRESHOLD
+from uitranscriber.ScriptParser import ScriptParser
+from uitranscriber.TranscriptionSettings import PAUSE_POLICY_FIXED
+from uitranscriber.TranscriptionSettings import PAUSE_POLICY_RECORDED
+from uitranscriber.TranscriptionSettings import TranscriptionSettings
+
+STATISTICS_FILE_NAME: str = 'statistics.json'
+
+Task = Tuple[str, str, TranscriptionSettings]
+
+
+def retranscribeFile(task: Task) -> Dict[str, Any]:
+    """
+    Runs in a worker process.  Plays one raw event log through an InputMonitor and
+    writes the script it produces
+
+    Args:
+        task:  The event log, the script to write and the settings
+
+    Returns:  The statistics for this recording
+    """
+    eventLogName, scriptName, settings = task
+
+    startTime: float = perf_counter()
+    lines:     List[str] = []
+
+    backend: EventLogBackend = EventLogBackend.fromFile(eventLogName)
+    monitor: InputMonitor    = InputMonitor(reportCB=lines.append, backend=backend, settings=settings)
+    monitor.keepRawEvents = True
+    monitor.recording     = True
+    backend.play()
+    monitor.flush()
+
+    script: str = ''.join(lines)
+    with open(scriptName, 'w') as scriptFile:
+        scriptFile.write(script)
+
+    events        = monitor.rawEvents
+    commandCounts = Counter(command.name for command in ScriptParser().parse(script))
+
+    return {
+        'recording':      eventLogName,
+        'script':         scriptName,
+        'events':         len(events),
+        'duration':       events[-1].timeStamp - events[0].timeStamp if len(events) > 0 else 0.0,
+        'commands':       sum(commandCounts.values()),
+        'commandCounts':  dict(commandCounts),
+        'processingTime': perf_counter() - startTime,
+    }
+
+
+class ReTranscriber:
+    """
+    Re-transcribes a directory of raw event recordings with chosen settings.  Each
+    recording is independent, so the work fans out across a process pool
+    """
+    def __init__(self, settings: TranscriptionSettings, workers: int = 0):
+        """
+        Args:
+            settings:  How events are coalesced into commands
+            workers:   Worker processes;  0 uses one per CPU
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._settings: TranscriptionSettings = settings
+        self._workers:  int                   = workers if workers > 0 else (cpu_count() or 1)
+
+    def retranscribe(self, inputDirectory: str, outputDirectory: str) -> List[Dict[str, Any]]:
+        """
+        Writes one script per recording and a statistics file to the output directory
+
+        Returns:  The statistics for each recording
+        """
+        outputPath: Path = Path(outputDirectory)
+        outputPath.mkdir(parents=True, exist_ok=True)
+
+        tasks: List[Task] = [
+            (str(eventLog), str(outputPath / f'{eventLog.name[:-len(EVENT_LOG_SUFFIX)]}.py'), self._settings)
+            for eventLog in sorted(Path(inputDirectory).glob(f'*{EVENT_LOG_SUFFIX}'))
+        ]
+        self.logger.info(f'Re-transcribing {len(tasks)} recordings with {self._workers} workers')
+
+        chunkSize: int = max(1, len(tasks) // (self._workers * 4))
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            statistics: List[Dict[str, Any]] = list(executor.map(retranscribeFile, tasks, chunksize=chunkSize))
+
+        with open(outputPath / STATISTICS_FILE_NAME, 'w') as statisticsFile:
+            jsonDump(statistics, statisticsFile, indent=2)
+
+        return statistics
+
+
+def main():
+
+    parser: ArgumentParser = ArgumentParser(description='Re-transcribe raw event recordings with different coalescing settings')
+    parser.add_argument('inputDirectory',  help=f'Directory of {EVENT_LOG_SUFFIX} recordings')
+    parser.add_argument('outputDirectory', help='Where the scripts and statistics go')
+    parser.add_argument('--flush-threshold',       dest='flushThreshold',      type=int,   default=0,   help='Write buffered characters once there are this many')
+    parser.add_argument('--paste-threshold',       dest='pasteThreshold',      type=int,   default=DEFAULT_PASTE_THRESHOLD, help='Paste typed runs longer than this;  0 always types')
+    parser.add_argument('--double-click-window',   dest='doubleClickWindow',   type=float, default=0.0, help='Seconds within which clicks merge')
+    parser.add_argument('--double-click-distance', dest='doubleClickDistance', type=int,   default=4,   help='Pixels a merged click may drift')
+    parser.add_argument('--pause',                 dest='pause',               type=float, default=TranscriptionSettings.pause)
+    parser.add_argument('--pause-policy',          dest='pausePolicy',         choices=[PAUSE_POLICY_FIXED, PAUSE_POLICY_RECORDED], default=PAUSE_POLICY_FIXED)
+    parser.add_argument('--minimum-gap',           dest='minimumGap',          type=float, default=1.0, help='Idle seconds that become a sleep')
+    parser.add_argument('--workers',               dest='workers',             type=int,   default=0,   help='Worker processes;  0 uses one per CPU')
+
+    arguments: Namespace = parser.parse_args()
+
+    settings: TranscriptionSettings = TranscriptionSettings(flushThreshold=arguments.flushThreshold,
+                                                            pasteThreshold=arguments.pasteThreshold,
+                                                            doubleClickWindow=arguments.doubleClickWindow,
+                                                            doubleClickDistance=arguments.doubleClickDistance,
+                                                            pause=arguments.pause,
+                                                            pausePolicy=arguments.pausePolicy,
+                                                            minimumGap=arguments.minimumGap)
+
+    startTime:  float                = perf_counter()
+    statistics: List[Dict[str, Any]] = ReTranscriber(settings=settings, workers=arguments.workers).retranscribe(arguments.inputDirectory, arguments.outputDirectory)
+
+    print(f'Re-transcribed {len(statistics)} recordings in {perf_counter() - startTime:.2f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+
+from typing import Counter as CounterType
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import FileHandler
+from logging import Logger
+from logging import getLogger
+
+from collections import Counter
+
+from cProfile import Profile
+
+from io import StringIO
+
+from pathlib import Path
+
+from pstats import SortKey
+from pstats import Stats
+
+from sys import _current_frames
+
+from tempfile import gettempdir
+
+from threading import Event
+from threading import Thread
+from threading import enumerate as threadingEnumerate
+from threading import get_ident
+
+from time import strftime
+
+from types import FrameType
+
+from tracemalloc import Snapshot
+from tracemalloc import start as tracemallocStart
+from tracemalloc import stop as tracemallocStop
+from tracemalloc import take_snapshot
+from tracemalloc import is_tracing
+
+PROFILE_FILE_PREFIX: str = 'uitranscriber-profile'
+
+DEFAULT_SAMPLE_INTERVAL:    float = 0.005
+DEFAULT_TRACEBACK_FRAMES:   int   = 10
+DEFAULT_TOP_ALLOCATORS:     int   = 25
+DEFAULT_TOP_FUNCTIONS:      int   = 40
+
+
+class RecorderProfiler:
+    """
+    Profiles a running recorder on demand, so a sluggish session can be examined without
+    restarting it.
+
+    While active, cProfile traces the thread that started it (the UI thread, where commands are
+    appended, indexed and saved), a sampling thread records the stacks of every other thread (the
+    input listeners) and tracemalloc traces allocations.  Stopping writes the reports next to the
+    application log.  Nothing is installed while it is off, so it costs nothing then
+    """
+    def __init__(self, outputDirectory: str = '', sampleInterval: float = DEFAULT_SAMPLE_INTERVAL):
+        """
+        Args:
+            outputDirectory:  Where reports go;  Defaults to the directory of the uitranscriber log file
+            sampleInterval:   Seconds between stack samples of the other threads
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._outputDirectory: Path  = Path(outputDirectory) if outputDirectory != '' else self._logDirectory()
+        self._sampleInterval:  float = sampleInterval
+
+        self._profile:         Optional[Profile] = None
+        self._sampler:         Optional[Thread]  = None
+        self._stopSampling:    Event             = Event()
+        self._samples:         CounterType[str]  = Counter()
+        self._ownsTracemalloc: bool              = False
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+
+    def toggle(self) -> List[Path]:
+        """
+        Returns:  The reports written when this stops profiling;  Empty when it starts
+        """
+        if self.active is True:
+            return self.stop()
+
+        self.start()
+        return []
+
+    def start(self):
+
+        if self.active is True:
+            return
+
+        self._samples = Counter()
+        self._stopSampling.clear()
+        #
+        # Someone else may already be tracing allocations;  Leave their tracing alone on stop
+        #
+        self._ownsTracemalloc = not is_tracing()
+        if self._ownsTracemalloc is True:
+            tracemallocStart(DEFAULT_TRACEBACK_FRAMES)
+
+        self._sampler = Thread(target=self._sampleLoop, args=(get_ident(),), name='RecorderProfilerSampler', daemon=True)
+        self._sampler.start()
+
+        self._profile = Profile()
+        self._profile.enable()
+        self.logger.warning(f'Profiling started;  Reports go to {self._outputDirectory}')
+
+    def stop(self) -> List[Path]:
+        """
+        Returns:  The report files
+        """
+        if self._profile is None:
+            return []
+
+        profile: Profile = self._profile
+        profile.disable()
+        self._profile = None
+
+        self._stopSampling.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+        snapshot: Snapshot = take_snapshot()
+        if self._ownsTracemalloc is True:
+            tracemallocStop()
+
+        reports: List[Path] = self._writeReports(profile=profile, snapshot=snapshot)
+        self.logger.warning(f'Profiling stopped;  Wrote {", ".join(str(report) for report in reports)}')
+
+        return reports
+
+    def _sampleLoop(self, profiledThreadId: int):
+        """
+        Folds each sampled stack into `thread;outermost;...;innermost` so the counts
+        can be fed to a flame graph tool
+        """
+        samplerId: int = get_ident()
+        while self._stopSampling.wait(self._sampleInterval) is False:
+            threadNames: Dict[int, str] = {thread.ident: thread.name for thread in threadingEnumerate() if thread.ident is not None}
+            for threadId, threadFrame in _current_frames().items():
+                if threadId == samplerId or threadId == profiledThreadId:
+                    continue
+                functions: List[str]           = []
+                frame:     Optional[FrameType] = threadFrame
+                while frame is not None:
+                    code = frame.f_code
+                    functions.append(f'{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})')
+                    frame = frame.f_back
+                functions.append(threadNames.get(threadId, str(threadId)))
+                self._samples[';'.join(reversed(functions))] += 1
+
+    def _writeReports(self, profile: Profile, snapshot: Snapshot) -> List[Path]:
+
+        self._outputDirectory.mkdir(parents=True, exist_ok=True)
+        baseName: Path = self._outputDirectory / f'{PROFILE_FILE_PREFIX}-{strftime("%Y%m%d-%H%M%S")}'
+
+        profileFile:    Path = baseName.with_suffix('.prof')
+        profileText:    Path = baseName.with_suffix('.profile.txt')
+        samplesFile:    Path = baseName.with_suffix('.samples.txt')
+        allocationFile: Path = baseName.with_suffix('.allocations.txt')
+
+        profile.dump_stats(str(profileFile))
+
+        report: StringIO = StringIO()
+        Stats(profile, stream=report).sort_stats(SortKey.CUMULATIVE).print_stats(DEFAULT_TOP_FUNCTIONS)
+        profileText.write_text(report.getvalue())
+
+        samplesFile.write_text(''.join(f'{stack} {count}\n' for stack, count in self._samples.most_common()))
+
+        topAllocators: List[str] = [f'{statistic}\n' for statistic in snapshot.statistics('lineno')[:DEFAULT_TOP_ALLOCATORS]]
+        allocationFile.write_text(''.join(topAllocators))
+
+        return [profileFile, profileText, samplesFile, allocationFile]
+
+    def _logDirectory(self) -> Path:
+
+        for handler in getLogger('uitranscriber').handlers:
+            if isinstance(handler, FileHandler):
+                return Path(handler.baseFilename).parent
+
+        return Path(gettempdir())
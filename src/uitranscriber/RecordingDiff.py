@@ -0,0 +1,353 @@
+
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import NamedTuple
+from typing import Set
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from json import dumps as jsonDumps
+
+from time import perf_counter
+
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptDefinitions import CLICK
+from uitranscriber.ScriptDefinitions import SLEEP
+from uitranscriber.ScriptParser import ScriptParser
+
+DEFAULT_COORDINATE_TOLERANCE: int   = 2
+DEFAULT_TIME_TOLERANCE:       float = 0.25
+DEFAULT_SHOWN_COMMANDS:       int   = 3
+DEFAULT_MINIMUM_MOVE:         int   = 2
+
+CHANGE_REMOVED:  str = 'removed'
+CHANGE_INSERTED: str = 'inserted'
+CHANGE_MOVED:    str = 'moved'
+
+CHANGE_MARKERS: Dict[str, str] = {
+    CHANGE_REMOVED:  '-',
+    CHANGE_INSERTED: '+',
+    CHANGE_MOVED:    '>',
+}
+
+#
+# Old index, new index
+#
+Match = Tuple[int, int]
+#
+# Old start, old end, new start, new end;  Half open
+#
+Box = Tuple[int, int, int, int]
+
+
+class Change(NamedTuple):
+    """
+    A run of consecutive steps that changed.  Indices are zero based and half open;
+    A removal has an empty new range and an insertion an empty old range
+    """
+    kind:     str
+    oldStart: int
+    oldEnd:   int
+    newStart: int
+    newEnd:   int
+
+    @property
+    def size(self) -> int:
+        return max(self.oldEnd - self.oldStart, self.newEnd - self.newStart)
+
+
+class RecordingDiff:
+    """
+    Compares two recordings as command sequences instead of as text.
+
+    Clicks whose coordinates differ by at most the coordinate tolerance and sleeps whose
+    durations differ by at most the time tolerance are equal, so re-recording jitter does
+    not show up as a change.  The alignment is Myers' O(ND) algorithm in its linear space
+    form, after stripping the common prefix and suffix;  Re-recordings are mostly the same,
+    so D is small and the cost stays close to linear.  Removed runs that reappear as
+    inserted runs are reported as moved
+    """
+    def __init__(self, coordinateTolerance: int = DEFAULT_COORDINATE_TOLERANCE, timeTolerance: float = DEFAULT_TIME_TOLERANCE, minimumMove: int = DEFAULT_MINIMUM_MOVE):
+        """
+        Args:
+            coordinateTolerance:  Pixels a click may move and still match
+            timeTolerance:        Seconds a sleep may change and still match
+            minimumMove:          Steps a run needs to be reported as moved;  A lone `press('enter')` that
+                                  disappears in one place and appears in another is usually not a move
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._coordinateTolerance: int   = coordinateTolerance
+        self._timeTolerance:       float = timeTolerance
+        self._minimumMove:         int   = minimumMove
+
+        self._oldKeys:    List[int]                = []
+        self._newKeys:    List[int]                = []
+        self._oldNumbers: List[Tuple[float, ...]]  = []
+        self._newNumbers: List[Tuple[float, ...]]  = []
+
+    def diff(self, oldCommands: List[ScriptCommand], newCommands: List[ScriptCommand]) -> List[Change]:
+        """
+        Returns:  The changes in old recording order;  Moved runs are reported once, where they were removed
+        """
+        self._prepare(oldCommands=oldCommands, newCommands=newCommands)
+
+        matches: List[Match] = self._align()
+
+        removed:  List[Tuple[int, int]] = []
+        inserted: List[Tuple[int, int]] = []
+        previousOld: int = 0
+        previousNew: int = 0
+        for oldIndex, newIndex in matches + [(len(oldCommands), len(newCommands))]:
+            if oldIndex > previousOld:
+                removed.append((previousOld, oldIndex))
+            if newIndex > previousNew:
+                inserted.append((previousNew, newIndex))
+            previousOld = oldIndex + 1
+            previousNew = newIndex + 1
+
+        return self._findMoves(removed=removed, inserted=inserted)
+
+    def format(self, changes: List[Change], oldCommands: List[ScriptCommand], newCommands: List[ScriptCommand], shown: int = DEFAULT_SHOWN_COMMANDS) -> List[str]:
+        """
+        One header line per change, with step numbers counted from 1, followed by the first few commands
+
+        Args:
+            changes:      From `diff`
+            oldCommands:  The old recording
+            newCommands:  The new recording
+            shown:        Commands listed per change
+
+        Returns:  The report lines
+        """
+        lines: List[str] = []
+        for change in changes:
+            marker: str = CHANGE_MARKERS[change.kind]
+            if change.kind == CHANGE_INSERTED:
+                header:   str                 = f'{marker} new {self._stepRange(change.newStart, change.newEnd)}'
+                commands: List[ScriptCommand] = newCommands[change.newStart:change.newEnd]
+            else:
+                header   = f'{marker} old {self._stepRange(change.oldStart, change.oldEnd)}'
+                commands = oldCommands[change.oldStart:change.oldEnd]
+                if change.kind == CHANGE_MOVED:
+                    header = f'{header} -> new {self._stepRange(change.newStart, change.newEnd)}'
+
+            lines.append(f'{header} ({change.size} steps)' if change.size > 1 else header)
+            for command in commands[:shown]:
+                lines.append(f'    {command.toStatement()}')
+            if len(commands) > shown:
+                lines.append(f'    ... {len(commands) - shown} more')
+
+        return lines
+
+    def _prepare(self, oldCommands: List[ScriptCommand], newCommands: List[ScriptCommand]):
+        """
+        Reduce each command to an integer key for its exact part and a tuple of its tolerant values;  Equality
+        is then an integer compare for all but clicks and sleeps
+        """
+        keyIds: Dict[Hashable, int] = {}
+
+        self._oldKeys, self._oldNumbers = self._encode(commands=oldCommands, keyIds=keyIds)
+        self._newKeys, self._newNumbers = self._encode(commands=newCommands, keyIds=keyIds)
+
+    def _encode(self, commands: List[ScriptCommand], keyIds: Dict[Hashable, int]) -> Tuple[List[int], List[Tuple[float, ...]]]:
+
+        keys:    List[int]               = []
+        numbers: List[Tuple[float, ...]] = []
+        for command in commands:
+            if command.name == CLICK:
+                exact:    Hashable            = (command.shape, tuple(value for name, value in command.keywords if name not in ('x', 'y')))
+                tolerant: Tuple[float, ...]   = (command.keyword('x', 0), command.keyword('y', 0))
+            elif command.name == SLEEP and len(command.arguments) == 1:
+                exact    = command.shape
+                tolerant = (command.arguments[0], )
+            else:
+                exact    = (command.name, command.arguments, command.keywords)
+                tolerant = ()
+            keys.append(keyIds.setdefault(exact, len(keyIds)))
+            numbers.append(tolerant)
+
+        return keys, numbers
+
+    def _equal(self, oldIndex: int, newIndex: int) -> bool:
+
+        if self._oldKeys[oldIndex] != self._newKeys[newIndex]:
+            return False
+
+        oldNumbers: Tuple[float, ...] = self._oldNumbers[oldIndex]
+        newNumbers: Tuple[float, ...] = self._newNumbers[newIndex]
+        if oldNumbers == newNumbers:
+            return True
+
+        tolerance: float = self._coordinateTolerance if len(oldNumbers) == 2 else self._timeTolerance
+
+        return all(abs(oldNumber - newNumber) <= tolerance for oldNumber, newNumber in zip(oldNumbers, newNumbers))
+
+    def _align(self) -> List[Match]:
+        """
+        Divide and conquer on the middle snake;  An explicit stack instead of recursion keeps
+        deep splits off the interpreter stack
+
+        Returns:  The matched index pairs in order
+        """
+        equal = self._equal
+
+        matches: List[Match] = []
+        boxes:   List[Box]   = [(0, len(self._oldKeys), 0, len(self._newKeys))]
+        while len(boxes) > 0:
+            oldStart, oldEnd, newStart, newEnd = boxes.pop()
+
+            while oldStart < oldEnd and newStart < newEnd and equal(oldStart, newStart):
+                matches.append((oldStart, newStart))
+                oldStart += 1
+                newStart += 1
+            while oldStart < oldEnd and newStart < newEnd and equal(oldEnd - 1, newEnd - 1):
+                matches.append((oldEnd - 1, newEnd - 1))
+                oldEnd -= 1
+                newEnd -= 1
+            if oldStart == oldEnd or newStart == newEnd:
+                continue
+
+            snakeOld, snakeNew, snakeOldEnd, snakeNewEnd = self._middleSnake(oldStart=oldStart, oldEnd=oldEnd, newStart=newStart, newEnd=newEnd)
+            for offset in range(snakeOldEnd - snakeOld):
+                matches.append((snakeOld + offset, snakeNew + offset))
+
+            if (snakeOld, snakeNew) == (oldStart, newStart) and (snakeOldEnd, snakeNewEnd) == (oldEnd, newEnd):
+                continue
+            boxes.append((oldStart, snakeOld, newStart, snakeNew))
+            boxes.append((snakeOldEnd, oldEnd, snakeNewEnd, newEnd))
+
+        matches.sort()
+
+        return matches
+
+    def _middleSnake(self, oldStart: int, oldEnd: int, newStart: int, newEnd: int) -> Box:
+        """
+        Runs the forward and the reverse greedy searches until their furthest reaching paths
+        overlap.  The overlapping snake lies on an optimal path and splits the problem in two
+
+        Returns:  The snake's start and end points as (old start, new start, old end, new end)
+        """
+        equal = self._equal
+
+        n:      int  = oldEnd - oldStart
+        m:      int  = newEnd - newStart
+        delta:  int  = n - m
+        odd:    bool = (delta & 1) == 1
+        maximum: int = (n + m + 1) // 2
+        offset: int  = maximum + 1
+
+        forward: List[int] = [0] * (2 * maximum + 3)
+        reverse: List[int] = [0] * (2 * maximum + 3)
+        for d in range(maximum + 1):
+            for k in range(-d, d + 1, 2):
+                if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                    x: int = forward[offset + k + 1]
+                else:
+                    x = forward[offset + k - 1] + 1
+                y:      int = x - k
+                startX: int = x
+                startY: int = y
+                while x < n and y < m and equal(oldStart + x, newStart + y):
+                    x += 1
+                    y += 1
+                forward[offset + k] = x
+                if odd is True and delta - (d - 1) <= k <= delta + (d - 1) and x + reverse[offset + delta - k] >= n:
+                    return oldStart + startX, newStart + startY, oldStart + x, newStart + y
+
+            for k in range(-d, d + 1, 2):
+                if k == -d or (k != d and reverse[offset + k - 1] < reverse[offset + k + 1]):
+                    x = reverse[offset + k + 1]
+                else:
+                    x = reverse[offset + k - 1] + 1
+                y      = x - k
+                startX = x
+                startY = y
+                while x < n and y < m and equal(oldEnd - x - 1, newEnd - y - 1):
+                    x += 1
+                    y += 1
+                reverse[offset + k] = x
+                if odd is False and -d <= delta - k <= d and x + forward[offset + delta - k] >= n:
+                    return oldEnd - x, newEnd - y, oldEnd - startX, newEnd - startY
+
+        return oldStart, newStart, oldStart, newStart
+
+    def _findMoves(self, removed: List[Tuple[int, int]], inserted: List[Tuple[int, int]]) -> List[Change]:
+        """
+        A removed run that equals an inserted run is a move.  Runs are bucketed by their exact
+        keys and length so only candidates that can match are compared
+        """
+        candidates: Dict[Tuple[int, ...], List[Tuple[int, int]]] = {}
+        for newStart, newEnd in inserted:
+            if newEnd - newStart < self._minimumMove:
+                continue
+            candidates.setdefault(tuple(self._newKeys[newStart:newEnd]), []).append((newStart, newEnd))
+
+        changes: List[Change]         = []
+        moved:   Set[Tuple[int, int]] = set()
+        for oldStart, oldEnd in removed:
+            destination: Tuple[int, int] = (-1, -1)
+            for newStart, newEnd in candidates.get(tuple(self._oldKeys[oldStart:oldEnd]), []):
+                if (newStart, newEnd) not in moved and all(self._equal(oldStart + offset, newStart + offset) for offset in range(oldEnd - oldStart)):
+                    destination = (newStart, newEnd)
+                    break
+            if destination == (-1, -1):
+                changes.append(Change(kind=CHANGE_REMOVED, oldStart=oldStart, oldEnd=oldEnd, newStart=-1, newEnd=-1))
+            else:
+                moved.add(destination)
+                changes.append(Change(kind=CHANGE_MOVED, oldStart=oldStart, oldEnd=oldEnd, newStart=destination[0], newEnd=destination[1]))
+
+        for newStart, newEnd in inserted:
+            if (newStart, newEnd) not in moved:
+                changes.append(Change(kind=CHANGE_INSERTED, oldStart=-1, oldEnd=-1, newStart=newStart, newEnd=newEnd))
+
+        return sorted(changes, key=lambda change: (change.oldStart if change.oldStart >= 0 else change.newStart, change.newStart))
+
+    def _stepRange(self, start: int, end: int) -> str:
+
+        return f'{start + 1}' if end - start == 1 else f'{start + 1}-{end}'
+
+
+def main():
+    """
+    Compares two transcribed scripts step by step
+    """
+    parser: ArgumentParser = ArgumentParser(description='Show the steps that changed between two recordings')
+    parser.add_argument('old', help='The earlier transcribed script')
+    parser.add_argument('new', help='The re-recorded script')
+    parser.add_argument('--tolerance',      type=int,   default=DEFAULT_COORDINATE_TOLERANCE, help='Pixels a click may move and still match')
+    parser.add_argument('--time-tolerance', dest='timeTolerance', type=float, default=DEFAULT_TIME_TOLERANCE, help='Seconds a sleep may change and still match')
+    parser.add_argument('--shown',          type=int,   default=DEFAULT_SHOWN_COMMANDS, help='Commands listed per change')
+    parser.add_argument('--json',           action='store_true', help='Print the changes as JSON')
+
+    arguments: Namespace = parser.parse_args()
+
+    startTime:    float               = perf_counter()
+    scriptParser: ScriptParser        = ScriptParser()
+    oldCommands:  List[ScriptCommand] = scriptParser.parseFile(arguments.old)
+    newCommands:  List[ScriptCommand] = scriptParser.parseFile(arguments.new)
+    parsed:       float               = perf_counter()
+
+    recordingDiff: RecordingDiff = RecordingDiff(coordinateTolerance=arguments.tolerance, timeTolerance=arguments.timeTolerance)
+    changes:       List[Change]  = recordingDiff.diff(oldCommands=oldCommands, newCommands=newCommands)
+    diffed:        float         = perf_counter()
+
+    if arguments.json is True:
+        report: List[Dict[str, Any]] = [change._asdict() for change in changes]
+        print(jsonDumps(report, indent=2))
+    else:
+        for line in recordingDiff.format(changes=changes, oldCommands=oldCommands, newCommands=newCommands, shown=arguments.shown):
+            print(line)
+        print(f'{len(changes)} changes between {len(oldCommands)} and {len(newCommands)} steps in {diffed - startTime:.2f}s '
+              f'(parsing {parsed - startTime:.2f}s, diffing {diffed - parsed:.2f}s)')
+
+
+if __name__ == '__main__':
+    main()
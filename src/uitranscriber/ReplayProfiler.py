@@ -0,0 +1,166 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import asdict
+from dataclasses import dataclass
+
+from json import dump as jsonDump
+
+from os import linesep as osLineSep
+
+from time import perf_counter
+
+from uitranscriber.ReplayRuntime import ReplayRuntime
+from uitranscriber.ReplayRuntime import addReplayArguments
+from uitranscriber.ReplayRuntime import runtimeFromArguments
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptDefinitions import SLEEP
+
+DEFAULT_SLOWEST_COUNT: int = 10
+
+
+@dataclass
+class StepTiming:
+    """
+    Where the time went for a single replayed step.  Times are in seconds;  Wall time
+    also includes the replay loop's own overhead
+    """
+    step:       int   = 0
+    lineNumber: int   = 0
+    statement:  str   = ''
+    actionTime: float = 0.0
+    pauseTime:  float = 0.0
+    wallTime:   float = 0.0
+
+
+class ReplayProfiler:
+    """
+    Replays through the runtime while timing every step.
+
+    The action time is the call into the replay backend (PyAutoGUI and the
+    application under test);  The pause time is the fixed pause, or the wait for the
+    screen to settle, that follows it.  A recorded `sleep` step is all pause
+    """
+    def __init__(self, runtime: ReplayRuntime):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._runtime: ReplayRuntime    = runtime
+        self._timings: List[StepTiming] = []
+
+    @property
+    def timings(self) -> List[StepTiming]:
+        return self._timings
+
+    def run(self) -> List[StepTiming]:
+
+        commands:    List[ScriptCommand] = self._runtime.table.toCommands()
+        lineNumbers: List[int]           = self._runtime.table.lineNumbers
+
+        self._timings = []
+        for idx, (function, arguments, keywords) in enumerate(self._runtime.actions):
+            startTime: float = perf_counter()
+            function(*arguments, **keywords)
+            actionEnd: float = perf_counter()
+            self._runtime.settle(keywords)
+            pauseEnd: float = perf_counter()
+
+            isSleep:    bool  = commands[idx].name == SLEEP
+            pauseStart: float = startTime if isSleep is True else actionEnd
+            self._timings.append(StepTiming(step=idx,
+                                            lineNumber=lineNumbers[idx],
+                                            statement=commands[idx].toStatement(),
+                                            actionTime=0.0 if isSleep is True else actionEnd - startTime,
+                                            pauseTime=pauseEnd - pauseStart,
+                                            wallTime=pauseEnd - startTime)
+                                 )
+        return self._timings
+
+    def saveReport(self, baseName: str, slowestCount: int = DEFAULT_SLOWEST_COUNT):
+        """
+        Writes <baseName>.json with every step and <baseName>.txt with the summary
+
+        Args:
+            baseName:      Report file name without the extension
+            slowestCount:  How many of the slowest steps to flag
+        """
+        slowest: List[StepTiming] = self.slowestSteps(slowestCount)
+
+        document: Dict[str, Any] = {
+            'totals':  self.totals(),
+            'slowest': [timing.step for timing in slowest],
+            'steps':   [asdict(timing) for timing in self._timings],
+        }
+        with open(f'{baseName}.json', 'w') as jsonFile:
+            jsonDump(document, jsonFile, indent=2)
+
+        with open(f'{baseName}.txt', 'w') as textFile:
+            textFile.write(self.summary(slowestCount))
+
+        self.logger.info(f'Replay profile written to {baseName}.json and {baseName}.txt')
+
+    def totals(self) -> Dict[str, float]:
+
+        return {
+            'steps':      len(self._timings),
+            'wallTime':   sum(timing.wallTime   for timing in self._timings),
+            'actionTime': sum(timing.actionTime for timing in self._timings),
+            'pauseTime':  sum(timing.pauseTime  for timing in self._timings),
+        }
+
+    def slowestSteps(self, count: int = DEFAULT_SLOWEST_COUNT) -> List[StepTiming]:
+
+        return sorted(self._timings, key=lambda timing: timing.actionTime, reverse=True)[:count]
+
+    def summary(self, slowestCount: int = DEFAULT_SLOWEST_COUNT) -> str:
+
+        totals:    Dict[str, float] = self.totals()
+        wallTime:  float            = totals['wallTime']
+        pauseTime: float            = totals['pauseTime']
+        pauseShare: float           = 0.0 if wallTime == 0 else 100.0 * pauseTime / wallTime
+
+        lines: List[str] = [
+            f'Steps:        {totals["steps"]}',
+            f'Wall time:    {wallTime:.3f}s',
+            f'Action time:  {totals["actionTime"]:.3f}s',
+            f'Pause time:   {pauseTime:.3f}s  ({pauseShare:.1f}% of wall time lost to pauses)',
+            '',
+            f'Slowest {slowestCount} steps by action time',
+            f'{"step":>7} {"line":>7} {"action":>9} {"pause":>9} {"wall":>9}  statement',
+        ]
+        for timing in self.slowestSteps(slowestCount):
+            lines.append(
+                f'{timing.step:>7} {timing.lineNumber:>7} {timing.actionTime:>9.4f} {timing.pauseTime:>9.4f} {timing.wallTime:>9.4f}  {timing.statement}'
+            )
+
+        return f'{osLineSep.join(lines)}{osLineSep}'
+
+
+def main():
+    """
+    Replays a sidecar table or a transcribed script and writes a timing report
+    """
+    parser: ArgumentParser = ArgumentParser(description='Replay a recording and report where the time goes')
+    addReplayArguments(parser)
+    parser.add_argument('--report',  default='replayProfile', help='Report file name without the extension')
+    parser.add_argument('--slowest', type=int, default=DEFAULT_SLOWEST_COUNT, help='How many of the slowest steps to flag')
+
+    arguments: Namespace = parser.parse_args()
+
+    profiler: ReplayProfiler = ReplayProfiler(runtime=runtimeFromArguments(arguments))
+    profiler.run()
+    profiler.saveReport(baseName=arguments.report, slowestCount=arguments.slowest)
+
+    print(profiler.summary(arguments.slowest))
+
+
+if __name__ == '__main__':
+    main()
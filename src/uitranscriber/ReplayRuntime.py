@@ -0,0 +1,176 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from time import sleep
+
+from uitranscriber.ClipboardPaste import ClipboardPaste
+from uitranscriber.ReplayTable import ReplayTable
+from uitranscriber.StabilityWaiter import DEFAULT_SETTLE_TIME
+from uitranscriber.StabilityWaiter import DEFAULT_TIMEOUT
+from uitranscriber.StabilityWaiter import StabilityWaiter
+from uitranscriber.ScriptDefinitions import CLICK
+from uitranscriber.ScriptDefinitions import PASTE
+from uitranscriber.ScriptDefinitions import PRESS
+from uitranscriber.ScriptDefinitions import SLEEP
+from uitranscriber.ScriptDefinitions import WRITE
+
+BACKEND_PYAUTOGUI: str = 'pyautogui'
+BACKEND_PYNPUT:    str = 'pynput'
+
+Action = Tuple[Callable[..., Any], List[Any], Dict[str, Any]]
+
+
+class ReplayRuntime:
+    """
+    Replays a ReplayTable.
+
+    The table is resolved once up front into (function, arguments, keywords)
+    triples so the replay loop does nothing but call and pause.  The runtime
+    does the pausing itself;  PyAutoGUI's own PAUSE is turned off.
+
+    With a stability waiter the fixed pause is replaced by waiting until the
+    screen around the action stops changing
+    """
+    def __init__(self, table: ReplayTable, backend: str = BACKEND_PYAUTOGUI, waiter: StabilityWaiter = None):
+        """
+        Args:
+            table:    The steps to replay
+            backend:  `pyautogui` or the faster `pynput`
+            waiter:   When set, wait for the screen to settle instead of pausing
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._table:   ReplayTable               = table
+        self._pause:   float                     = table.pause
+        self._waiter:  Optional[StabilityWaiter] = waiter
+        self._actions: List[Action] = self._resolveActions(table=table, functions=self._loadBackend(backend))
+
+    @property
+    def table(self) -> ReplayTable:
+        return self._table
+
+    @property
+    def actions(self) -> List[Action]:
+        return self._actions
+
+    @property
+    def pause(self) -> float:
+        return self._pause
+
+    def run(self):
+
+        if self._waiter is not None:
+            for function, arguments, keywords in self._actions:
+                function(*arguments, **keywords)
+                self._waiter.waitForStability(x=keywords.get('x'), y=keywords.get('y'))
+            return
+
+        pause: float = self._pause
+        for function, arguments, keywords in self._actions:
+            function(*arguments, **keywords)
+            if pause > 0:
+                sleep(pause)
+
+    def settle(self, keywords: Dict[str, Any]):
+        """
+        Whatever follows a step;  The fixed pause or the wait for the screen to settle
+
+        Args:
+            keywords:  The step's keyword arguments
+        """
+        if self._waiter is not None:
+            self._waiter.waitForStability(x=keywords.get('x'), y=keywords.get('y'))
+        elif self._pause > 0:
+            sleep(self._pause)
+
+    def _resolveActions(self, table: ReplayTable, functions: Dict[str, Callable[..., Any]]) -> List[Action]:
+
+        actions: List[Action] = []
+        for idx, (name, arguments, keywords) in enumerate(table.steps):
+            try:
+                function: Callable[..., Any] = functions[name]
+            except KeyError:
+                raise ValueError(f'Step {idx}: the {name} command cannot be replayed')
+            actions.append((function, arguments, keywords))
+
+        return actions
+
+    def _loadBackend(self, backend: str) -> Dict[str, Callable[..., Any]]:
+
+        if backend == BACKEND_PYAUTOGUI:
+            import pyautogui
+
+            pyautogui.PAUSE = 0.0
+            return {
+                CLICK: pyautogui.click,
+                WRITE: pyautogui.write,
+                PRESS: pyautogui.press,
+                PASTE: ClipboardPaste(hotkey=pyautogui.hotkey),
+                SLEEP: sleep,
+            }
+        elif backend == BACKEND_PYNPUT:
+            from uitranscriber.PynputReplayer import PynputReplayer
+
+            replayer: PynputReplayer = PynputReplayer()
+            return {
+                CLICK: replayer.click,
+                WRITE: replayer.write,
+                PRESS: replayer.press,
+                PASTE: ClipboardPaste(hotkey=replayer.hotkey),
+                SLEEP: sleep,
+            }
+        else:
+            raise ValueError(f'Unknown replay backend: {backend}')
+
+
+def addReplayArguments(parser: ArgumentParser):
+    """
+    The replay options shared by the command line tools that replay recordings
+    """
+    parser.add_argument('recording', help='A .json table or a transcribed .py script')
+    parser.add_argument('--backend',  choices=[BACKEND_PYAUTOGUI, BACKEND_PYNPUT], default=BACKEND_PYAUTOGUI)
+    parser.add_argument('--pause',    type=float, default=None, help='Seconds to pause after each step')
+    parser.add_argument('--adaptive', action='store_true', help='Wait for the screen to settle instead of pausing')
+    parser.add_argument('--settle',   type=float, default=DEFAULT_SETTLE_TIME, help='Seconds the screen must stay unchanged')
+    parser.add_argument('--timeout',  type=float, default=DEFAULT_TIMEOUT, help='Maximum seconds to wait for the screen to settle')
+
+
+def runtimeFromArguments(arguments: Namespace) -> ReplayRuntime:
+
+    table: ReplayTable = ReplayTable.fromFile(arguments.recording)
+    if arguments.pause is not None:
+        table = ReplayTable(steps=table.steps, pause=arguments.pause, lineNumbers=table.lineNumbers)
+
+    waiter: StabilityWaiter = cast(StabilityWaiter, None)
+    if arguments.adaptive is True:
+        from uitranscriber.ScreenFrameSource import ScreenFrameSource
+
+        waiter = StabilityWaiter(frameSource=ScreenFrameSource(), settleTime=arguments.settle, timeout=arguments.timeout)
+
+    return ReplayRuntime(table=table, backend=arguments.backend, waiter=waiter)
+
+
+def main():
+    """
+    Replays a sidecar table or a transcribed script through the runtime
+    """
+    parser: ArgumentParser = ArgumentParser(description='Replay a recording')
+    addReplayArguments(parser)
+
+    runtimeFromArguments(parser.parse_args()).run()
+
+
+if __name__ == '__main__':
+    main()
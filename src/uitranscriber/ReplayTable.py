@@ -0,0 +1,263 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from ast import AnnAssign
+from ast import Assign
+from ast import Attribute
+from ast import Call
+from ast import Constant
+from ast import Module
+from ast import Name
+from ast import literal_eval
+from ast import parse as astParse
+from ast import walk as astWalk
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from json import dump as jsonDump
+from json import dumps as jsonDumps
+from json import load as jsonLoad
+from json import loads as jsonLoads
+
+from os import linesep as osLineSep
+
+from pathlib import Path
+
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptDefinitions import DEFAULT_PAUSE
+from uitranscriber.ScriptParser import ScriptParser
+
+Step = Tuple[str, List[Any], Dict[str, Any]]
+
+JSON_SEPARATORS: Tuple[str, str] = (',', ':')
+
+TABLE_VERSION: int = 1
+
+TABLE_CONSTANT_NAME: str = 'STEPS'
+
+SIDECAR_SUFFIX: str = '.steps.json'
+
+TABLE_SCRIPT_HEADER: List[str] = [
+    f'#!/usr/bin/env python{osLineSep}',
+    f'# /// script{osLineSep}'
+    f'# dependencies = ["pyautogui", "pyperclip"]{osLineSep}'
+    f'# ///{osLineSep}'
+    f'"""{osLineSep}'
+    f'Replays with the uitranscriber replay runtime, which must already be importable;{osLineSep}'
+    f'Either install uitranscriber from its checkout and run{osLineSep}'
+    f'{osLineSep}'
+    f'python transcribed.py{osLineSep}'
+    f'{osLineSep}'
+    f'or, if you have `uv` installed, name the checkout when running it:{osLineSep}'
+    f'{osLineSep}'
+    f'uv run --with <uitranscriber checkout> transcribed.py{osLineSep}'
+    f'"""{osLineSep}'
+    f'{osLineSep}'
+    f'from uitranscriber.ReplayRuntime import ReplayRuntime{osLineSep}',
+    f'from uitranscriber.ReplayTable import ReplayTable{osLineSep}',
+    f'{osLineSep}'
+]
+
+
+class ReplayTable:
+    """
+    A recording saved as data instead of one Python statement per command.
+
+    Each step is [command name, positional arguments, keyword arguments] in JSON.
+    An embedded table is a JSON string literal, one step per line, so the script
+    compiles a single constant and json parses the steps at C speed;  Loading is
+    several times faster than compiling the equivalent statements
+    """
+    def __init__(self, steps: List[Step], pause: float = DEFAULT_PAUSE, lineNumbers: List[int] = None):
+        """
+        Args:
+            steps:        The table
+            pause:        Seconds to pause after each step
+            lineNumbers:  The script line each step came from, when the table was built from a script
+        """
+        self._steps:       List[Step] = steps
+        self._pause:       float      = pause
+        self._lineNumbers: List[int]  = [0] * len(steps) if lineNumbers is None else lineNumbers
+
+    @classmethod
+    def fromCommands(cls, commands: List[ScriptCommand], pause: float = DEFAULT_PAUSE) -> 'ReplayTable':
+
+        return cls(steps=[(command.name, list(command.arguments), dict(command.keywords)) for command in commands],
+                   pause=pause,
+                   lineNumbers=[command.lineNumber for command in commands])
+
+    @classmethod
+    def fromFile(cls, fileName: str) -> 'ReplayTable':
+        """
+        Args:
+            fileName:  A sidecar table, a table script written by `toScript` or a transcribed script
+
+        Exception: ValueError - When the file holds no steps
+        """
+        if fileName.endswith('.json'):
+            return cls.load(fileName)
+
+        scriptText: str = Path(fileName).read_text()
+
+        table: Optional[ReplayTable] = None
+        if cls.__name__ in scriptText:
+            table = cls._fromTableScript(scriptText=scriptText, scriptPath=Path(fileName))
+        if table is None:
+            scriptParser: ScriptParser        = ScriptParser()
+            commands:     List[ScriptCommand] = scriptParser.parse(scriptText)
+            table = cls.fromCommands(commands=commands, pause=DEFAULT_PAUSE if scriptParser.pause is None else scriptParser.pause)
+        if len(table.steps) == 0:
+            raise ValueError(f'{fileName} has no steps to replay')
+
+        return table
+
+    @classmethod
+    def _fromTableScript(cls, scriptText: str, scriptPath: Path) -> Optional['ReplayTable']:
+        """
+        A table script has no command calls of its own;  Its steps are the embedded `STEPS` constant or
+        the sidecar it loads
+
+        Returns:  The table or None when the script is not a table script
+        """
+        try:
+            tree: Module = astParse(scriptText)
+        except SyntaxError:
+            return None
+
+        steps:   Optional[str] = None
+        sidecar: Optional[str] = None
+        pause:   float         = DEFAULT_PAUSE
+        for statement in tree.body:
+            if isinstance(statement, Assign) and any(isinstance(target, Name) and target.id == TABLE_CONSTANT_NAME for target in statement.targets):
+                steps = literal_eval(statement.value)
+            elif isinstance(statement, AnnAssign) and isinstance(statement.target, Name) and statement.target.id == TABLE_CONSTANT_NAME and statement.value is not None:
+                steps = literal_eval(statement.value)
+
+        for node in astWalk(tree):
+            if isinstance(node, Call) and isinstance(node.func, Attribute):
+                if node.func.attr == cls.fromJson.__name__:
+                    pause = next((literal_eval(keyword.value) for keyword in node.keywords if keyword.arg == 'pause'), DEFAULT_PAUSE)
+                elif node.func.attr == 'with_name' and len(node.args) == 1 and isinstance(node.args[0], Constant) and isinstance(node.args[0].value, str):
+                    sidecar = node.args[0].value
+
+        if steps is not None:
+            return cls.fromJson(steps=steps, pause=pause)
+        if sidecar is not None:
+            return cls.load(str(scriptPath.with_name(sidecar)))
+
+        return None
+
+    @classmethod
+    def fromJson(cls, steps: str, pause: float = DEFAULT_PAUSE) -> 'ReplayTable':
+        """
+        Args:
+            steps:  The embedded table;  A JSON array of steps
+            pause:  Seconds to pause after each step
+        """
+        return cls(steps=jsonLoads(steps), pause=pause)
+
+    @classmethod
+    def load(cls, fileName: str) -> 'ReplayTable':
+        """
+        Args:
+            fileName:  A sidecar table written by `save`
+        """
+        with open(fileName, 'r') as tableFile:
+            document: Dict[str, Any] = jsonLoad(tableFile)
+
+        return cls(steps=document['steps'], pause=document['pause'])
+
+    @property
+    def steps(self) -> List[Step]:
+        return self._steps
+
+    @property
+    def pause(self) -> float:
+        return self._pause
+
+    @property
+    def lineNumbers(self) -> List[int]:
+        """
+        Returns:  The source line of each step;  0 when the step did not come from a script
+        """
+        return self._lineNumbers
+
+    def toCommands(self) -> List[ScriptCommand]:
+
+        return [
+            ScriptCommand(name=name, arguments=tuple(arguments), keywords=tuple(keywords.items()))
+            for name, arguments, keywords in self._steps
+        ]
+
+    def save(self, fileName: str):
+
+        document: Dict[str, Any] = {
+            'version': TABLE_VERSION,
+            'pause':   self._pause,
+            'steps':   self._steps,
+        }
+        with open(fileName, 'w') as tableFile:
+            jsonDump(document, tableFile, separators=JSON_SEPARATORS)
+
+    def toScript(self, sidecarFileName: str = '') -> str:
+        """
+        Args:
+            sidecarFileName:  When set the script loads this file, which must sit next to
+            the script, instead of embedding the table
+
+        Returns:  A script that replays the table with the replay runtime
+        """
+        lines: List[str] = list(TABLE_SCRIPT_HEADER)
+        if sidecarFileName == '':
+            lines.append(f'STEPS: str = ({osLineSep}')
+            lines.append(f"    '['{osLineSep}")
+            separator: str = ','
+            for idx, step in enumerate(self._steps):
+                if idx == len(self._steps) - 1:
+                    separator = ''
+                lines.append(f'    {jsonDumps(step, separators=JSON_SEPARATORS) + separator!r}{osLineSep}')
+            lines.append(f"    ']'{osLineSep}")
+            lines.append(f'){osLineSep}')
+            lines.append(osLineSep)
+            lines.append(f'ReplayRuntime(table=ReplayTable.fromJson(steps=STEPS, pause={self._pause!r})).run(){osLineSep}')
+        else:
+            lines.append(f'from pathlib import Path{osLineSep}')
+            lines.append(osLineSep)
+            lines.append(f'ReplayRuntime(table=ReplayTable.load(str(Path(__file__).with_name({sidecarFileName!r})))).run(){osLineSep}')
+
+        return ''.join(lines)
+
+
+def main():
+    """
+    Converts a transcribed script into a table script
+    """
+    parser: ArgumentParser = ArgumentParser(description='Convert a transcribed script to the data table format')
+    parser.add_argument('script', help='The transcribed script')
+    parser.add_argument('output', help='The table script to write')
+    parser.add_argument('--pause',   type=float, default=None, help="Seconds to pause after each step;  Defaults to the script's pyautogui.PAUSE")
+    parser.add_argument('--sidecar', action='store_true', help=f'Write the table to a {SIDECAR_SUFFIX} file next to the output')
+
+    arguments: Namespace = parser.parse_args()
+
+    table: ReplayTable = ReplayTable.fromFile(arguments.script)
+    if arguments.pause is not None:
+        table = ReplayTable(steps=table.steps, pause=arguments.pause, lineNumbers=table.lineNumbers)
+
+    outputPath:      Path = Path(arguments.output)
+    sidecarFileName: str  = ''
+    if arguments.sidecar is True:
+        sidecarFileName = f'{outputPath.stem}{SIDECAR_SUFFIX}'
+        table.save(str(outputPath.with_name(sidecarFileName)))
+
+    outputPath.write_text(table.toScript(sidecarFileName=sidecarFileName))
+    print(f'Wrote {len(table.steps)} steps to {outputPath}')
+
+
+if __name__ == '__main__':
+    main()
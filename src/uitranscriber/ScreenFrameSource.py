@@ -0,0 +1,30 @@
+
+from typing import Tuple
+
+from uitranscriber.FrameSource import FrameSource
+from uitranscriber.FrameSource import Region
+
+DEFAULT_DOWNSAMPLE_FACTOR: int = 4
+
+
+class ScreenFrameSource(FrameSource):
+    """
+    Captures the real display through PyAutoGUI's screenshot support (Pillow)
+    """
+    def __init__(self, downsampleFactor: int = DEFAULT_DOWNSAMPLE_FACTOR):
+
+        import pyautogui
+
+        self._pyautogui = pyautogui
+        self._downsampleFactor: int = downsampleFactor
+
+    def screenSize(self) -> Tuple[int, int]:
+
+        width, height = self._pyautogui.size()
+        return width, height
+
+    def grab(self, region: Region) -> bytes:
+
+        image = self._pyautogui.screenshot(region=region)
+
+        return image.convert('L').reduce(self._downsampleFactor).tobytes()
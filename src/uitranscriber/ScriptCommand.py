@@ -0,0 +1,67 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from dataclasses import dataclass
+from dataclasses import field
+
+Arguments = Tuple[Any, ...]
+Keywords  = Tuple[Tuple[str, Any], ...]
+
+Shape = Tuple[str, int, Tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class ScriptCommand:
+    """
+    A single PyAutoGUI call in a transcribed script, e.g. click(x=10, y=20)
+
+    The line number is informational only and does not participate in equality
+    """
+    name:       str
+    arguments:  Arguments = ()
+    keywords:   Keywords  = ()
+    lineNumber: int       = field(default=0, compare=False)
+
+    @property
+    def shape(self) -> Shape:
+        """
+        Returns:  The command name and argument layout without the argument values
+        """
+        return self.name, len(self.arguments), tuple(name for name, _ in self.keywords)
+
+    @property
+    def values(self) -> List[Any]:
+        """
+        Returns:  The positional values followed by the keyword values;  In `shape` order
+        """
+        return list(self.arguments) + [value for _, value in self.keywords]
+
+    def keyword(self, name: str, default: Any = None) -> Any:
+
+        for keywordName, value in self.keywords:
+            if keywordName == name:
+                return value
+        return default
+
+    def toStatement(self, substitutions: Dict[int, str] = None) -> str:
+        """
+        Args:
+            substitutions:  Maps a `values` index to a variable name to emit instead of the literal
+
+        Returns:  The Python statement that invokes this command
+        """
+        if substitutions is None:
+            substitutions = {}
+
+        parameters: List[str] = []
+        for idx, argument in enumerate(self.arguments):
+            parameters.append(substitutions.get(idx, repr(argument)))
+
+        offset: int = len(self.arguments)
+        for idx, (name, value) in enumerate(self.keywords):
+            parameters.append(f'{name}={substitutions.get(offset + idx, repr(value))}')
+
+        return f'{self.name}({", ".join(parameters)})'
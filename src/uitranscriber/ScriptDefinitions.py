@@ -0,0 +1,73 @@
+
+from typing import List
+
+from os import linesep as osLineSep
+
+from sys import platform
+
+CLICK: str = 'click'
+WRITE: str = 'write'
+PRESS: str = 'press'
+SLEEP: str = 'sleep'
+PASTE: str = 'paste'
+
+PRESSES_ARGUMENT: str = 'presses'
+CLICKS_ARGUMENT:  str = 'clicks'
+
+DEFAULT_PAUSE: float = 0.5
+#
+# Typed runs longer than this are replayed through the clipboard
+#
+DEFAULT_PASTE_THRESHOLD: int = 64
+
+PASTE_MODIFIER: str = 'command' if platform == 'darwin' else 'ctrl'
+
+"""
+From the command line and if you have `uv` installed
+you can execute this script as follow:
+
+uv run transcribed.py
+"""
+
+def scriptPreamble(pause: float = DEFAULT_PAUSE) -> List[str]:
+    """
+    Args:
+        pause:  The PyAutoGUI pause after each command
+
+    Returns:  The lines that start every transcribed script
+    """
+    return [
+        f'#!/usr/bin/env python{osLineSep}',
+        f'# /// script{osLineSep}'
+        f'# dependencies = ["pyautogui", "pyperclip"]{osLineSep}'
+        f'# ///{osLineSep}'
+        f'"""{osLineSep}'
+        f'From the command line and if you have `uv` installed{osLineSep}'
+        f'you can execute this script as follow:{osLineSep}'
+        f'{osLineSep}'
+        f'uv run transcribed.py{osLineSep}'
+        f'"""{osLineSep}'
+        f'{osLineSep}'
+        f'from sys import platform{osLineSep}'
+        f'from time import sleep{osLineSep}'
+        f'{osLineSep}'
+        f'import pyautogui{osLineSep}'
+        f'from pyautogui import write{osLineSep}'
+        f'from pyautogui import press{osLineSep}',
+        f'from pyautogui import click{osLineSep}',
+        f'from pyautogui import hotkey{osLineSep}'
+        f'from pyperclip import copy{osLineSep}'
+        f'{osLineSep}'
+        f'{osLineSep}'
+        f'pyautogui.PAUSE = {pause}{osLineSep}'
+        f'{osLineSep}'
+        f'{osLineSep}'
+        f'def paste(text: str):{osLineSep}'
+        f'    copy(text){osLineSep}'
+        f'    hotkey("command" if platform == "darwin" else "ctrl", "v"){osLineSep}'
+        f'{osLineSep}'
+        f'{osLineSep}'
+    ]
+
+
+SCRIPT_PREAMBLE: List[str] = scriptPreamble()
@@ -0,0 +1,294 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from ast import AST
+from ast import Assign
+from ast import Attribute
+from ast import Call
+from ast import Expr
+from ast import For
+from ast import Name
+from ast import Tuple as AstTuple
+from ast import parse as astParse
+from ast import literal_eval
+
+from re import Match
+from re import Pattern
+from re import compile as reCompile
+
+from uitranscriber.ScriptCommand import ScriptCommand
+
+Bindings = Dict[str, Any]
+
+LITERAL: str = (
+    r"'(?:[^'\\\n]|\\.)*'"
+    r'|"(?:[^"\\\n]|\\.)*"'
+    r'|-?(?:\d+\.\d*|\.\d+|[1-9]\d*|0)(?:[eE][-+]?\d+)?'
+    r'|True|False|None'
+)
+COMMAND_LINE: Pattern = reCompile(r'([A-Za-z_]\w*)\((.*)\)[ \t]*')
+ARGUMENT:     Pattern = reCompile(rf'[ \t]*(?:([A-Za-z_]\w*)[ \t]*=[ \t]*)?({LITERAL})[ \t]*(?:,|$)')
+CONSTANTS:    Dict[str, Any] = {'True': True, 'False': False, 'None': None}
+
+
+class ScriptParser:
+    """
+    Turns a transcribed script back into its sequence of commands.
+
+    Loops emitted by the loop compressor are unrolled so that the result is
+    always the flat sequence that was recorded.  Statements that are not command
+    calls (imports, assignments, the preamble) are ignored, except for the
+    `pyautogui.PAUSE` assignment, which is kept as the script's pause.
+
+    Scripts as the recorder writes them, a preamble followed by one command call per line,
+    take a fast path:  Only the preamble goes through `ast` and each command line is matched
+    with a regular expression.  Anything else after the preamble (a loop, a multi line call,
+    a non-literal argument) sends the whole script through `ast`
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._pause: Optional[float] = None
+
+    @property
+    def pause(self) -> Optional[float]:
+        """
+        Returns:  The `pyautogui.PAUSE` the last parsed script sets;  None when it does not set one
+        """
+        return self._pause
+
+    def parseFile(self, fileName: str) -> List[ScriptCommand]:
+
+        with open(fileName, 'r') as scriptFile:
+            return self.parse(scriptFile.read())
+
+    def parse(self, scriptText: str) -> List[ScriptCommand]:
+        """
+        Scripts produced before string literals were escaped may not compile;  In that
+        case fall back to parsing a line at a time and skip the lines that do not
+
+        Args:
+            scriptText:  The script source
+
+        Returns:  The commands in execution order
+        """
+        self._pause = None
+
+        flatCommands: Optional[List[ScriptCommand]] = self._parseFlat(scriptText)
+        if flatCommands is not None:
+            return flatCommands
+
+        self._pause = None
+        commands: List[ScriptCommand] = []
+        try:
+            for statement in astParse(scriptText).body:
+                self._parseStatement(statement=statement, bindings={}, commands=commands)
+        except SyntaxError as se:
+            self.logger.warning(f'Script does not compile, parsing line by line: {se}')
+            commands = self._parseLines(scriptText)
+
+        return commands
+
+    def parseStatement(self, statement: str, lineNumber: int = 0) -> Optional[ScriptCommand]:
+        """
+        Args:
+            statement:   A single line of a script, as the recorder reports it
+            lineNumber:  Where the line sits in the script
+
+        Returns:  The command or None if the line is not a single command call
+        """
+        flatCommand: Optional[ScriptCommand] = self._matchCommand(line=statement.strip(), lineNumber=lineNumber)
+        if flatCommand is not None:
+            return flatCommand
+        try:
+            statements = astParse(statement.strip()).body
+        except SyntaxError:
+            return None
+        if len(statements) != 1:
+            return None
+
+        commands: List[ScriptCommand] = []
+        statements[0].lineno = lineNumber
+        self._parseStatement(statement=statements[0], bindings={}, commands=commands)
+
+        return commands[0] if len(commands) == 1 else None
+
+    def _parseFlat(self, scriptText: str) -> Optional[List[ScriptCommand]]:
+        """
+        Returns:  The commands;  None when the script is not a preamble followed by command lines
+        """
+        lines:        List[str] = scriptText.splitlines()
+        firstCommand: int       = next((idx for idx, line in enumerate(lines) if COMMAND_LINE.fullmatch(line) is not None), len(lines))
+
+        commands: List[ScriptCommand] = []
+        try:
+            for statement in astParse('\n'.join(lines[:firstCommand])).body:
+                self._parseStatement(statement=statement, bindings={}, commands=commands)
+        except SyntaxError:
+            return None
+
+        for lineNumber, line in enumerate(lines[firstCommand:], start=firstCommand + 1):
+            stripped: str = line.strip()
+            if stripped == '' or stripped.startswith('#'):
+                continue
+            command: Optional[ScriptCommand] = self._matchCommand(line=line, lineNumber=lineNumber)
+            if command is None:
+                return None
+            commands.append(command)
+
+        return commands
+
+    def _matchCommand(self, line: str, lineNumber: int) -> Optional[ScriptCommand]:
+        """
+        Args:
+            line:        A top level line;  Indented lines never match
+            lineNumber:  Where the line sits in the script
+
+        Returns:  The command or None if the line is not a call with only literal arguments
+        """
+        commandLine: Optional[Match] = COMMAND_LINE.fullmatch(line)
+        if commandLine is None:
+            return None
+
+        argumentText: str                   = commandLine.group(2)
+        arguments:    List[Any]             = []
+        keywords:     List[Tuple[str, Any]] = []
+        position:     int                   = 0
+        while position < len(argumentText):
+            argument: Optional[Match] = ARGUMENT.match(argumentText, position)
+            if argument is None or argument.end() == position:
+                return None
+            name: Optional[str] = argument.group(1)
+            if name is None:
+                if len(keywords) > 0:
+                    return None
+                arguments.append(self._literalValue(argument.group(2)))
+            else:
+                if any(name == keywordName for keywordName, _ in keywords):
+                    return None
+                keywords.append((name, self._literalValue(argument.group(2))))
+            position = argument.end()
+            if argumentText[position - 1] != ',':
+                break
+        #
+        # A trailing comma is allowed;  Anything else left over is not a literal argument
+        #
+        if argumentText[position:].strip() != '':
+            return None
+
+        return ScriptCommand(name=commandLine.group(1), arguments=tuple(arguments), keywords=tuple(keywords), lineNumber=lineNumber)
+
+    def _literalValue(self, literal: str) -> Any:
+
+        if literal[0] in '\'"':
+            if '\\' in literal:
+                return literal_eval(literal)
+            return literal[1:-1]
+        if literal in CONSTANTS:
+            return CONSTANTS[literal]
+        if any(character in literal for character in '.eE'):
+            return float(literal)
+
+        return int(literal)
+
+    def _parseLines(self, scriptText: str) -> List[ScriptCommand]:
+
+        commands: List[ScriptCommand] = []
+        for lineNumber, line in enumerate(scriptText.splitlines(), start=1):
+            try:
+                statements = astParse(line.strip()).body
+            except SyntaxError:
+                self.logger.debug(f'Skipped line {lineNumber}: {line}')
+                continue
+            for statement in statements:
+                statement.lineno = lineNumber
+                self._parseStatement(statement=statement, bindings={}, commands=commands)
+
+        return commands
+
+    def _parseStatement(self, statement: AST, bindings: Bindings, commands: List[ScriptCommand]):
+
+        if isinstance(statement, Expr) and isinstance(statement.value, Call):
+            command: Optional[ScriptCommand] = self._toCommand(call=statement.value, bindings=bindings, lineNumber=statement.lineno)
+            if command is not None:
+                commands.append(command)
+        elif isinstance(statement, For):
+            self._unrollLoop(loop=statement, bindings=bindings, commands=commands)
+        elif isinstance(statement, Assign) and self._isPauseTarget(statement) is True:
+            try:
+                self._pause = float(literal_eval(statement.value))
+            except (ValueError, TypeError):
+                self.logger.warning(f'Line {statement.lineno}: pyautogui.PAUSE is not a literal number')
+
+    def _isPauseTarget(self, assignment: Assign) -> bool:
+
+        return any(
+            isinstance(target, Attribute) and target.attr == 'PAUSE' and isinstance(target.value, Name) and target.value.id == 'pyautogui'
+            for target in assignment.targets
+        )
+
+    def _toCommand(self, call: Call, bindings: Bindings, lineNumber: int) -> Optional[ScriptCommand]:
+
+        if not isinstance(call.func, Name):
+            return None
+        try:
+            arguments = tuple(self._evaluate(node=argument, bindings=bindings) for argument in call.args)
+            keywords  = tuple((cast(str, keyword.arg), self._evaluate(node=keyword.value, bindings=bindings)) for keyword in call.keywords)
+        except ValueError:
+            self.logger.debug(f'Line {lineNumber}: {call.func.id} has non-literal arguments')
+            return None
+
+        return ScriptCommand(name=call.func.id, arguments=arguments, keywords=keywords, lineNumber=lineNumber)
+
+    def _unrollLoop(self, loop: For, bindings: Bindings, commands: List[ScriptCommand]):
+        """
+        Only the loop shapes the compressor emits are understood;  for over range(n) and
+        for over a literal list of values or tuples
+        """
+        try:
+            iterable:    List[Any] = self._evaluateIterable(loop.iter)
+            targetNames: List[str] = self._targetNames(loop.target)
+        except ValueError:
+            self.logger.warning(f'Line {loop.lineno}: skipped loop that is not over literal data')
+            return
+
+        for item in iterable:
+            iterationBindings: Bindings = dict(bindings)
+            if len(targetNames) == 1:
+                iterationBindings[targetNames[0]] = item
+            else:
+                iterationBindings.update(zip(targetNames, item))
+            for statement in loop.body:
+                self._parseStatement(statement=statement, bindings=iterationBindings, commands=commands)
+
+    def _evaluateIterable(self, node: AST) -> List[Any]:
+
+        if isinstance(node, Call) and isinstance(node.func, Name) and node.func.id == 'range':
+            return list(range(*[literal_eval(argument) for argument in node.args]))
+
+        return list(literal_eval(node))
+
+    def _targetNames(self, target: AST) -> List[str]:
+
+        if isinstance(target, Name):
+            return [target.id]
+        if isinstance(target, AstTuple):
+            return [cast(Name, element).id for element in target.elts]
+
+        raise ValueError(f'Unsupported loop target: {target}')
+
+    def _evaluate(self, node: AST, bindings: Bindings) -> Any:
+
+        if isinstance(node, Name) and node.id in bindings:
+            return bindings[node.id]
+
+        return literal_eval(node)
@@ -0,0 +1,290 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from ast import AST
+from ast import Call
+from ast import Expr
+from ast import For
+from ast import Name
+from ast import parse as astParse
+
+from hashlib import sha256
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from time import perf_counter
+
+from zlib import crc32
+
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptDefinitions import CLICK
+from uitranscriber.ScriptParser import ScriptParser
+
+OBJECTS_DIRECTORY:    str = 'objects'
+RECORDINGS_DIRECTORY: str = 'recordings'
+MANIFEST_SUFFIX:      str = '.json'
+
+DEFAULT_MINIMUM_SEGMENT: int = 8
+DEFAULT_AVERAGE_SEGMENT: int = 32
+DEFAULT_MAXIMUM_SEGMENT: int = 256
+
+
+class SegmentStore:
+    """
+    Stores recordings as references to content addressed segments, so the preamble and the
+    flows that many recordings share (logging in, navigating to the screen under test) are
+    stored once.
+
+    A recording is split into its preamble and its steps, the top level statements from the
+    first command call or loop on.  Each step keeps its source text, including the comments and
+    blank lines that follow it, so a regenerated script is the script that was added.  Segments
+    end at step boundaries (before a click) chosen by the content of the click itself, so an edit
+    early in a recording does not shift the boundaries after it and identical flows produce identical
+    segments wherever they occur.  Each segment is stored under the SHA-256 of its text;  A
+    recording's manifest lists the hashes.  Regenerated scripts reuse segment text already read,
+    so storing and regenerating cost the unique content rather than the total
+    """
+    def __init__(self, directory: str,
+                 minimumSegment: int = DEFAULT_MINIMUM_SEGMENT,
+                 averageSegment: int = DEFAULT_AVERAGE_SEGMENT,
+                 maximumSegment: int = DEFAULT_MAXIMUM_SEGMENT):
+        """
+        Args:
+            directory:       The store's root
+            minimumSegment:  Steps before a segment may end
+            averageSegment:  On average one click in this many ends a segment
+            maximumSegment:  Steps after which a segment ends regardless
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._directory:      Path = Path(directory)
+        self._objects:        Path = self._directory / OBJECTS_DIRECTORY
+        self._recordings:     Path = self._directory / RECORDINGS_DIRECTORY
+        self._minimumSegment: int  = minimumSegment
+        self._averageSegment: int  = averageSegment
+        self._maximumSegment: int  = maximumSegment
+
+        self._segmentText: Dict[str, str] = {}
+        """
+        Segment text by hash;  Everything this store has read or written
+        """
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._recordings.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def recordingNames(self) -> List[str]:
+        return sorted(manifest.stem for manifest in self._recordings.glob(f'*{MANIFEST_SUFFIX}'))
+
+    def add(self, name: str, scriptText: str) -> List[str]:
+        """
+        Args:
+            name:        The recording's name in the store
+            scriptText:  The transcribed script
+
+        Returns:  The segment hashes;  The preamble first
+        """
+        commands: List[ScriptCommand] = ScriptParser().parse(scriptText)
+
+        preamble, steps = self._splitSteps(scriptText=scriptText, commands=commands)
+
+        hashes: List[str] = [self._storeSegment(preamble)]
+        for start, end in self.segmentBoundaries(steps):
+            hashes.append(self._storeSegment(''.join(steps[start:end])))
+
+        manifest: Dict[str, Any] = {'name': name, 'commands': len(commands), 'segments': hashes}
+        (self._recordings / f'{name}{MANIFEST_SUFFIX}').write_text(jsonDumps(manifest, indent=2))
+
+        return hashes
+
+    def addFile(self, fileName: str) -> List[str]:
+
+        scriptPath: Path = Path(fileName)
+
+        return self.add(name=scriptPath.stem, scriptText=scriptPath.read_text())
+
+    def script(self, name: str) -> str:
+        """
+        Returns:  The recording's script, regenerated from its segments
+        """
+        manifest: Dict[str, Any] = jsonLoads((self._recordings / f'{name}{MANIFEST_SUFFIX}').read_text())
+
+        return ''.join(self._loadSegment(segmentHash) for segmentHash in manifest['segments'])
+
+    def export(self, outputDirectory: str) -> int:
+        """
+        Regenerates every recording as a script in the output directory
+
+        Returns:  The number of scripts written
+        """
+        outputPath: Path = Path(outputDirectory)
+        outputPath.mkdir(parents=True, exist_ok=True)
+
+        names: List[str] = self.recordingNames
+        for name in names:
+            (outputPath / f'{name}.py').write_text(self.script(name))
+
+        return len(names)
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Returns:  The recordings, the segments they reference and what is actually stored
+        """
+        referenced:     int = 0
+        referencedSize: int = 0
+        for name in self.recordingNames:
+            manifest: Dict[str, Any] = jsonLoads((self._recordings / f'{name}{MANIFEST_SUFFIX}').read_text())
+            for segmentHash in manifest['segments']:
+                referenced     += 1
+                referencedSize += self._objectPath(segmentHash).stat().st_size
+
+        storedObjects: List[Path] = [objectPath for objectPath in self._objects.glob('*/*') if objectPath.is_file()]
+
+        return {
+            'recordings':         len(self.recordingNames),
+            'referencedSegments': referenced,
+            'uniqueSegments':     len(storedObjects),
+            'logicalBytes':       referencedSize,
+            'storedBytes':        sum(objectPath.stat().st_size for objectPath in storedObjects),
+        }
+
+    def segmentBoundaries(self, steps: List[str]) -> List[Tuple[int, int]]:
+        """
+        A segment ends before a click whose step text's CRC falls on the divisor, once the
+        segment has the minimum length, or once it reaches the maximum.  CRC rather than `hash`
+        because string hashes change from one process to the next
+
+        Args:
+            steps:  The source text of each step
+
+        Returns:  Half open step ranges
+        """
+        boundaries: List[Tuple[int, int]] = []
+
+        start: int = 0
+        for index, step in enumerate(steps):
+            length: int = index - start
+            if length >= self._maximumSegment:
+                boundaries.append((start, index))
+                start = index
+            elif step.startswith(f'{CLICK}(') and length >= self._minimumSegment and crc32(step.encode()) % self._averageSegment == 0:
+                boundaries.append((start, index))
+                start = index
+
+        if start < len(steps):
+            boundaries.append((start, len(steps)))
+
+        return boundaries
+
+    def _splitSteps(self, scriptText: str, commands: List[ScriptCommand]) -> Tuple[str, List[str]]:
+        """
+        The preamble ends at the first top level command call or loop;  A compressed script may
+        start with a loop, whose first command sits on the line after the `for`.  Every top level
+        statement from there on is a step that runs until the next one starts
+
+        Args:
+            scriptText:  The transcribed script
+            commands:    Its parsed commands;  Where the steps start when the script does not compile
+
+        Returns:  The preamble and the text of each step;  Joined, they are the script
+        """
+        lines: List[str] = scriptText.split('\n')
+        lines = [f'{line}\n' for line in lines[:-1]] + ([lines[-1]] if lines[-1] != '' else [])
+
+        starts: List[int] = []
+        try:
+            for statement in astParse(scriptText).body:
+                if (len(starts) > 0 or self._isStep(statement) is True) and statement.lineno not in starts:
+                    starts.append(statement.lineno)
+        except SyntaxError:
+            #
+            # The parser fell back to reading a line at a time;  Every command it found is on a line of its own
+            #
+            starts = sorted(set(command.lineNumber for command in commands))
+
+        if len(starts) == 0:
+            return scriptText, []
+
+        ends:  List[int] = starts[1:] + [len(lines) + 1]
+        steps: List[str] = [''.join(lines[start - 1:end - 1]) for start, end in zip(starts, ends)]
+
+        return ''.join(lines[:starts[0] - 1]), steps
+
+    def _isStep(self, statement: AST) -> bool:
+
+        if isinstance(statement, For):
+            return True
+
+        return isinstance(statement, Expr) and isinstance(statement.value, Call) and isinstance(statement.value.func, Name)
+
+    def _storeSegment(self, text: str) -> str:
+
+        segmentHash: str = sha256(text.encode()).hexdigest()
+        if segmentHash not in self._segmentText:
+            objectPath: Path = self._objectPath(segmentHash)
+            if objectPath.exists() is False:
+                objectPath.parent.mkdir(exist_ok=True)
+                #
+                # Write then rename so a reader never sees a partial object under its hash
+                #
+                partialPath: Path = objectPath.with_suffix('.partial')
+                partialPath.write_text(text)
+                partialPath.replace(objectPath)
+            self._segmentText[segmentHash] = text
+
+        return segmentHash
+
+    def _loadSegment(self, segmentHash: str) -> str:
+
+        if segmentHash not in self._segmentText:
+            self._segmentText[segmentHash] = self._objectPath(segmentHash).read_text()
+
+        return self._segmentText[segmentHash]
+
+    def _objectPath(self, segmentHash: str) -> Path:
+        return self._objects / segmentHash[:2] / segmentHash[2:]
+
+
+def main():
+
+    parser: ArgumentParser = ArgumentParser(description='Store recordings as shared, deduplicated segments')
+    parser.add_argument('store', help='The store directory')
+
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    addParser: ArgumentParser = commands.add_parser('add', help='Add transcribed scripts;  Each is named after its file')
+    addParser.add_argument('scripts', nargs='+')
+
+    exportParser: ArgumentParser = commands.add_parser('export', help='Regenerate every recording as a script')
+    exportParser.add_argument('outputDirectory')
+
+    commands.add_parser('stats', help='Show how much the segments are shared')
+
+    arguments: Namespace    = parser.parse_args()
+    store:     SegmentStore = SegmentStore(arguments.store)
+    startTime: float        = perf_counter()
+
+    if arguments.command == 'add':
+        for script in arguments.scripts:
+            store.addFile(script)
+        print(f'Added {len(arguments.scripts)} recordings in {perf_counter() - startTime:.2f}s')
+    elif arguments.command == 'export':
+        count: int = store.export(arguments.outputDirectory)
+        print(f'Regenerated {count} recordings in {perf_counter() - startTime:.2f}s')
+    else:
+        print(jsonDumps(store.statistics(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+
+from typing import Callable
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from time import perf_counter
+from time import sleep
+
+from uitranscriber.FrameSource import FrameSource
+from uitranscriber.FrameSource import Region
+
+DEFAULT_SETTLE_TIME:    float = 0.15
+DEFAULT_TIMEOUT:        float = 5.0
+DEFAULT_POLL_INTERVAL:  float = 0.03
+DEFAULT_REGION_SIZE:    int   = 400
+DEFAULT_TOLERANCE:      float = 0.002
+
+Clock = Callable[[], float]
+Sleeper = Callable[[float], None]
+
+
+class StabilityWaiter:
+    """
+    Replaces the fixed pause after a replayed action with a wait until the screen
+    stops changing.
+
+    Captures are compared within a region centered on the action (the whole screen
+    when the action has no coordinates).  The screen is stable once no capture has
+    changed for the settle time.  A capture counts as changed when more than the
+    tolerance fraction of its downsampled pixels differ, so a blinking caret does not
+    keep the wait going until the timeout
+    """
+    def __init__(self, frameSource: FrameSource,
+                 settleTime:   float = DEFAULT_SETTLE_TIME,
+                 timeout:      float = DEFAULT_TIMEOUT,
+                 pollInterval: float = DEFAULT_POLL_INTERVAL,
+                 regionSize:   int   = DEFAULT_REGION_SIZE,
+                 tolerance:    float = DEFAULT_TOLERANCE,
+                 clock:        Clock   = perf_counter,
+                 sleeper:      Sleeper = sleep):
+        """
+        Args:
+            frameSource:   Where captures come from
+            settleTime:    Seconds the region must stay unchanged
+            timeout:       Give up waiting after this many seconds
+            pollInterval:  Seconds between captures
+            regionSize:    Width and height of the region around the action
+            tolerance:     Fraction of pixels allowed to differ between captures that count as unchanged
+            clock:         Time source;  Replaceable along with the sleeper for synthetic frame sources
+            sleeper:       Sleeps between captures
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._frameSource:  FrameSource = frameSource
+        self._settleTime:   float       = settleTime
+        self._timeout:      float       = timeout
+        self._pollInterval: float       = pollInterval
+        self._regionSize:   int         = regionSize
+        self._tolerance:    float       = tolerance
+        self._clock:        Clock       = clock
+        self._sleeper:      Sleeper     = sleeper
+
+        self._screenSize: Tuple[int, int] = frameSource.screenSize()
+
+    def waitForStability(self, x: int = None, y: int = None) -> bool:
+        """
+        Args:
+            x:  Horizontal position of the action, if it has one
+            y:  Vertical position of the action, if it has one
+
+        Returns:  True if the screen settled, False if the wait timed out
+        """
+        region:    Region = self.regionAround(x=x, y=y)
+        startTime: float  = self._clock()
+
+        previous:    bytes = self._frameSource.grab(region)
+        stableSince: float = startTime
+        while True:
+            self._sleeper(self._pollInterval)
+            now:     float = self._clock()
+            current: bytes = self._frameSource.grab(region)
+            if self._changed(previous=previous, current=current) is True:
+                previous    = current
+                stableSince = now
+            elif now - stableSince >= self._settleTime:
+                return True
+
+            if now - startTime >= self._timeout:
+                self.logger.warning(f'Screen did not settle within {self._timeout}s around {region}')
+                return False
+
+    def regionAround(self, x: int = None, y: int = None) -> Region:
+
+        screenWidth, screenHeight = self._screenSize
+        if x is None or y is None:
+            return 0, 0, screenWidth, screenHeight
+
+        width:  int = min(self._regionSize, screenWidth)
+        height: int = min(self._regionSize, screenHeight)
+        left:   int = min(max(0, x - width // 2), screenWidth - width)
+        top:    int = min(max(0, y - height // 2), screenHeight - height)
+
+        return left, top, width, height
+
+    def _changed(self, previous: bytes, current: bytes) -> bool:
+
+        if previous == current:
+            return False
+        if self._tolerance <= 0.0:
+            return True
+
+        differing: int = sum(1 for before, after in zip(previous, current) if before != after)
+
+        return differing > self._tolerance * len(current)
@@ -0,0 +1,123 @@
+
+from typing import List
+
+
+class SuffixArray:
+    """
+    Suffix array over a sequence of integer tokens with constant time longest common
+    prefix queries between any two suffixes.
+
+    Construction is prefix doubling, O(n log n) sorts on integer keys, followed by
+    Kasai's LCP array and a sparse table for range minimum queries
+    """
+    def __init__(self, tokens: List[int]):
+
+        self._size:     int       = len(tokens)
+        self._suffixes: List[int] = self._buildSuffixes(tokens)
+        self._ranks:    List[int] = [0] * self._size
+
+        for rank, suffix in enumerate(self._suffixes):
+            self._ranks[suffix] = rank
+
+        self._sparseTable: List[List[int]] = self._buildSparseTable(self._buildLcp(tokens))
+
+    @property
+    def suffixes(self) -> List[int]:
+        return self._suffixes
+
+    def longestCommonPrefix(self, first: int, second: int) -> int:
+        """
+        Args:
+            first:   Start of the first suffix
+            second:  Start of the second suffix
+
+        Returns:  The number of leading tokens the two suffixes have in common
+        """
+        if first == second:
+            return self._size - first
+        if first >= self._size or second >= self._size:
+            return 0
+
+        low:  int = self._ranks[first]
+        high: int = self._ranks[second]
+        if low > high:
+            low, high = high, low
+        #
+        # lcp[r] holds the LCP of the suffixes ranked r - 1 and r
+        #
+        low += 1
+        level: int = (high - low + 1).bit_length() - 1
+        row:   List[int] = self._sparseTable[level]
+
+        return min(row[low], row[high - (1 << level) + 1])
+
+    def _buildSuffixes(self, tokens: List[int]) -> List[int]:
+
+        size: int = self._size
+        if size == 0:
+            return []
+
+        alphabet: List[int] = sorted(set(tokens))
+        compact = {token: idx for idx, token in enumerate(alphabet)}
+
+        ranks:    List[int] = [compact[token] for token in tokens]
+        suffixes: List[int] = list(range(size))
+        width:    int       = 1
+        while True:
+            keys: List[int] = [
+                rank * (size + 1) + (ranks[idx + width] + 1 if idx + width < size else 0)
+                for idx, rank in enumerate(ranks)
+            ]
+            suffixes.sort(key=keys.__getitem__)
+
+            newRanks:     List[int] = [0] * size
+            currentRank:  int       = 0
+            previousKey:  int       = keys[suffixes[0]]
+            for suffix in suffixes:
+                key: int = keys[suffix]
+                if key != previousKey:
+                    currentRank += 1
+                    previousKey = key
+                newRanks[suffix] = currentRank
+
+            ranks = newRanks
+            if currentRank == size - 1 or width >= size:
+                break
+            width <<= 1
+
+        return suffixes
+
+    def _buildLcp(self, tokens: List[int]) -> List[int]:
+        """
+        Kasai et al.
+
+        Returns:  lcp[r] is the LCP of the suffixes ranked r - 1 and r;  lcp[0] is zero
+        """
+        size:   int       = self._size
+        ranks:  List[int] = self._ranks
+        lcp:    List[int] = [0] * size
+        common: int       = 0
+        for suffix in range(size):
+            rank: int = ranks[suffix]
+            if rank == 0:
+                common = 0
+                continue
+            previous: int = self._suffixes[rank - 1]
+            while suffix + common < size and previous + common < size and tokens[suffix + common] == tokens[previous + common]:
+                common += 1
+            lcp[rank] = common
+            if common > 0:
+                common -= 1
+
+        return lcp
+
+    def _buildSparseTable(self, lcp: List[int]) -> List[List[int]]:
+
+        table: List[List[int]] = [lcp]
+        span:  int             = 1
+        while span * 2 <= len(lcp):
+            previous: List[int] = table[-1]
+            table.append(list(map(min, previous[:-span], previous[span:])))
+            span *= 2
+
+        return table
@@ -0,0 +1,222 @@
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from bisect import bisect_left
+from bisect import bisect_right
+
+from dataclasses import dataclass
+
+from re import Match
+from re import compile as reCompile
+from re import Pattern
+
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptDefinitions import CLICK
+from uitranscriber.ScriptDefinitions import PASTE
+from uitranscriber.ScriptDefinitions import PRESS
+from uitranscriber.ScriptDefinitions import WRITE
+
+GRID_CELL_SIZE:        int = 64
+DEFAULT_SEARCH_RADIUS: int = 24
+
+COORDINATES_QUERY: Pattern = reCompile(r'^(\d+)\s*[, ]\s*(\d+)$')
+TIME_QUERY:        Pattern = reCompile(r'^@(\d+(?:\.\d+)?)(?:-(\d+(?:\.\d+)?))?$')
+OCCURRENCE_QUERY:  Pattern = reCompile(r'^(.*?)\s*#(\d+)$')
+
+GridCell = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """
+    Where a recorded command sits in the transcript
+    """
+    command:    ScriptCommand
+    position:   int
+    length:     int
+    lineNumber: int
+    timeStamp:  float
+
+
+class TranscriptIndex:
+    """
+    Indexes the transcript as commands are recorded so that searches never rescan
+    the text.
+
+    Commands are indexed by name, by key (pressed keys and the words of typed text),
+    by a grid bucket of click coordinates and by time stamp.  Every index is append
+    only and in recording order, so adding a command is O(1) and lookups cost only
+    the size of the answer
+    """
+    def __init__(self):
+
+        self._entries:    List[IndexEntry]           = []
+        self._byName:     Dict[str, List[int]]       = {}
+        self._byKey:      Dict[str, List[int]]       = {}
+        self._byNameKey:  Dict[Tuple[str, str], List[int]] = {}
+        self._byCell:     Dict[GridCell, List[int]]  = {}
+        self._timeStamps: List[float]                = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def entries(self) -> List[IndexEntry]:
+        return self._entries
+
+    def clear(self):
+
+        self._entries    = []
+        self._byName     = {}
+        self._byKey      = {}
+        self._byNameKey  = {}
+        self._byCell     = {}
+        self._timeStamps = []
+
+    def add(self, command: ScriptCommand, position: int, length: int, timeStamp: float) -> int:
+        """
+        Args:
+            command:    The recorded command
+            position:   Where its text starts in the transcript
+            length:     The length of its text
+            timeStamp:  Seconds since recording started;  Must not decrease
+
+        Returns:  The command's index
+        """
+        entryIndex: int = len(self._entries)
+
+        self._entries.append(IndexEntry(command=command, position=position, length=length, lineNumber=command.lineNumber, timeStamp=timeStamp))
+        self._timeStamps.append(timeStamp)
+        self._byName.setdefault(command.name, []).append(entryIndex)
+
+        if command.name == CLICK:
+            x: int = command.keyword('x', 0)
+            y: int = command.keyword('y', 0)
+            self._byCell.setdefault(self._cellOf(x=x, y=y), []).append(entryIndex)
+        elif command.name == PRESS and len(command.arguments) > 0:
+            self._addKey(name=command.name, key=str(command.arguments[0]).lower(), entryIndex=entryIndex)
+        elif command.name in (WRITE, PASTE) and len(command.arguments) > 0:
+            for word in set(str(command.arguments[0]).lower().split()):
+                self._addKey(name=command.name, key=word, entryIndex=entryIndex)
+
+        return entryIndex
+
+    def commandsNamed(self, name: str) -> List[int]:
+        return self._byName.get(name, [])
+
+    def commandsWithKey(self, key: str, name: str = '') -> List[int]:
+        """
+        Args:
+            key:   A key name or a typed word
+            name:  Only the commands with this name;  Empty for all
+
+        Returns:  The presses of a key and the typed text containing the word, in recording order
+        """
+        if name == '':
+            return self._byKey.get(key.lower(), [])
+
+        return self._byNameKey.get((name, key.lower()), [])
+
+    def clicksNear(self, x: int, y: int, radius: int = DEFAULT_SEARCH_RADIUS) -> List[int]:
+        """
+        Returns:  The clicks within the radius, nearest first
+        """
+        low:  GridCell = self._cellOf(x=x - radius, y=y - radius)
+        high: GridCell = self._cellOf(x=x + radius, y=y + radius)
+
+        found: List[Tuple[int, int]] = []
+        for cellX in range(low[0], high[0] + 1):
+            for cellY in range(low[1], high[1] + 1):
+                for entryIndex in self._byCell.get((cellX, cellY), []):
+                    command:  ScriptCommand = self._entries[entryIndex].command
+                    distance: int           = (command.keyword('x', 0) - x) ** 2 + (command.keyword('y', 0) - y) ** 2
+                    if distance <= radius * radius:
+                        found.append((distance, entryIndex))
+
+        return [entryIndex for _, entryIndex in sorted(found)]
+
+    def commandsBetween(self, startTime: float, endTime: float) -> List[int]:
+
+        return list(range(bisect_left(self._timeStamps, startTime), bisect_right(self._timeStamps, endTime)))
+
+    def search(self, query: str, name: str = '') -> List[int]:
+        """
+        Queries:
+            812,440        clicks near a point, nearest first
+            @12.5          the first command at or after 12.5 seconds
+            @10-20         commands between 10 and 20 seconds
+            press enter    presses of a key;  `key enter` also finds typed words
+            write          every command with that name
+            hello          typed text containing the word
+
+        Args:
+            query:  The search text
+            name:   Restrict the results to commands with this name;  Empty for all
+
+        Returns:  Matching command indices
+        """
+        query = query.strip()
+
+        coordinates: Optional[Match] = COORDINATES_QUERY.match(query)
+        timeRange:   Optional[Match] = TIME_QUERY.match(query)
+        if coordinates is not None:
+            results: List[int] = self.clicksNear(x=int(coordinates.group(1)), y=int(coordinates.group(2)))
+        elif timeRange is not None:
+            startTime: float = float(timeRange.group(1))
+            if timeRange.group(2) is None:
+                first: int = bisect_left(self._timeStamps, startTime)
+                results = [first] if first < len(self._entries) else []
+            else:
+                results = self.commandsBetween(startTime=startTime, endTime=float(timeRange.group(2)))
+        else:
+            words: List[str] = query.split()
+            if len(words) == 0:
+                results = []
+            elif len(words) == 1 and words[0].lower() in self._byName:
+                results = self.commandsNamed(words[0].lower())
+            elif len(words) == 2 and words[0].lower() in self._byName:
+                results = self.commandsWithKey(key=words[1], name=words[0].lower())
+            elif len(words) == 2 and words[0].lower() == 'key':
+                results = self.commandsWithKey(words[1])
+            else:
+                #
+                # Intersect starting from the rarest word so the work is bounded by the smallest posting list
+                #
+                postings: List[List[int]] = sorted((self.commandsWithKey(word) for word in words), key=len)
+                results = [entryIndex for entryIndex in postings[0] if all(self._contains(posting, entryIndex) for posting in postings[1:])]
+
+        if name != '':
+            results = [entryIndex for entryIndex in results if self._entries[entryIndex].command.name == name]
+
+        return results
+
+    def parseOccurrence(self, query: str) -> Tuple[str, int]:
+        """
+        Splits a trailing occurrence selector from a query;  `press enter #3` is the third enter press
+
+        Returns:  The query without the selector and the zero based occurrence
+        """
+        occurrence: Optional[Match] = OCCURRENCE_QUERY.match(query.strip())
+        if occurrence is None:
+            return query, 0
+
+        return occurrence.group(1), max(0, int(occurrence.group(2)) - 1)
+
+    def _addKey(self, name: str, key: str, entryIndex: int):
+
+        self._byKey.setdefault(key, []).append(entryIndex)
+        self._byNameKey.setdefault((name, key), []).append(entryIndex)
+
+    def _contains(self, posting: List[int], entryIndex: int) -> bool:
+        """
+        Postings are in recording order, so membership is a binary search
+        """
+        position: int = bisect_left(posting, entryIndex)
+
+        return position < len(posting) and posting[position] == entryIndex
+
+    def _cellOf(self, x: int, y: int) -> GridCell:
+        return x // GRID_CELL_SIZE, y // GRID_CELL_SIZE
@@ -0,0 +1,43 @@
+
+from dataclasses import dataclass
+
+from uitranscriber.ScriptDefinitions import DEFAULT_PASTE_THRESHOLD
+from uitranscriber.ScriptDefinitions import DEFAULT_PAUSE
+
+PAUSE_POLICY_FIXED:    str = 'fixed'
+PAUSE_POLICY_RECORDED: str = 'recorded'
+
+
+@dataclass
+class TranscriptionSettings:
+    """
+    How the InputMonitor coalesces input events into commands
+    """
+    flushThreshold:      int   = 0
+    """
+    Write the buffered characters once there are this many;  0 buffers until the next click
+    """
+    pasteThreshold:      int   = DEFAULT_PASTE_THRESHOLD
+    """
+    Typed runs longer than this are replayed by pasting from the clipboard;  0 always types
+    """
+    doubleClickWindow:   float = 0.0
+    """
+    Seconds within which clicks at the same spot merge into one click with a count;  0 never merges
+    """
+    doubleClickDistance: int   = 4
+    """
+    Pixels a click may drift and still merge with the previous one
+    """
+    pause:               float = DEFAULT_PAUSE
+    """
+    The fixed PyAutoGUI pause written into the script preamble
+    """
+    pausePolicy:         str   = PAUSE_POLICY_FIXED
+    """
+    `fixed` relies on the preamble pause alone;  `recorded` also sleeps for idle gaps longer than the minimum gap
+    """
+    minimumGap:          float = 1.0
+    """
+    Seconds of recorded idle time that produce a sleep under the `recorded` policy
+    """
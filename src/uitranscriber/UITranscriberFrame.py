@@ -1,25 +1,52 @@
 
+from typing import List
+from typing import Optional
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
+from pathlib import Path
+
+from signal import Signals
+from signal import signal
+
+from shutil import copytree
+from shutil import rmtree
+
+from tempfile import mkdtemp
+
+from time import perf_counter
+
 from wx import FD_CHANGE_DIR
 from wx import FD_OVERWRITE_PROMPT
 from wx import FD_SAVE
 from wx import FileSelector
 from wx import ID_ANY
 from wx import EVT_BUTTON
+from wx import EVT_CHECKBOX
 from wx import EVT_CLOSE
+from wx import EVT_CHOICE
+from wx import EVT_MENU
+from wx import ITEM_CHECK
+from wx import EVT_SEARCH
+from wx import EVT_TEXT_ENTER
 from wx import BORDER_THEME
 from wx import TE_MULTILINE
 from wx import DEFAULT_FRAME_STYLE
 from wx import FRAME_FLOAT_ON_PARENT
 from wx import STB_DEFAULT_STYLE
+from wx import TE_PROCESS_ENTER
 
 from wx import Size
 from wx import Point
 from wx import BitmapButton
+from wx import CheckBox
+from wx import Menu
+from wx import MenuBar
+from wx import MenuItem
+from wx import Choice
+from wx import SearchCtrl
 from wx import TextCtrl
 from wx import CommandEvent
 
@@ -28,12 +55,39 @@ from wx import CallAfter as wxCallAfter
 from wx.lib.sized_controls import SizedFrame
 from wx.lib.sized_controls import SizedPanel
 
+from uitranscriber.CheckpointRecorder import CHECKPOINT_DIRECTORY_SUFFIX
+from uitranscriber.CheckpointRecorder import CheckpointRecorder
+from uitranscriber.EventLog import EVENT_LOG_SUFFIX
+from uitranscriber.EventLog import EventLog
 from uitranscriber.InputMonitor import InputMonitor
+from uitranscriber.LoopCompressor import LoopCompressor
+from uitranscriber.RecorderProfiler import RecorderProfiler
+from uitranscriber.ReplayTable import ReplayTable
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptDefinitions import CLICK
+from uitranscriber.ScriptDefinitions import DEFAULT_PASTE_THRESHOLD
+from uitranscriber.ScriptDefinitions import PASTE
+from uitranscriber.ScriptDefinitions import PRESS
+from uitranscriber.ScriptDefinitions import SLEEP
+from uitranscriber.ScriptDefinitions import WRITE
+from uitranscriber.ScriptDefinitions import SCRIPT_PREAMBLE
+from uitranscriber.ScriptParser import ScriptParser
+from uitranscriber.TranscriptIndex import IndexEntry
+from uitranscriber.TranscriptIndex import TranscriptIndex
+from uitranscriber.TranscriptionSettings import TranscriptionSettings
 from uitranscriber.resources.stop import embeddedImage as stopImage
 from uitranscriber.resources.save import embeddedImage as saveImage
 from uitranscriber.resources.record import embeddedImage as recordImage
 from uitranscriber.resources.clear import embeddedImage as clearImage
 
+ALL_COMMANDS: str = 'All'
+
+SEARCH_HELP: str = (
+    'Search the transcript:  x,y finds clicks near a point;  @12 or @10-20 finds commands by '
+    'recorded second;  press enter finds key presses;  a command name finds every one of them;  '
+    'other words find typed text.  End with #n to jump to the nth match;  Enter again jumps to the next'
+)
+
 
 class UITranscriberFrame(SizedFrame):
     """
@@ -59,10 +113,41 @@ class UITranscriberFrame(SizedFrame):
         self._saveButton:   BitmapButton = cast(BitmapButton, None)
         self._clearButton:  BitmapButton = cast(BitmapButton, None)
 
+        self._compressLoops: CheckBox = cast(CheckBox, None)
+        self._dataTable:     CheckBox = cast(CheckBox, None)
+        self._saveRawEvents: CheckBox = cast(CheckBox, None)
+        self._checkpoints:   CheckBox = cast(CheckBox, None)
+        self._pasteText:     CheckBox = cast(CheckBox, None)
+        #
+        # Pasting is opt in for live recording;  The input monitor reads these settings as it records
+        #
+        self._transcriptionSettings: TranscriptionSettings = TranscriptionSettings(pasteThreshold=0)
+
+        self._checkpointRecorder: Optional[CheckpointRecorder] = None
+
+        self._recorderProfiler: RecorderProfiler = RecorderProfiler()
+        self._profileMenuItem:  MenuItem         = cast(MenuItem, None)
+        self._layoutMenuBar()
+
+        self._searchControl: SearchCtrl = cast(SearchCtrl, None)
+        self._searchFilter:  Choice     = cast(Choice, None)
+
+        self._transcriptIndex: TranscriptIndex = TranscriptIndex()
+        self._scriptParser:    ScriptParser    = ScriptParser()
+        self._lineCount:       int             = 0
+        self._startTime:       float           = perf_counter()
+        self._searchQuery:     str             = ''
+        self._searchResults:   List[int]       = []
+        self._searchPosition:  int             = 0
+        """
+        The current search;  Repeating it steps through the results instead of searching again
+        """
+        self._layoutSearch(sizedPanel)
         self._recordText: TextCtrl = self._layoutRecordTextControl(sizedPanel)
+        self._layoutOptions(sizedPanel)
         self._layoutRecorderButtons(sizedPanel)
 
-        self._inputMonitor: InputMonitor = InputMonitor(reportCB=self._listenReporting)
+        self._inputMonitor: InputMonitor = InputMonitor(reportCB=self._listenReporting, settings=self._transcriptionSettings)
         self._inputMonitor.recording = False
         self._setButtonState()
 
@@ -73,12 +158,23 @@ class UITranscriberFrame(SizedFrame):
         self.Bind(EVT_BUTTON, self._onSave,   self._saveButton)
         self.Bind(EVT_BUTTON, self._onClear,  self._clearButton)
 
+        self.Bind(EVT_CHECKBOX, self._onPasteText, self._pasteText)
+        self.Bind(EVT_CHECKBOX, self._onSaveRawEvents, self._saveRawEvents)
+
+        self.Bind(EVT_SEARCH,     self._onSearch, self._searchControl)
+        self.Bind(EVT_TEXT_ENTER, self._onSearch, self._searchControl)
+        self.Bind(EVT_CHOICE,     self._onSearch, self._searchFilter)
+
         self.Bind(EVT_CLOSE, self.Close)
+        self.Bind(EVT_MENU,  self._onToggleProfiling, self._profileMenuItem)
+        self._installProfilingSignal()
 
     def Close(self, force: bool = False) -> bool:
         """
         Closing handler overload. Save files and ask for confirmation.
         """
+        self._discardCheckpoints()
+        self._recorderProfiler.stop()
         self.Destroy()
         return True
 
@@ -89,10 +185,39 @@ class UITranscriberFrame(SizedFrame):
         Args:
             event:
         """
+        if self._checkpoints.GetValue() is True and self._checkpointRecorder is None:
+            try:
+                self._checkpointRecorder = CheckpointRecorder(directory=mkdtemp(prefix='uitranscriber-'))
+            except ImportError as e:
+                self._checkpoints.SetValue(False)
+                self.SetStatusText(f'Checkpoints need PyAutoGUI and Pillow: {e}')
+                self.logger.error(f'Recording without checkpoints: {e}')
+        if self._checkpointRecorder is not None:
+            self._inputMonitor.stepCB = self._checkpointRecorder.checkpoint
+
         self._inputMonitor.recording = True
         self.logger.warning(f'Start recording')
         self._setButtonState()
 
+    # noinspection PyUnusedLocal
+    def _onPasteText(self, event: CommandEvent):
+        """
+        Takes effect from the next typed run
+        Args:
+            event:
+        """
+        self._transcriptionSettings.pasteThreshold = DEFAULT_PASTE_THRESHOLD if self._pasteText.GetValue() is True else 0
+
+    # noinspection PyUnusedLocal
+    def _onSaveRawEvents(self, event: CommandEvent):
+        """
+        The input monitor only keeps the events while the raw event log is wanted;  The log
+        starts from when this is checked
+        Args:
+            event:
+        """
+        self._inputMonitor.keepRawEvents = self._saveRawEvents.GetValue()
+
     # noinspection PyUnusedLocal
     def _onStop(self, event: CommandEvent):
         """
@@ -101,6 +226,7 @@ class UITranscriberFrame(SizedFrame):
             event:
         """
         self._inputMonitor.recording = False
+        self._inputMonitor.stepCB    = None
         self._setButtonState()
 
     # noinspection PyUnusedLocal
@@ -112,14 +238,132 @@ class UITranscriberFrame(SizedFrame):
                                      wildcard=wildCard,
                                      flags=FD_SAVE | FD_OVERWRITE_PROMPT | FD_CHANGE_DIR
                                      )
+        if fileName == '':
+            return
+
+        if self._dataTable.GetValue() is True:
+            self._saveDataTable(fileName)
+        elif self._compressLoops.GetValue() is True:
+            self._saveCompressed(fileName)
+        else:
+            self._recordText.SaveFile(fileName)
 
-        self._recordText.SaveFile(fileName)
+        if self._saveRawEvents.GetValue() is True:
+            EventLog.save(fileName=f'{Path(fileName).with_suffix("")}{EVENT_LOG_SUFFIX}', events=self._inputMonitor.rawEvents)
+
+        if self._checkpointRecorder is not None:
+            self._saveCheckpoints(fileName)
+
+    def _saveCheckpoints(self, fileName: str):
+        """
+        Finish the pending captures and move the screenshots next to the script
+
+        Args:
+            fileName:  The script file name
+        """
+        recorder: CheckpointRecorder = cast(CheckpointRecorder, self._checkpointRecorder)
+        self._checkpointRecorder = None
+
+        recorder.stop()
+        copytree(recorder.directory, f'{Path(fileName).with_suffix("")}{CHECKPOINT_DIRECTORY_SUFFIX}', dirs_exist_ok=True)
+        rmtree(recorder.directory, ignore_errors=True)
+
+    def _discardCheckpoints(self):
+
+        if self._checkpointRecorder is not None:
+            self._checkpointRecorder.stop()
+            rmtree(self._checkpointRecorder.directory, ignore_errors=True)
+            self._checkpointRecorder = None
+
+    def _saveCompressed(self, fileName: str):
+        """
+        Regenerate the script from the recorded commands with the repeated runs as loops
+
+        Args:
+            fileName:  The script file name
+        """
+        commands: List[ScriptCommand] = ScriptParser().parse(self._recordText.GetValue())
+        lines:    List[str]           = LoopCompressor().compress(commands)
+
+        with open(fileName, 'w') as scriptFile:
+            scriptFile.writelines(SCRIPT_PREAMBLE)
+            scriptFile.writelines(lines)
+
+    def _saveDataTable(self, fileName: str):
+        """
+        Save the recorded commands as an embedded table that the replay runtime executes
+
+        Args:
+            fileName:  The script file name
+        """
+        commands: List[ScriptCommand] = ScriptParser().parse(self._recordText.GetValue())
+
+        with open(fileName, 'w') as scriptFile:
+            scriptFile.write(ReplayTable.fromCommands(commands).toScript())
 
     # noinspection PyUnusedLocal
     def _onClear(self, event: CommandEvent):
         self._recordText.Clear()
+        self._inputMonitor.clearRawEvents()
+        self._discardCheckpoints()
+        self._transcriptIndex.clear()
+        self._lineCount   = 0
+        self._startTime   = perf_counter()
+        self._searchQuery = ''
         self._inputMonitor.loadPreamble()
 
+    # noinspection PyUnusedLocal
+    def _onSearch(self, event: CommandEvent):
+        """
+        Answers from the transcript index;  The text itself is never scanned
+        """
+        query:      str = self._searchControl.GetValue().strip()
+        filterName: str = self._searchFilter.GetStringSelection()
+        searchKey:  str = f'{filterName}:{query}'
+        if query == '':
+            return
+
+        if searchKey == self._searchQuery and len(self._searchResults) > 0:
+            self._searchPosition = (self._searchPosition + 1) % len(self._searchResults)
+        else:
+            startTime: float = perf_counter()
+
+            terms, occurrence = self._transcriptIndex.parseOccurrence(query)
+
+            self._searchQuery    = searchKey
+            self._searchResults  = self._transcriptIndex.search(terms, name='' if filterName == ALL_COMMANDS else filterName)
+            self._searchPosition = min(occurrence, max(0, len(self._searchResults) - 1))
+            self.logger.debug(f'{query=} {len(self._searchResults)} matches in {(perf_counter() - startTime) * 1000:.2f} ms')
+
+        if len(self._searchResults) == 0:
+            self.SetStatusText(f'No matches for {query}')
+        else:
+            entry: IndexEntry = self._transcriptIndex.entries[self._searchResults[self._searchPosition]]
+
+            self._recordText.ShowPosition(entry.position)
+            self._recordText.SetSelection(entry.position, entry.position + entry.length)
+            self.SetStatusText(f'Match {self._searchPosition + 1} of {len(self._searchResults)};  Line {entry.lineNumber}')
+
+    # noinspection PyUnusedLocal
+    def _onToggleProfiling(self, event: Optional[CommandEvent]):
+        """
+        Starting profiling from here means cProfile traces the UI thread
+        """
+        reports: List[Path] = self._recorderProfiler.toggle()
+
+        self._profileMenuItem.Check(self._recorderProfiler.active)
+        if self._recorderProfiler.active is True:
+            self.SetStatusText('Profiling')
+        else:
+            self.SetStatusText(f'Profile written to {reports[0].parent}')
+
+    def _installProfilingSignal(self):
+        """
+        `kill -USR1 <pid>` toggles profiling without touching the UI;  There is no SIGUSR1 on Windows
+        """
+        if 'SIGUSR1' in Signals.__members__:
+            signal(Signals['SIGUSR1'], lambda signalNumber, frame: wxCallAfter(self._onToggleProfiling, None))
+
     def _getFrameStyle(self) -> int:
         """
         wxPython 4.2.4 update:  using FRAME_TOOL_WINDOW causes the title to be above the toolbar
@@ -155,6 +399,51 @@ class UITranscriberFrame(SizedFrame):
         textControl.SetEditable(False)
         return textControl
 
+    def _layoutMenuBar(self):
+
+        toolsMenu: Menu = Menu()
+        self._profileMenuItem = toolsMenu.Append(ID_ANY, 'Profile Recorder\tCtrl-Shift-P', 'Profile and trace allocations until toggled off', ITEM_CHECK)
+
+        menuBar: MenuBar = MenuBar()
+        menuBar.Append(toolsMenu, '&Tools')
+        self.SetMenuBar(menuBar)
+
+    def _layoutSearch(self, sizedPanel: SizedPanel):
+
+        searchPanel: SizedPanel = SizedPanel(sizedPanel)
+        searchPanel.SetSizerType('horizontal')
+        searchPanel.SetSizerProps(expand=True, proportion=0)
+
+        self._searchControl = SearchCtrl(searchPanel, ID_ANY, style=TE_PROCESS_ENTER)
+        self._searchControl.SetSizerProps(expand=True, proportion=1)
+        self._searchControl.SetDescriptiveText('812,440  @12  press enter #3')
+        self._searchControl.SetToolTip(SEARCH_HELP)
+
+        self._searchFilter = Choice(searchPanel, ID_ANY, choices=[ALL_COMMANDS, CLICK, WRITE, PASTE, PRESS, SLEEP])
+        self._searchFilter.SetSelection(0)
+        self._searchFilter.SetToolTip('Only match this kind of command')
+
+    def _layoutOptions(self, sizedPanel: SizedPanel):
+
+        optionsPanel: SizedPanel = SizedPanel(sizedPanel)
+        optionsPanel.SetSizerType('horizontal')
+        optionsPanel.SetSizerProps(expand=False, proportion=0, halign='right')
+
+        self._compressLoops = CheckBox(optionsPanel, ID_ANY, label='Compress loops')
+        self._compressLoops.SetToolTip('Save repeated commands as for loops')
+
+        self._dataTable = CheckBox(optionsPanel, ID_ANY, label='Data table')
+        self._dataTable.SetToolTip('Save the commands as a table replayed by the uitranscriber runtime')
+
+        self._saveRawEvents = CheckBox(optionsPanel, ID_ANY, label='Raw events')
+        self._saveRawEvents.SetToolTip(f'Also save the input events recorded while this is checked to a {EVENT_LOG_SUFFIX} file')
+
+        self._checkpoints = CheckBox(optionsPanel, ID_ANY, label='Checkpoints')
+        self._checkpoints.SetToolTip(f'Capture the screen at each click;  Saved to a {CHECKPOINT_DIRECTORY_SUFFIX} directory')
+
+        self._pasteText = CheckBox(optionsPanel, ID_ANY, label='Paste long text')
+        self._pasteText.SetToolTip(f'Replay typed runs longer than {DEFAULT_PASTE_THRESHOLD} characters by pasting them from the clipboard')
+
     def _layoutRecorderButtons(self, sizedPanel: SizedPanel):
         buttonPanel: SizedPanel = SizedPanel(sizedPanel, style=BORDER_THEME)
         buttonPanel.SetSizerType('horizontal')
@@ -174,6 +463,25 @@ class UITranscriberFrame(SizedFrame):
 
         self.logger.debug(f'{self._lastInsertionPosition=}')
         self._recordText.AppendText(recordedCommand)
+        self._indexCommand(recordedCommand)
+
+    def _indexCommand(self, recordedCommand: str):
+        """
+        Keeps the transcript index current;  Preamble chunks are not commands and only advance the line count
+
+        Args:
+            recordedCommand:  The text just appended to the transcript
+        """
+        lineNumber: int = self._lineCount + 1
+        self._lineCount += recordedCommand.count('\n')
+
+        command: Optional[ScriptCommand] = self._scriptParser.parseStatement(recordedCommand, lineNumber=lineNumber)
+        if command is not None:
+            self._searchQuery = ''
+            self._transcriptIndex.add(command=command,
+                                      position=self._lastInsertionPosition,
+                                      length=len(recordedCommand.rstrip()),
+                                      timeStamp=perf_counter() - self._startTime)
 
     def _setButtonState(self):
         """
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Times replaying a 2 KB typed run as write() and as paste() against stubbed pyautogui and
+pyperclip modules, so it runs anywhere without touching the display or the clipboard.
+
+The stubs follow PyAutoGUI's shape:  write() presses every character (a key down and a key up
+each) and hotkey() presses its keys in turn;  Each key event costs `--key-event` seconds and
+PyAutoGUI's pause follows each call.  The statements timed are the ones the transcriber writes,
+run under the transcribed script preamble
+
+    PYTHONPATH=src python -m tests.PasteBenchmark
+"""
+from typing import List
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from sys import modules
+
+from time import perf_counter
+from time import sleep
+
+from types import ModuleType
+
+from uitranscriber.ScriptDefinitions import PASTE
+from uitranscriber.ScriptDefinitions import WRITE
+from uitranscriber.ScriptDefinitions import scriptPreamble
+
+DEFAULT_PAYLOAD_SIZE: int   = 2048
+DEFAULT_KEY_EVENT:    float = 0.0002
+DEFAULT_REPEATS:      int   = 5
+
+
+def stubModules(keyEvent: float, pause: float) -> List[str]:
+    """
+    Returns:  The clipboard contents the paste stub copied, in order
+    """
+    clipboard: List[str] = []
+
+    def keyEvents(count: int):
+        sleep(count * keyEvent)
+
+    def write(message: str, interval: float = 0.0):
+        for _ in message:
+            keyEvents(2)
+            if interval > 0.0:
+                sleep(interval)
+        sleep(pause)
+
+    def press(keys: str, presses: int = 1, interval: float = 0.0):
+        keyEvents(2 * presses)
+        sleep(pause)
+
+    def click(*args, **kwargs):
+        keyEvents(2)
+        sleep(pause)
+
+    def hotkey(*keys: str):
+        keyEvents(2 * len(keys))
+        sleep(pause)
+
+    pyautogui: ModuleType = ModuleType('pyautogui')
+    pyautogui.write  = write      # type: ignore[attr-defined]
+    pyautogui.press  = press      # type: ignore[attr-defined]
+    pyautogui.click  = click      # type: ignore[attr-defined]
+    pyautogui.hotkey = hotkey     # type: ignore[attr-defined]
+
+    pyperclip: ModuleType = ModuleType('pyperclip')
+    pyperclip.copy = clipboard.append   # type: ignore[attr-defined]
+
+    modules['pyautogui'] = pyautogui
+    modules['pyperclip'] = pyperclip
+
+    return clipboard
+
+
+def timeStatement(statement: str, repeats: int) -> float:
+    """
+    Returns:  The best of the repeats, in seconds
+    """
+    namespace: dict = {}
+    exec(''.join(scriptPreamble(pause=0.0)), namespace)
+
+    code = compile(statement, '<benchmark>', 'exec')
+    best: float = float('inf')
+    for _ in range(repeats):
+        startTime: float = perf_counter()
+        exec(code, namespace)
+        best = min(best, perf_counter() - startTime)
+
+    return best
+
+
+def main():
+
+    parser: ArgumentParser = ArgumentParser(description='Time write against paste for a long typed run')
+    parser.add_argument('--size',      type=int,   default=DEFAULT_PAYLOAD_SIZE, help='Characters in the typed run')
+    parser.add_argument('--key-event', dest='keyEvent', type=float, default=DEFAULT_KEY_EVENT, help='Seconds each stubbed key event takes')
+    parser.add_argument('--pause',     type=float, default=0.0,                  help='Seconds the stubbed PyAutoGUI pauses after each call')
+    parser.add_argument('--repeats',   type=int,   default=DEFAULT_REPEATS)
+
+    arguments: Namespace = parser.parse_args()
+    clipboard: List[str] = stubModules(keyEvent=arguments.keyEvent, pause=arguments.pause)
+    payload:   str       = ('The quick brown fox jumps over the lazy dog. ' * (arguments.size // 45 + 1))[:arguments.size]
+
+    writeTime: float = timeStatement(f'{WRITE}({payload!r})', repeats=arguments.repeats)
+    pasteTime: float = timeStatement(f'{PASTE}({payload!r})', repeats=arguments.repeats)
+
+    assert clipboard[-1] == payload, 'paste did not copy the payload'
+
+    print(f'{arguments.size} characters;  {arguments.keyEvent * 1000:.2f}ms per key event')
+    print(f'write: {writeTime * 1000:9.2f}ms')
+    print(f'paste: {pasteTime * 1000:9.2f}ms  ({writeTime / pasteTime:.0f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
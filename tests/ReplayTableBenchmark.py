@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Compares the startup and per-step overhead of a transcribed statement script with the
+same recording saved as a data table and replayed by the ReplayRuntime.
+
+Both scripts run against stubbed pyautogui and pyperclip modules whose functions do nothing,
+so only the script's own overhead is timed:  Compiling it, then loading and dispatching its
+steps.  The pause is 0 in both
+
+    PYTHONPATH=src python -m tests.ReplayTableBenchmark
+"""
+from typing import List
+from typing import Tuple
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from random import Random
+
+from sys import modules
+
+from time import perf_counter
+
+from types import ModuleType
+
+from uitranscriber.ReplayTable import ReplayTable
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptDefinitions import CLICK
+from uitranscriber.ScriptDefinitions import PRESS
+from uitranscriber.ScriptDefinitions import WRITE
+from uitranscriber.ScriptDefinitions import scriptPreamble
+
+DEFAULT_COMMANDS: int = 100_000
+DEFAULT_REPEATS:  int = 3
+RANDOM_SEED:      int = 20260501
+
+
+def stubModules():
+
+    def doNothing(*args, **kwargs):
+        pass
+
+    pyautogui: ModuleType = ModuleType('pyautogui')
+    for name in (CLICK, WRITE, PRESS, 'hotkey'):
+        setattr(pyautogui, name, doNothing)
+
+    pyperclip: ModuleType = ModuleType('pyperclip')
+    pyperclip.copy = doNothing      # type: ignore[attr-defined]
+
+    modules['pyautogui'] = pyautogui
+    modules['pyperclip'] = pyperclip
+
+
+def recording(count: int) -> List[ScriptCommand]:
+
+    random:   Random              = Random(RANDOM_SEED)
+    commands: List[ScriptCommand] = []
+    for _ in range(count):
+        choice: int = random.randrange(3)
+        if choice == 0:
+            commands.append(ScriptCommand(name=CLICK, keywords=(('x', random.randrange(1920)), ('y', random.randrange(1080)))))
+        elif choice == 1:
+            commands.append(ScriptCommand(name=WRITE, arguments=(f'text {random.randrange(1000)}', )))
+        else:
+            commands.append(ScriptCommand(name=PRESS, arguments=(random.choice(['enter', 'tab', 'down']), ), keywords=(('presses', random.randrange(1, 4)), )))
+
+    return commands
+
+
+def timeScript(scriptText: str, repeats: int) -> Tuple[float, float]:
+    """
+    Returns:  The best compile time and the best time to run the compiled script, in seconds
+    """
+    bestCompile: float = float('inf')
+    bestRun:     float = float('inf')
+    for _ in range(repeats):
+        startTime: float = perf_counter()
+        code = compile(scriptText, '<benchmark>', 'exec')
+        compiled: float = perf_counter()
+        exec(code, {'__name__': '__benchmark__', '__file__': '<benchmark>'})
+        bestCompile = min(bestCompile, compiled - startTime)
+        bestRun     = min(bestRun, perf_counter() - compiled)
+
+    return bestCompile, bestRun
+
+
+def main():
+
+    parser: ArgumentParser = ArgumentParser(description='Time a statement script against a data table script')
+    parser.add_argument('--commands', type=int, default=DEFAULT_COMMANDS, help='Commands in the synthetic recording')
+    parser.add_argument('--repeats',  type=int, default=DEFAULT_REPEATS)
+
+    arguments: Namespace = parser.parse_args()
+    stubModules()
+
+    commands:        List[ScriptCommand] = recording(arguments.commands)
+    statementScript: str                 = ''.join(scriptPreamble(pause=0.0)) + ''.join(f'{command.toStatement()}\n' for command in commands)
+    tableScript:     str                 = ReplayTable.fromCommands(commands=commands, pause=0.0).toScript()
+
+    print(f'{arguments.commands} commands;  Best of {arguments.repeats}')
+    print(f'{"format":<12} {"compile":>9} {"run":>9} {"total":>9} {"per step":>10}')
+    for name, scriptText in (('statements', statementScript), ('table', tableScript)):
+        compileTime, runTime = timeScript(scriptText=scriptText, repeats=arguments.repeats)
+        print(f'{name:<12} {compileTime:>8.3f}s {runTime:>8.3f}s {compileTime + runTime:>8.3f}s {1e6 * (compileTime + runTime) / arguments.commands:>8.2f}us')
+
+
+if __name__ == '__main__':
+    main()
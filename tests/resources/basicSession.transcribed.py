@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# /// script
+# dependencies = ["pyautogui", "pyperclip"]
+# ///
+"""
+From the command line and if you have `uv` installed
+you can execute this script as follow:
+
+uv run transcribed.py
+"""
+
+from sys import platform
+from time import sleep
+
+import pyautogui
+from pyautogui import write
+from pyautogui import press
+from pyautogui import click
+from pyautogui import hotkey
+from pyperclip import copy
+
+
+pyautogui.PAUSE = 0.5
+
+
+def paste(text: str):
+    copy(text)
+    hotkey("command" if platform == "darwin" else "ctrl", "v")
+
+
+click(x=812, y=441)
+press('enter', presses=2)
+write("it's donex")
+click(x=100, y=200, button="right")
+write('unhandled')
+write('bye')
+press('down', presses=3)
+click(x=5, y=6)
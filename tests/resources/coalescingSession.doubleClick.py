@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# /// script
+# dependencies = ["pyautogui", "pyperclip"]
+# ///
+"""
+From the command line and if you have `uv` installed
+you can execute this script as follow:
+
+uv run transcribed.py
+"""
+
+from sys import platform
+from time import sleep
+
+import pyautogui
+from pyautogui import write
+from pyautogui import press
+from pyautogui import click
+from pyautogui import hotkey
+from pyperclip import copy
+
+
+pyautogui.PAUSE = 0.5
+
+
+def paste(text: str):
+    copy(text)
+    hotkey("command" if platform == "darwin" else "ctrl", "v")
+
+
+click(x=100, y=100, clicks=2)
+write('abcdefg')
+click(x=300, y=300)
+click(x=300, y=300)
+write('ok')
+press('enter', presses=2)
+click(x=50, y=60, clicks=2, button="right")
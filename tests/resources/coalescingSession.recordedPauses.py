@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# /// script
+# dependencies = ["pyautogui", "pyperclip"]
+# ///
+"""
+From the command line and if you have `uv` installed
+you can execute this script as follow:
+
+uv run transcribed.py
+"""
+
+from sys import platform
+from time import sleep
+
+import pyautogui
+from pyautogui import write
+from pyautogui import press
+from pyautogui import click
+from pyautogui import hotkey
+from pyperclip import copy
+
+
+pyautogui.PAUSE = 0.5
+
+
+def paste(text: str):
+    copy(text)
+    hotkey("command" if platform == "darwin" else "ctrl", "v")
+
+
+click(x=100, y=100)
+click(x=101, y=100)
+write('abcdefg')
+click(x=300, y=300)
+sleep(1.25)
+click(x=300, y=300)
+press('enter', presses=2)
+sleep(1.7)
+write('ok')
+click(x=50, y=60, button="right")
+click(x=50, y=60, button="right")
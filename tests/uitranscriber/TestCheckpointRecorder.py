@@ -0,0 +1,199 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from random import Random
+
+from tempfile import TemporaryDirectory
+
+from threading import Event
+from threading import Lock
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.CheckpointRecorder import CAPTURE_TIMING
+from uitranscriber.CheckpointRecorder import HASH_HEIGHT
+from uitranscriber.CheckpointRecorder import HASH_WIDTH
+from uitranscriber.CheckpointRecorder import CheckpointRecorder
+
+WAIT_TIMEOUT: float = 5.0
+RANDOM_SEED:  int   = 20260501
+
+
+class SyntheticImage:
+    """
+    Stands in for a Pillow image;  Its 9x8 thumbnail is given, so its difference hash is known
+    """
+    def __init__(self, thumbnail: bytes, onSaved=None, saveGate: Event = None):
+
+        self._thumbnail: bytes = thumbnail
+        self._onSaved          = onSaved
+        self._saveGate:  Event = saveGate
+
+    def convert(self, mode: str) -> 'SyntheticImage':
+        return self
+
+    def resize(self, size) -> 'SyntheticImage':
+        return self
+
+    def tobytes(self) -> bytes:
+        return self._thumbnail
+
+    def save(self, imagePath: Path, format: str = '', optimize: bool = False):
+
+        if self._saveGate is not None:
+            self._saveGate.wait(WAIT_TIMEOUT)
+        Path(imagePath).write_bytes(self._thumbnail)
+        if self._onSaved is not None:
+            self._onSaved()
+
+
+class SyntheticScreen:
+    """
+    Each capture returns the next frame;  Distinct frames differ in about half of their hash bits
+    """
+    def __init__(self, frames: List[bytes], captureGate: Event = None, saveGate: Event = None):
+
+        self._frames:      List[bytes] = frames
+        self._captureGate: Event       = captureGate
+        self._saveGate:    Event       = saveGate
+        self._lock:        Lock        = Lock()
+
+        self.captureStarted: Event = Event()
+        self.captures:       int   = 0
+        self.heldImages:     int   = 0
+        self.mostHeld:       int   = 0
+
+    def capture(self) -> SyntheticImage:
+
+        self.captureStarted.set()
+        if self._captureGate is not None:
+            self._captureGate.wait(WAIT_TIMEOUT)
+
+        with self._lock:
+            frame: bytes = self._frames[self.captures % len(self._frames)]
+            self.captures   += 1
+            self.heldImages += 1
+            self.mostHeld    = max(self.mostHeld, self.heldImages)
+
+        return SyntheticImage(thumbnail=frame, onSaved=self._released, saveGate=self._saveGate)
+
+    def _released(self):
+        with self._lock:
+            self.heldImages -= 1
+
+
+def randomFrames(count: int) -> List[bytes]:
+
+    random: Random = Random(RANDOM_SEED)
+
+    return [bytes(random.randrange(256) for _ in range(HASH_WIDTH * HASH_HEIGHT)) for _ in range(count)]
+
+
+class TestCheckpointRecorder(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._directory: TemporaryDirectory = TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self._directory.cleanup()
+
+    def testManifest(self):
+
+        screen:   SyntheticScreen    = SyntheticScreen(frames=randomFrames(3))
+        recorder: CheckpointRecorder = CheckpointRecorder(directory=self._directory.name, capture=screen.capture)
+        for commandIndex in (0, 4, 9):
+            recorder.checkpoint(commandIndex)
+
+        manifest: Dict[str, Any] = jsonLoads(recorder.stop().read_text())
+
+        self.assertEqual(CAPTURE_TIMING, manifest['captureTiming'])
+        self.assertEqual(0, manifest['dropped'])
+        self.assertEqual([0, 4, 9], [checkpoint['command'] for checkpoint in manifest['checkpoints']])
+        self.assertEqual(['000000.png', '000004.png', '000009.png'], [checkpoint['image'] for checkpoint in manifest['checkpoints']])
+        for checkpoint in manifest['checkpoints']:
+            self.assertTrue((Path(self._directory.name) / checkpoint['image']).exists())
+            self.assertGreaterEqual(checkpoint['captureDelay'], 0.0)
+
+    def testDuplicateFramesShareAnImage(self):
+        """
+        The third frame differs from the first in one hash bit, within the default distance
+        """
+        first:     bytes = randomFrames(1)[0]
+        nearFirst: bytes = bytes([first[0] ^ 0xFF]) + first[1:]
+        frames:    List[bytes] = [first, randomFrames(2)[1], nearFirst]
+
+        recorder: CheckpointRecorder = CheckpointRecorder(directory=self._directory.name, capture=SyntheticScreen(frames=frames).capture)
+        self.assertLessEqual(bin(recorder.differenceHash(SyntheticImage(first)) ^ recorder.differenceHash(SyntheticImage(nearFirst))).count('1'), 4)
+        for commandIndex in range(3):
+            recorder.checkpoint(commandIndex)
+
+        checkpoints: List[Dict[str, Any]] = jsonLoads(recorder.stop().read_text())['checkpoints']
+
+        self.assertEqual([False, False, True], [checkpoint['duplicate'] for checkpoint in checkpoints])
+        self.assertEqual('000000.png', checkpoints[2]['image'])
+        self.assertEqual(2, len(list(Path(self._directory.name).glob('*.png'))))
+
+    def testDropsWhenTheQueueIsFull(self):
+        """
+        While capture is stuck on the first request, the queue takes two more and drops the rest
+        """
+        captureGate: Event              = Event()
+        screen:      SyntheticScreen    = SyntheticScreen(frames=randomFrames(8), captureGate=captureGate)
+        recorder:    CheckpointRecorder = CheckpointRecorder(directory=self._directory.name, capture=screen.capture, queueSize=2)
+
+        recorder.checkpoint(0)
+        self.assertTrue(screen.captureStarted.wait(WAIT_TIMEOUT))
+        for commandIndex in range(1, 6):
+            recorder.checkpoint(commandIndex)
+        self.assertEqual(3, recorder.dropped)
+
+        captureGate.set()
+        manifest: Dict[str, Any] = jsonLoads(recorder.stop().read_text())
+
+        self.assertEqual(3, manifest['dropped'])
+        self.assertEqual([0, 1, 2], [checkpoint['command'] for checkpoint in manifest['checkpoints']])
+
+    def testPendingImagesAreBounded(self):
+        """
+        With encoding stalled, capture holds at most the pending images plus the one waiting for a slot
+        """
+        saveGate: Event              = Event()
+        screen:   SyntheticScreen    = SyntheticScreen(frames=randomFrames(8), saveGate=saveGate)
+        recorder: CheckpointRecorder = CheckpointRecorder(directory=self._directory.name, capture=screen.capture, pendingImages=2, encoders=2)
+
+        for commandIndex in range(8):
+            recorder.checkpoint(commandIndex)
+        saveGate.wait(0.2)
+        self.assertLessEqual(screen.heldImages, 3)
+
+        saveGate.set()
+        recorder.stop()
+
+        self.assertLessEqual(screen.mostHeld, 3)
+        self.assertEqual(0, screen.heldImages)
+        self.assertEqual(8, screen.captures)
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestCheckpointRecorder))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
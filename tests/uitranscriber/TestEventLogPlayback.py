@@ -0,0 +1,83 @@
+
+from typing import List
+
+from pathlib import Path
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.EventLog import EventLog
+from uitranscriber.EventLogBackend import EventLogBackend
+from uitranscriber.InputMonitor import InputMonitor
+
+BASIC_SESSION_EVENTS: str = 'basicSession.events.jsonl'
+BASIC_SESSION_SCRIPT: str = 'basicSession.transcribed.py'
+
+
+class TestEventLogPlayback(UnitTestBase):
+    """
+    Golden file tests;  A raw event recording played through the InputMonitor must
+    transcribe to the same script the live listeners produced
+    """
+    def testBasicSession(self):
+        """
+        Clicks, typed text with a quote, repeated and unhandled special keys, and a right click
+        """
+        eventsFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(UnitTestBase.RESOURCES_PACKAGE_NAME, BASIC_SESSION_EVENTS)
+        scriptFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(UnitTestBase.RESOURCES_PACKAGE_NAME, BASIC_SESSION_SCRIPT)
+
+        lines:   List[str]       = []
+        backend: EventLogBackend = EventLogBackend.fromFile(eventsFileName)
+        monitor: InputMonitor    = InputMonitor(reportCB=lines.append, backend=backend)
+
+        monitor.recording = True
+        backend.play()
+        monitor.flush()
+
+        self.assertEqual(Path(scriptFileName).read_text(), ''.join(lines))
+
+    def testNotRecordingIgnoresEvents(self):
+
+        eventsFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(UnitTestBase.RESOURCES_PACKAGE_NAME, BASIC_SESSION_EVENTS)
+
+        lines:   List[str]       = []
+        backend: EventLogBackend = EventLogBackend.fromFile(eventsFileName)
+        monitor: InputMonitor    = InputMonitor(reportCB=lines.append, backend=backend)
+        preamble: int            = len(lines)
+
+        monitor.keepRawEvents = True
+        backend.play()
+        monitor.flush()
+
+        self.assertEqual(preamble, len(lines))
+        self.assertEqual(0, len(monitor.rawEvents))
+
+    def testRawEventsKeptOnlyWhenAsked(self):
+
+        eventsFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(UnitTestBase.RESOURCES_PACKAGE_NAME, BASIC_SESSION_EVENTS)
+
+        backend: EventLogBackend = EventLogBackend.fromFile(eventsFileName)
+        monitor: InputMonitor    = InputMonitor(reportCB=lambda line: None, backend=backend)
+
+        monitor.recording = True
+        backend.play()
+        self.assertEqual(0, len(monitor.rawEvents))
+
+        monitor.keepRawEvents = True
+        backend.play()
+        self.assertEqual(EventLog.load(eventsFileName), monitor.rawEvents)
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestEventLogPlayback))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
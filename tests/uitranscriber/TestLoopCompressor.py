@@ -0,0 +1,82 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.LoopCompressor import LoopCompressor
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptParser import ScriptParser
+
+
+def click(x: int, y: int) -> ScriptCommand:
+    return ScriptCommand(name='click', keywords=(('x', x), ('y', y)))
+
+
+def press(keys: str) -> ScriptCommand:
+    return ScriptCommand(name='press', arguments=(keys, ), keywords=(('presses', 1), ))
+
+
+class TestLoopCompressor(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._compressor: LoopCompressor = LoopCompressor()
+
+    def testDistinctClicksStayLonghand(self):
+
+        commands: List[ScriptCommand] = [click(x=10, y=10), click(x=20, y=10), click(x=30, y=10)]
+        lines:    List[str]           = self._compressor.compress(commands)
+
+        self.assertEqual(3, len(lines), 'A lifted loop over three clicks is longer than the clicks')
+
+    def testNeverLongerThanTheCommands(self):
+
+        for count in range(1, 12):
+            commands: List[ScriptCommand] = [click(x=index, y=index * 2) for index in range(count)]
+            self.assertLessEqual(len(self._compressor.compress(commands)), count, f'{count} clicks')
+
+    def testExactRepetitionBecomesRangeLoop(self):
+
+        commands: List[ScriptCommand] = [press('down')] * 10
+        lines:    List[str]           = self._compressor.compress(commands)
+
+        self.assertEqual(2, len(lines))
+        self.assertTrue(lines[0].startswith('for _ in range(10):'))
+
+    def testExactRepetitionInsideShapeRun(self):
+        """
+        The tab and enter presses share a shape with the downs;  The downs alone are the loop that pays
+        """
+        commands: List[ScriptCommand] = [press('tab'), press('enter')] + [press('down')] * 10
+        lines:    List[str]           = self._compressor.compress(commands)
+
+        self.assertIn('for _ in range(10):', ''.join(lines))
+        self.assertEqual(commands, ScriptParser().parse(''.join(lines)))
+
+    def testLiftedLoopUsesShortestPeriod(self):
+
+        commands: List[ScriptCommand] = []
+        for row in range(40):
+            commands.extend([click(x=100, y=200 + row), press('tab'), press('enter')])
+
+        lines: List[str] = self._compressor.compress(commands)
+
+        self.assertEqual(commands, ScriptParser().parse(''.join(lines)))
+        self.assertEqual(40 + 3 + 2, len(lines), 'Header, one row per repetition, closing bracket and a three command body')
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestLoopCompressor))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,80 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from shutil import copyfile
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.ReTranscriber import STATISTICS_FILE_NAME
+from uitranscriber.ReTranscriber import ReTranscriber
+from uitranscriber.TranscriptionSettings import PAUSE_POLICY_RECORDED
+from uitranscriber.TranscriptionSettings import TranscriptionSettings
+
+RECORDINGS: List[str] = ['basicSession', 'coalescingSession']
+
+
+class TestReTranscriber(UnitTestBase):
+    """
+    Re-transcribes the golden recordings through the process pool
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._directory: TemporaryDirectory = TemporaryDirectory()
+        self._input:     Path               = Path(self._directory.name) / 'recordings'
+        self._output:    Path               = Path(self._directory.name) / 'scripts'
+
+        self._input.mkdir()
+        for recording in RECORDINGS:
+            eventsName: str = f'{recording}.events.jsonl'
+            copyfile(UnitTestBase.getFullyQualifiedResourceFileName(UnitTestBase.RESOURCES_PACKAGE_NAME, eventsName), self._input / eventsName)
+
+    def tearDown(self):
+        super().tearDown()
+        self._directory.cleanup()
+
+    def testScriptsMatchGoldenFiles(self):
+
+        settings: TranscriptionSettings = TranscriptionSettings(pausePolicy=PAUSE_POLICY_RECORDED, minimumGap=1.0)
+
+        ReTranscriber(settings=settings, workers=2).retranscribe(inputDirectory=str(self._input), outputDirectory=str(self._output))
+
+        golden: str = UnitTestBase.getFullyQualifiedResourceFileName(UnitTestBase.RESOURCES_PACKAGE_NAME, 'coalescingSession.recordedPauses.py')
+        self.assertEqual(Path(golden).read_text(), (self._output / 'coalescingSession.py').read_text())
+
+    def testStatistics(self):
+
+        statistics: List[Dict[str, Any]] = ReTranscriber(settings=TranscriptionSettings(), workers=2).retranscribe(inputDirectory=str(self._input), outputDirectory=str(self._output))
+
+        self.assertEqual(statistics, jsonLoads((self._output / STATISTICS_FILE_NAME).read_text()))
+        self.assertEqual([str(self._input / f'{recording}.events.jsonl') for recording in RECORDINGS], [entry['recording'] for entry in statistics])
+
+        basicSession: Dict[str, Any] = statistics[0]
+        self.assertEqual(26,  basicSession['events'])
+        self.assertEqual(2.5, basicSession['duration'])
+        self.assertEqual(8,   basicSession['commands'])
+        self.assertEqual({'click': 3, 'press': 2, 'write': 3}, basicSession['commandCounts'])
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestReTranscriber))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,126 @@
+
+from typing import List
+
+from random import Random
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.RecordingDiff import CHANGE_INSERTED
+from uitranscriber.RecordingDiff import CHANGE_MOVED
+from uitranscriber.RecordingDiff import CHANGE_REMOVED
+from uitranscriber.RecordingDiff import Change
+from uitranscriber.RecordingDiff import Match
+from uitranscriber.RecordingDiff import RecordingDiff
+from uitranscriber.ScriptCommand import ScriptCommand
+
+LCS_CASES:      int = 500
+LCS_MAX_LENGTH: int = 40
+RANDOM_SEED:    int = 20260501
+
+
+def click(x: int, y: int) -> ScriptCommand:
+    return ScriptCommand(name='click', keywords=(('x', x), ('y', y)))
+
+
+def press(key: str) -> ScriptCommand:
+    return ScriptCommand(name='press', arguments=(key, ))
+
+
+def longestCommonSubsequence(old: List[ScriptCommand], new: List[ScriptCommand]) -> int:
+    """
+    The quadratic dynamic program the Myers alignment must agree with
+    """
+    previous: List[int] = [0] * (len(new) + 1)
+    for oldCommand in old:
+        current: List[int] = [0] * (len(new) + 1)
+        for idx, newCommand in enumerate(new):
+            current[idx + 1] = previous[idx] + 1 if oldCommand == newCommand else max(previous[idx + 1], current[idx])
+        previous = current
+
+    return previous[-1]
+
+
+class TestRecordingDiff(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._steps: List[ScriptCommand] = [click(x=10 * idx, y=20) for idx in range(6)] + [press('enter'), press('tab')]
+
+    def testAlignmentMatchesLongestCommonSubsequence(self):
+
+        random:   Random              = Random(RANDOM_SEED)
+        alphabet: List[ScriptCommand] = [press(key) for key in 'abcd'] + [click(x=1, y=1)]
+        for _ in range(LCS_CASES):
+            old: List[ScriptCommand] = [random.choice(alphabet) for _ in range(random.randrange(LCS_MAX_LENGTH))]
+            new: List[ScriptCommand] = [random.choice(alphabet) for _ in range(random.randrange(LCS_MAX_LENGTH))]
+
+            recordingDiff: RecordingDiff = RecordingDiff(coordinateTolerance=0, timeTolerance=0.0)
+            recordingDiff.diff(oldCommands=old, newCommands=new)
+            matches: List[Match] = recordingDiff._align()
+
+            self.assertEqual(longestCommonSubsequence(old, new), len(matches), f'{old} -> {new}')
+            for (oldIndex, newIndex), (nextOld, nextNew) in zip(matches, matches[1:]):
+                self.assertTrue(nextOld > oldIndex and nextNew > newIndex, 'Matches must be increasing in both recordings')
+            for oldIndex, newIndex in matches:
+                self.assertEqual(old[oldIndex], new[newIndex])
+
+    def testJitterIsNotAChange(self):
+
+        jittered: List[ScriptCommand] = [click(x=command.keyword('x') + 2, y=command.keyword('y') - 1) if command.name == 'click' else command for command in self._steps]
+        shifted:  List[ScriptCommand] = [click(x=3, y=20)] + self._steps[1:]
+
+        self.assertEqual([], RecordingDiff().diff(oldCommands=self._steps, newCommands=jittered))
+        self.assertEqual(
+            [Change(kind=CHANGE_REMOVED, oldStart=0, oldEnd=1, newStart=-1, newEnd=-1), Change(kind=CHANGE_INSERTED, oldStart=-1, oldEnd=-1, newStart=0, newEnd=1)],
+            RecordingDiff(coordinateTolerance=2).diff(oldCommands=self._steps, newCommands=shifted)
+        )
+
+    def testSleepTolerance(self):
+
+        old: List[ScriptCommand] = [ScriptCommand(name='sleep', arguments=(1.0, ))]
+        new: List[ScriptCommand] = [ScriptCommand(name='sleep', arguments=(1.2, ))]
+
+        self.assertEqual([], RecordingDiff(timeTolerance=0.25).diff(oldCommands=old, newCommands=new))
+        self.assertEqual(2,  len(RecordingDiff(timeTolerance=0.1).diff(oldCommands=old, newCommands=new)))
+
+    def testInsert(self):
+
+        new: List[ScriptCommand] = self._steps[:3] + [press('f1'), press('f2')] + self._steps[3:]
+
+        self.assertEqual([Change(kind=CHANGE_INSERTED, oldStart=-1, oldEnd=-1, newStart=3, newEnd=5)], RecordingDiff().diff(oldCommands=self._steps, newCommands=new))
+
+    def testMove(self):
+        """
+        The two key presses move from the end to the front
+        """
+        new: List[ScriptCommand] = self._steps[6:] + self._steps[:6]
+
+        changes: List[Change] = RecordingDiff().diff(oldCommands=self._steps, newCommands=new)
+
+        self.assertEqual([Change(kind=CHANGE_MOVED, oldStart=6, oldEnd=8, newStart=0, newEnd=2)], changes)
+
+    def testShortRunIsNotAMove(self):
+
+        new: List[ScriptCommand] = self._steps[7:] + self._steps[:7]
+
+        kinds: List[str] = [change.kind for change in RecordingDiff().diff(oldCommands=self._steps, newCommands=new)]
+
+        self.assertEqual(sorted([CHANGE_INSERTED, CHANGE_REMOVED]), sorted(kinds))
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestRecordingDiff))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
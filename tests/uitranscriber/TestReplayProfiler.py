@@ -0,0 +1,85 @@
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+from time import sleep
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.ReplayProfiler import ReplayProfiler
+from uitranscriber.ReplayProfiler import StepTiming
+from uitranscriber.ReplayRuntime import ReplayRuntime
+from uitranscriber.ReplayTable import ReplayTable
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptDefinitions import CLICK
+from uitranscriber.ScriptDefinitions import SLEEP
+
+CLICK_TIME: float = 0.03
+SLEEP_TIME: float = 0.02
+PAUSE_TIME: float = 0.01
+
+
+class StubReplayRuntime(ReplayRuntime):
+    """
+    Replays through functions that only take time
+    """
+    def _loadBackend(self, backend: str) -> Dict[str, Callable[..., Any]]:
+
+        def click(**keywords):
+            sleep(CLICK_TIME)
+
+        return {CLICK: click, SLEEP: sleep}
+
+
+class TestReplayProfiler(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        commands: List[ScriptCommand] = [
+            ScriptCommand(name=CLICK, keywords=(('x', 10), ('y', 20))),
+            ScriptCommand(name=SLEEP, arguments=(SLEEP_TIME, )),
+        ]
+        self._profiler: ReplayProfiler = ReplayProfiler(StubReplayRuntime(ReplayTable.fromCommands(commands, pause=PAUSE_TIME)))
+
+    def testActionAndPauseMakeUpWallTime(self):
+
+        for timing in self._profiler.run():
+            self.assertAlmostEqual(timing.wallTime, timing.actionTime + timing.pauseTime, places=6)
+
+        totals: Dict[str, float] = self._profiler.totals()
+        self.assertAlmostEqual(totals['wallTime'], totals['actionTime'] + totals['pauseTime'], places=6)
+
+    def testClickIsActionThenPause(self):
+
+        click: StepTiming = self._profiler.run()[0]
+
+        self.assertGreaterEqual(click.actionTime, CLICK_TIME)
+        self.assertGreaterEqual(click.pauseTime,  PAUSE_TIME)
+        self.assertLess(click.pauseTime, CLICK_TIME, 'The click itself is not pause time')
+
+    def testSleepIsAllPause(self):
+
+        sleepStep: StepTiming = self._profiler.run()[1]
+
+        self.assertEqual(0.0, sleepStep.actionTime)
+        self.assertGreaterEqual(sleepStep.pauseTime, SLEEP_TIME + PAUSE_TIME)
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestReplayProfiler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,87 @@
+
+from typing import List
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.ReplayTable import ReplayTable
+from uitranscriber.ScriptCommand import ScriptCommand
+
+
+class TestReplayTable(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._commands: List[ScriptCommand] = [
+            ScriptCommand(name='click', keywords=(('x', 10), ('y', 20))),
+            ScriptCommand(name='write', arguments=('hello', )),
+            ScriptCommand(name='press', arguments=('enter', ), keywords=(('presses', 2), )),
+        ]
+        self._table:     ReplayTable        = ReplayTable.fromCommands(self._commands, pause=0.2)
+        self._directory: TemporaryDirectory = TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self._directory.cleanup()
+
+    def testEmbeddedTableScript(self):
+
+        scriptPath: Path = Path(self._directory.name) / 'table.py'
+        scriptPath.write_text(self._table.toScript())
+
+        table: ReplayTable = ReplayTable.fromFile(str(scriptPath))
+
+        self.assertEqual(self._commands, table.toCommands())
+        self.assertEqual(0.2, table.pause)
+
+    def testSidecarTableScript(self):
+
+        scriptPath: Path = Path(self._directory.name) / 'sidecar.py'
+        self._table.save(str(scriptPath.with_name('sidecar.steps.json')))
+        scriptPath.write_text(self._table.toScript(sidecarFileName='sidecar.steps.json'))
+
+        table: ReplayTable = ReplayTable.fromFile(str(scriptPath))
+
+        self.assertEqual(self._commands, table.toCommands())
+
+    def testTranscribedScript(self):
+
+        scriptPath: Path = Path(self._directory.name) / 'transcribed.py'
+        scriptPath.write_text(''.join(f'{command.toStatement()}\n' for command in self._commands))
+
+        self.assertEqual(self._commands, ReplayTable.fromFile(str(scriptPath)).toCommands())
+
+    def testTranscribedScriptPause(self):
+
+        scriptPath: Path = Path(self._directory.name) / 'paused.py'
+        scriptPath.write_text('import pyautogui\n\npyautogui.PAUSE = 0.1\n\n' + ''.join(f'{command.toStatement()}\n' for command in self._commands))
+
+        self.assertEqual(0.1, ReplayTable.fromFile(str(scriptPath)).pause)
+
+    def testNoStepsIsAnError(self):
+
+        scriptPath: Path = Path(self._directory.name) / 'empty.py'
+        scriptPath.write_text('import pyautogui\n')
+
+        self.assertRaises(ValueError, lambda: ReplayTable.fromFile(str(scriptPath)))
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestReplayTable))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
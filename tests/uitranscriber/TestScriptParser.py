@@ -0,0 +1,85 @@
+
+from typing import List
+from typing import Optional
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptDefinitions import scriptPreamble
+from uitranscriber.ScriptParser import ScriptParser
+
+
+class AstScriptParser(ScriptParser):
+    """
+    Never takes the fast path
+    """
+    def _parseFlat(self, scriptText: str) -> Optional[List[ScriptCommand]]:
+        return None
+
+
+class TestScriptParser(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._commands: List[ScriptCommand] = [
+            ScriptCommand(name='click',  keywords=(('x', 812), ('y', 441))),
+            ScriptCommand(name='write',  arguments=("it's (done), \"ok\"\\",)),
+            ScriptCommand(name='write',  arguments=('tab\there é',)),
+            ScriptCommand(name='press',  arguments=('enter',), keywords=(('presses', 2),)),
+            ScriptCommand(name='sleep',  arguments=(1.25,)),
+            ScriptCommand(name='click',  keywords=(('x', -3), ('y', 0), ('button', 'right'))),
+            ScriptCommand(name='hotkey', arguments=('ctrl', 'v', True, None, 1e-07)),
+        ]
+        self._script: str = ''.join(scriptPreamble(pause=0.1)) + ''.join(f'{command.toStatement()}\n' for command in self._commands)
+
+    def testFlatScriptMatchesAst(self):
+
+        scriptParser: ScriptParser        = ScriptParser()
+        commands:     List[ScriptCommand] = scriptParser.parse(self._script)
+        expected:     List[ScriptCommand] = AstScriptParser().parse(self._script)
+
+        self.assertEqual(self._commands, commands)
+        self.assertEqual(expected, commands)
+        self.assertEqual([command.lineNumber for command in expected], [command.lineNumber for command in commands])
+        self.assertEqual(0.1, scriptParser.pause)
+
+    def testLoopFallsBackToAst(self):
+
+        script: str = self._script + 'for _ in range(2):\n    press(\'down\')\nclick(x=1, y=2)\n'
+
+        commands: List[ScriptCommand] = ScriptParser().parse(script)
+
+        self.assertEqual(self._commands + [ScriptCommand(name='press', arguments=('down',))] * 2 + [ScriptCommand(name='click', keywords=(('x', 1), ('y', 2)))], commands)
+
+    def testNonLiteralArgumentFallsBackToAst(self):
+
+        script: str = self._script + 'click(x=width, y=2)\n'
+
+        self.assertEqual(self._commands, ScriptParser().parse(script))
+
+    def testParseStatement(self):
+
+        scriptParser: ScriptParser = ScriptParser()
+        for command in self._commands:
+            self.assertEqual(command, scriptParser.parseStatement(f'{command.toStatement()}\n', lineNumber=7))
+
+        self.assertEqual(7, scriptParser.parseStatement('click(x=1, y=2)', lineNumber=7).lineNumber)
+        self.assertIsNone(scriptParser.parseStatement('pyautogui.PAUSE = 0.5'))
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestScriptParser))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,101 @@
+
+from typing import List
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.LoopCompressor import LoopCompressor
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.ScriptDefinitions import SCRIPT_PREAMBLE
+from uitranscriber.ScriptParser import ScriptParser
+from uitranscriber.SegmentStore import SegmentStore
+
+BASIC_SESSION_SCRIPT: str = 'basicSession.transcribed.py'
+
+
+class TestSegmentStore(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._commands: List[ScriptCommand] = (
+            [ScriptCommand(name='press', arguments=('down',))] * 10
+            + [ScriptCommand(name='click', keywords=(('x', 10 * idx), ('y', 20))) for idx in range(12)]
+            + [ScriptCommand(name='write', arguments=('done',))]
+        )
+        self._directory: TemporaryDirectory = TemporaryDirectory()
+        self._store:     SegmentStore       = SegmentStore(self._directory.name, minimumSegment=2, averageSegment=2)
+
+    def tearDown(self):
+        super().tearDown()
+        self._directory.cleanup()
+
+    def testFlatScriptRoundTrip(self):
+
+        scriptText: str = ''.join(SCRIPT_PREAMBLE) + ''.join(f'{command.toStatement()}\n' for command in self._commands)
+
+        hashes: List[str] = self._store.add(name='flat', scriptText=scriptText)
+
+        self.assertEqual(scriptText, self._store.script('flat'))
+        self.assertGreater(len(hashes), 2, 'The commands should span several segments')
+
+    def testRecordedScriptRoundTrip(self):
+        """
+        Keeps the recorder's own quoting;  `button="right"` must not come back as `button='right'`
+        """
+        scriptFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(UnitTestBase.RESOURCES_PACKAGE_NAME, BASIC_SESSION_SCRIPT)
+        scriptText:     str = Path(scriptFileName).read_text()
+
+        self._store.addFile(scriptFileName)
+
+        self.assertEqual(scriptText, self._store.script(Path(scriptFileName).stem))
+
+    def testCommentsRoundTrip(self):
+
+        scriptText: str = (
+            ''.join(SCRIPT_PREAMBLE)
+            + '# Log in\n'
+            + 'click(x=10, y=20)\n'
+            + 'write("user")  # the test account\n'
+            + '\n'
+            + '# Open the report\n'
+            + 'click(x=30, y=40)\n'
+            + 'press(\'enter\')'
+        )
+
+        self._store.add(name='commented', scriptText=scriptText)
+
+        self.assertEqual(scriptText, self._store.script('commented'))
+
+    def testCompressedScriptRoundTrip(self):
+
+        compressed: List[str] = LoopCompressor().compress(self._commands)
+        self.assertTrue(compressed[0].startswith('for '), 'The script should start with a loop')
+
+        scriptText: str = ''.join(SCRIPT_PREAMBLE) + ''.join(compressed)
+
+        self._store.add(name='compressed', scriptText=scriptText)
+
+        self.assertEqual(scriptText, self._store.script('compressed'))
+        self.assertEqual(self._commands, ScriptParser().parse(self._store.script('compressed')))
+        self.assertEqual(len(scriptText.encode()), self._store.statistics()['logicalBytes'], 'Loops are stored as written, not unrolled')
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestSegmentStore))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,115 @@
+
+from typing import Callable
+from typing import Tuple
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.FrameSource import FrameSource
+from uitranscriber.FrameSource import Region
+from uitranscriber.StabilityWaiter import StabilityWaiter
+
+FRAME_SIZE: int = 100 * 100
+
+#
+# Seconds since the wait started -> the frame on screen
+#
+Screen = Callable[[float], bytes]
+
+
+class SyntheticClock:
+    """
+    Time only moves when the waiter sleeps
+    """
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+class SyntheticFrameSource(FrameSource):
+
+    def __init__(self, clock: SyntheticClock, screen: Screen):
+
+        self._clock:  SyntheticClock = clock
+        self._screen: Screen         = screen
+
+    def screenSize(self) -> Tuple[int, int]:
+        return 1920, 1080
+
+    def grab(self, region: Region) -> bytes:
+        return self._screen(self._clock())
+
+
+def frame(shade: int, blinkingPixel: int = 0) -> bytes:
+
+    pixels: bytearray = bytearray([shade]) * FRAME_SIZE
+    pixels[0] = blinkingPixel
+
+    return bytes(pixels)
+
+
+class TestStabilityWaiter(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._clock: SyntheticClock = SyntheticClock()
+
+    def testSettlesAfterChangesStop(self):
+        """
+        The screen animates for half a second then holds still
+        """
+        waiter: StabilityWaiter = self._waiter(screen=lambda now: frame(shade=int(now * 100) % 256 if now < 0.5 else 200))
+
+        self.assertTrue(waiter.waitForStability(x=500, y=500))
+        self.assertGreaterEqual(self._clock.now, 0.5 + 0.15)
+        self.assertLess(self._clock.now, 0.5 + 0.15 + 0.1, 'Should return soon after the settle time')
+
+    def testTimesOut(self):
+
+        waiter: StabilityWaiter = self._waiter(screen=lambda now: frame(shade=int(now * 100) % 256))
+
+        self.assertFalse(waiter.waitForStability())
+        self.assertGreaterEqual(self._clock.now, 5.0)
+        self.assertLess(self._clock.now, 5.1)
+
+    def testIgnoresOnePixelBlink(self):
+        """
+        A caret blinking on every capture is below the tolerance
+        """
+        waiter: StabilityWaiter = self._waiter(screen=lambda now: frame(shade=200, blinkingPixel=255 * (round(now / 0.03) % 2)))
+
+        self.assertTrue(waiter.waitForStability(x=10, y=10))
+        self.assertLess(self._clock.now, 0.15 + 0.1)
+
+    def testRegionStaysOnScreen(self):
+
+        waiter: StabilityWaiter = self._waiter(screen=lambda now: frame(shade=0))
+
+        self.assertEqual((0, 0, 400, 400), waiter.regionAround(x=10, y=10))
+        self.assertEqual((1520, 680, 400, 400), waiter.regionAround(x=1910, y=1070))
+        self.assertEqual((0, 0, 1920, 1080), waiter.regionAround())
+
+    def _waiter(self, screen: Screen) -> StabilityWaiter:
+
+        return StabilityWaiter(frameSource=SyntheticFrameSource(clock=self._clock, screen=screen), clock=self._clock, sleeper=self._clock.sleep)
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestStabilityWaiter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
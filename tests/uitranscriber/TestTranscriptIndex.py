@@ -0,0 +1,94 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.ScriptCommand import ScriptCommand
+from uitranscriber.TranscriptIndex import TranscriptIndex
+
+
+class TestTranscriptIndex(UnitTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        commands: List[ScriptCommand] = [
+            ScriptCommand(name='click', keywords=(('x', 812), ('y', 441))),     # 0 @ 0.0
+            ScriptCommand(name='press', arguments=('enter', )),                 # 1 @ 1.0
+            ScriptCommand(name='write', arguments=('hello big world', )),       # 2 @ 2.0
+            ScriptCommand(name='click', keywords=(('x', 830), ('y', 441))),     # 3 @ 3.0
+            ScriptCommand(name='press', arguments=('Enter', )),                 # 4 @ 4.0
+            ScriptCommand(name='write', arguments=('enter the world', )),       # 5 @ 5.0
+            ScriptCommand(name='press', arguments=('enter', )),                 # 6 @ 6.0
+            ScriptCommand(name='click', keywords=(('x', 1500), ('y', 900))),    # 7 @ 7.0
+        ]
+        self._index: TranscriptIndex = TranscriptIndex()
+        position: int = 0
+        for idx, command in enumerate(commands):
+            statement: str = command.toStatement()
+            self._index.add(command=command, position=position, length=len(statement), timeStamp=float(idx))
+            position += len(statement) + 1
+
+    def testClicksNearestFirst(self):
+
+        self.assertEqual([3, 0], self._index.search('825,440'))
+        self.assertEqual([0],    self._index.clicksNear(x=800, y=441, radius=20))
+        self.assertEqual([7],    self._index.search('1500 900'))
+
+    def testClicksAcrossGridCells(self):
+        """
+        The point is in the grid column left of the clicks;  The radius reaches 812 but not 830
+        """
+        self.assertEqual([0], self._index.clicksNear(x=760, y=441, radius=60))
+
+    def testTimeQueries(self):
+
+        self.assertEqual([3],       self._index.search('@2.5'))
+        self.assertEqual([2, 3, 4], self._index.search('@2-4'))
+        self.assertEqual([],        self._index.search('@9'))
+
+    def testKeyQueries(self):
+
+        self.assertEqual([1, 4, 6],    self._index.search('press enter'))
+        self.assertEqual([1, 4, 5, 6], self._index.search('key enter'))
+        self.assertEqual([0, 3, 7],    self._index.search('click'))
+        self.assertEqual([2, 5],       self._index.search('world'))
+        self.assertEqual([2],          self._index.search('big world'))
+
+    def testOccurrence(self):
+
+        query, occurrence = self._index.parseOccurrence('press enter #3')
+
+        self.assertEqual('press enter', query)
+        self.assertEqual(6, self._index.search(query)[occurrence])
+        self.assertEqual(('press enter', 0), self._index.parseOccurrence('press enter'))
+
+    def testNameFilter(self):
+
+        self.assertEqual([5],    self._index.search('key enter', name='write'))
+        self.assertEqual([2, 3], self._index.search('@2-4', name='write') + self._index.search('@2-4', name='click'))
+
+    def testClear(self):
+
+        self._index.clear()
+
+        self.assertEqual(0, len(self._index))
+        self.assertEqual([], self._index.search('click'))
+        self.assertEqual([], self._index.search('@0'))
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestTranscriptIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
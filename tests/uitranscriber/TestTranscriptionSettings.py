@@ -0,0 +1,90 @@
+
+from typing import List
+
+from pathlib import Path
+
+from unittest import TestSuite
+from unittest import TestLoader
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from uitranscriber.EventLogBackend import EventLogBackend
+from uitranscriber.InputMonitor import InputMonitor
+from uitranscriber.TranscriptionSettings import PAUSE_POLICY_RECORDED
+from uitranscriber.TranscriptionSettings import TranscriptionSettings
+
+COALESCING_SESSION_EVENTS: str = 'coalescingSession.events.jsonl'
+
+
+def transcribe(eventsFileName: str, settings: TranscriptionSettings) -> str:
+
+    lines:   List[str]       = []
+    backend: EventLogBackend = EventLogBackend.fromFile(eventsFileName)
+    monitor: InputMonitor    = InputMonitor(reportCB=lines.append, backend=backend, settings=settings)
+
+    monitor.recording = True
+    backend.play()
+    monitor.flush()
+
+    return ''.join(lines)
+
+
+class TestTranscriptionSettings(UnitTestBase):
+    """
+    Golden file tests for the coalescing settings;  The session has a double click, a
+    typed run, two clicks at one spot more than a second apart, repeated enters after
+    that idle gap, a second idle gap before more typing and a right double click
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._eventsFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(UnitTestBase.RESOURCES_PACKAGE_NAME, COALESCING_SESSION_EVENTS)
+
+    def testDoubleClickWindow(self):
+        """
+        Clicks within the window and the distance merge;  The clicks at 300,300 are too far apart in time
+        """
+        self._assertGolden(settings=TranscriptionSettings(doubleClickWindow=0.5), goldenName='coalescingSession.doubleClick.py')
+
+    def testDoubleClickDistance(self):
+
+        script: str = transcribe(eventsFileName=self._eventsFileName, settings=TranscriptionSettings(doubleClickWindow=0.5, doubleClickDistance=0))
+
+        self.assertIn('click(x=100, y=100)\nclick(x=101, y=100)\n', script)
+        self.assertIn('click(x=50, y=60, clicks=2, button="right")\n', script)
+
+    def testFlushThreshold(self):
+
+        self._assertGolden(settings=TranscriptionSettings(flushThreshold=3), goldenName='coalescingSession.flushThreshold.py')
+
+    def testRecordedPausePolicy(self):
+        """
+        Idle gaps of at least the minimum gap become sleeps;  What was buffered before the gap goes first
+        """
+        self._assertGolden(settings=TranscriptionSettings(pausePolicy=PAUSE_POLICY_RECORDED, minimumGap=1.0), goldenName='coalescingSession.recordedPauses.py')
+
+    def testMinimumGap(self):
+
+        script: str = transcribe(eventsFileName=self._eventsFileName, settings=TranscriptionSettings(pausePolicy=PAUSE_POLICY_RECORDED, minimumGap=1.5))
+
+        self.assertNotIn('sleep(1.25)', script)
+        self.assertIn('sleep(1.7)', script)
+
+    def _assertGolden(self, settings: TranscriptionSettings, goldenName: str):
+
+        goldenFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(UnitTestBase.RESOURCES_PACKAGE_NAME, goldenName)
+
+        self.assertEqual(Path(goldenFileName).read_text(), transcribe(eventsFileName=self._eventsFileName, settings=settings))
+
+
+def suite() -> TestSuite:
+
+    testSuite: TestSuite = TestSuite()
+    testSuite.addTests(TestLoader().loadTestsFromTestCase(TestTranscriptionSettings))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()